@@ -1,5 +1,10 @@
 # Azure DevOps MCP features package
-from mcp_azure_devops.features import projects, teams, work_items
+from mcp_azure_devops.features import (
+    conventions,
+    projects,
+    teams,
+    work_items,
+)
 
 
 def register_all(mcp):
@@ -9,6 +14,12 @@ def register_all(mcp):
     Args:
         mcp: The FastMCP server instance
     """
+    # Registering twice would only re-run every decorator and log warnings
+    if getattr(mcp, "_azure_devops_features_registered", False):
+        return
+    
     work_items.register(mcp)
     projects.register(mcp)
     teams.register(mcp)
+    conventions.register(mcp)
+    mcp._azure_devops_features_registered = True
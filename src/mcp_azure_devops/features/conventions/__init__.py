@@ -0,0 +1,12 @@
+# Conventions feature package for Azure DevOps MCP
+from mcp_azure_devops.features.conventions import tools
+
+
+def register(mcp):
+    """
+    Register all conventions components with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    tools.register_tools(mcp)
@@ -0,0 +1,274 @@
+"""
+Conventions tools for Azure DevOps.
+
+This module provides an MCP tool that gathers everything needed for a
+conventions file in a single call.
+"""
+import itertools
+from functools import partial
+from typing import Callable, Optional, TypeVar, Union
+
+from azure.devops.v7_1.core import CoreClient
+from azure.devops.v7_1.work import WorkClient
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+from mcp_azure_devops.features.teams.common import (
+    get_core_client,
+    get_work_client,
+)
+from mcp_azure_devops.features.teams.tools import (
+    _get_team_area_paths_impl,
+    _get_team_iterations_impl,
+)
+from mcp_azure_devops.features.work_items.common import get_work_item_client
+from mcp_azure_devops.features.work_items.formatting import iter_table
+from mcp_azure_devops.features.work_items.tools.process import (
+    _get_process_details_impl,
+)
+from mcp_azure_devops.features.work_items.tools.types import (
+    _fetch_type_fields,
+    _fetch_work_item_types,
+    _format_type_fields,
+    _process_id_for,
+)
+from mcp_azure_devops.utils.azure_client import (
+    get_work_item_tracking_process_client,
+)
+from mcp_azure_devops.utils.concurrency import run_concurrently
+
+T = TypeVar("T")
+
+
+class _SectionError(str):
+    """Error message standing in for a bundle request that failed."""
+
+
+def _reporting_errors(
+    label: str,
+    call: Callable[[], T]
+) -> Callable[[], Union[T, _SectionError]]:
+    """
+    Wrap a bundle request so a failure is returned instead of raised.
+    
+    Args:
+        label: What the request retrieves, used in the error message
+        call: The request to run
+        
+    Returns:
+        Callable returning the result of the request, or a _SectionError
+        describing why it failed
+    """
+    def run() -> Union[T, _SectionError]:
+        try:
+            return call()
+        except Exception as e:
+            return _SectionError(f"Error retrieving {label}: {str(e)}")
+    return run
+
+
+def _format_field_instances(type_name: str, fields) -> str:
+    """
+    Format the fields listed with a work item type as a markdown table.
+    
+    Args:
+        type_name: The name of the work item type
+        fields: Field instances of the work item type
+        
+    Returns:
+        Formatted string with one row per field
+    """
+    rows = (
+        f"| {field.name} | {field.reference_name} | "
+        f"{'Yes' if field.always_required else 'No'} |"
+        for field in fields
+    )
+    return "\n".join(itertools.chain(
+        (f"# Fields for Work Item Type: {type_name}", ""),
+        iter_table(["Name", "Reference Name", "Required"], rows)))
+
+
+def _get_conventions_bundle_impl(
+    core_client: CoreClient,
+    work_client: WorkClient,
+    wit_client: WorkItemTrackingClient,
+    process_client,
+    project: Optional[str] = None
+) -> str:
+    """
+    Implementation of conventions bundle retrieval.
+    
+    Requests are issued in two waves on the shared thread pool, which caps
+    how many are in flight: first the teams, process and work item types
+    of every project, then the area paths and iterations of every team
+    together with the details of every process. Type fields come with the
+    work item types, so they rarely need requests of their own. A request
+    that fails is reported as an error in its section while the rest of
+    the bundle is still built.
+    
+    Args:
+        core_client: Core client
+        work_client: Work client
+        wit_client: Work item tracking client
+        process_client: Work item tracking process client
+        project: Optional project name or ID to limit the bundle to
+            
+    Returns:
+        Formatted string containing projects, teams, classification
+        structure and work item configuration
+    """
+    try:
+        if project:
+            project_details = core_client.get_project(project)
+            projects = [project_details] if project_details else []
+        else:
+            projects = core_client.get_projects()
+        
+        if not projects:
+            return "No projects found."
+        
+        count = len(projects)
+        results = run_concurrently(
+            *(_reporting_errors(
+                f"teams of {p.name}", partial(core_client.get_teams, p.id))
+              for p in projects),
+            *(_reporting_errors(
+                f"process of {p.name}", partial(_process_id_for, p.name))
+              for p in projects),
+            *(_reporting_errors(
+                f"work item types of {p.name}",
+                partial(_fetch_work_item_types, wit_client, p.name))
+              for p in projects),
+        )
+        project_teams = results[:count]
+        process_ids = results[count:2 * count]
+        project_types = results[2 * count:]
+        
+        # Projects sharing a process share its types and fields
+        team_calls = [
+            (p.name, team.name)
+            for p, teams in zip(projects, project_teams)
+            if not isinstance(teams, _SectionError)
+            for team in teams or []
+        ]
+        process_types = {}
+        for process_id, wits in zip(process_ids, project_types):
+            if (not process_id or isinstance(process_id, _SectionError)
+                    or isinstance(wits, _SectionError)):
+                continue
+            for wit in wits or []:
+                process_types.setdefault((process_id, wit.name), wit)
+        
+        # Types are listed with their fields, so the process API is only
+        # asked about types returned without them
+        missing = [key for key, wit in process_types.items()
+                   if not wit.fields]
+        process_list = list(dict.fromkeys(
+            process_id for process_id in process_ids
+            if process_id and not isinstance(process_id, _SectionError)))
+        
+        results = run_concurrently(
+            *(_reporting_errors(
+                f"area paths of {p} / {t}",
+                partial(_get_team_area_paths_impl, work_client, p, t))
+              for p, t in team_calls),
+            *(_reporting_errors(
+                f"iterations of {p} / {t}",
+                partial(_get_team_iterations_impl, work_client, p, t))
+              for p, t in team_calls),
+            *(_reporting_errors(
+                f"process {process_id}",
+                partial(_get_process_details_impl, process_id,
+                        process_client))
+              for process_id in process_list),
+            *(_reporting_errors(
+                f"fields of {type_name}",
+                partial(_fetch_type_fields, process_client, process_id,
+                        process_types[process_id, type_name].reference_name))
+              for process_id, type_name in missing),
+        )
+        team_count = len(team_calls)
+        area_paths = results[:team_count]
+        iterations = results[team_count:2 * team_count]
+        process_details = results[2 * team_count:
+                                  2 * team_count + len(process_list)]
+        fetched_fields = dict(zip(
+            missing, results[2 * team_count + len(process_list):]))
+        
+        sections = ["# Azure DevOps Conventions Bundle", "## Projects"]
+        for p, teams, process_id in zip(projects, project_teams,
+                                        process_ids):
+            if isinstance(teams, _SectionError):
+                team_names = teams
+            else:
+                team_names = ", ".join(team.name for team in teams or [])
+            sections.append(
+                f"### {p.name}\nProcess ID: {process_id or 'N/A'}\n"
+                f"Teams: {team_names or 'None'}")
+        
+        sections.append("## Classification Structure")
+        for (p, t), areas, iteration in zip(team_calls, area_paths,
+                                            iterations):
+            sections.append(f"### {p} / {t}\n{areas}\n\n{iteration}")
+        
+        sections.append("## Processes")
+        sections.extend(process_details)
+        
+        sections.append("## Work Item Type Fields")
+        sections.extend(wits for wits in project_types
+                        if isinstance(wits, _SectionError))
+        for (process_id, type_name), wit in process_types.items():
+            fields = fetched_fields.get((process_id, type_name))
+            if wit.fields:
+                table = _format_field_instances(type_name, wit.fields)
+            elif isinstance(fields, _SectionError):
+                table = fields
+            elif fields:
+                table = _format_type_fields(type_name, fields)
+            else:
+                continue
+            sections.append(f"Process ID: {process_id}\n{table}")
+        
+        return "\n\n".join(sections)
+            
+    except Exception as e:
+        return f"Error retrieving conventions bundle: {str(e)}"
+
+
+def register_tools(mcp) -> None:
+    """
+    Register conventions tools with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    
+    @mcp.tool()
+    def get_conventions_bundle(project: Optional[str] = None) -> str:
+        """
+        Gathers the structure and work item configuration of projects.
+        
+        Use this tool when you need to:
+        - Write a conventions file for the organization
+        - Get teams, area paths and iterations of every project at once
+        - Compare processes, work item types and fields between projects
+        
+        Args:
+            project: Optional project name or ID. When omitted every
+                project in the organization is included.
+                
+        Returns:
+            Formatted string containing projects and their teams, each
+            team's area paths and iterations, process details, and the
+            fields of every work item type with required fields marked,
+            formatted as markdown
+        """
+        try:
+            return _get_conventions_bundle_impl(
+                get_core_client(),
+                get_work_client(),
+                get_work_item_client(),
+                get_work_item_tracking_process_client(),
+                project
+            )
+        except Exception as e:
+            return f"Error: {str(e)}"
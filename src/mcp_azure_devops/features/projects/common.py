@@ -5,7 +5,11 @@ This module provides shared functionality used by both tools and resources.
 """
 from azure.devops.v7_1.core import CoreClient
 
-from mcp_azure_devops.utils.azure_client import get_connection
+from mcp_azure_devops.utils.azure_client import (
+    configure_client,
+    get_connection,
+    memoize_client,
+)
 
 
 class AzureDevOpsClientError(Exception):
@@ -13,6 +17,7 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
+@memoize_client
 def get_core_client() -> CoreClient:
     """
     Get the core client for Azure DevOps.
@@ -38,4 +43,4 @@ def get_core_client() -> CoreClient:
     if core_client is None:
         raise AzureDevOpsClientError("Failed to get core client.")
     
-    return core_client
+    return configure_client(core_client)
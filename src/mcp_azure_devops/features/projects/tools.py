@@ -12,6 +12,20 @@ from mcp_azure_devops.features.projects.common import (
     AzureDevOpsClientError,
     get_core_client,
 )
+from mcp_azure_devops.utils.cache import ttl_cache
+from mcp_azure_devops.utils.serialization import (
+    OutputFormat,
+    models_to_json,
+)
+
+# Optional project attributes shown when set, with their labels
+_PROJECT_DETAIL_LABELS = (
+    ("description", "Description"),
+    ("state", "State"),
+    ("visibility", "Visibility"),
+    ("url", "URL"),
+    ("last_update_time", "Last Updated"),
+)
 
 
 def _format_project(project: TeamProjectReference) -> str:
@@ -25,36 +39,31 @@ def _format_project(project: TeamProjectReference) -> str:
         String with project details
     """
     # Basic information that should always be available
-    formatted_info = [f"# Project: {project.name}"]
-    formatted_info.append(f"ID: {project.id}")
-    
-    # Add description if available
-    if hasattr(project, "description") and project.description:
-        formatted_info.append(f"Description: {project.description}")
-    
-    # Add state if available
-    if hasattr(project, "state") and project.state:
-        formatted_info.append(f"State: {project.state}")
-    
-    # Add visibility if available
-    if hasattr(project, "visibility") and project.visibility:
-        formatted_info.append(f"Visibility: {project.visibility}")
+    formatted_info = [f"# Project: {project.name}", f"ID: {project.id}"]
     
-    # Add URL if available
-    if hasattr(project, "url") and project.url:
-        formatted_info.append(f"URL: {project.url}")
-    
-    # Add last update time if available
-    if hasattr(project, "last_update_time") and project.last_update_time:
-        formatted_info.append(f"Last Updated: {project.last_update_time}")
+    # Add optional details that are set
+    formatted_info.extend(
+        f"{label}: {value}"
+        for attr, label in _PROJECT_DETAIL_LABELS
+        if (value := getattr(project, attr, None))
+    )
     
     return "\n".join(formatted_info)
 
 
+@ttl_cache(maxsize=64, ttl=300)
+def _fetch_projects(core_client: CoreClient, state_filter: Optional[str],
+                    top: Optional[int]):
+    """Get projects, reusing recent results."""
+    return core_client.get_projects(state_filter=state_filter, top=top)
+
+
 def _get_projects_impl(
     core_client: CoreClient,
     state_filter: Optional[str] = None,
-    top: Optional[int] = None
+    top: Optional[int] = None,
+    refresh: bool = False,
+    output_format: OutputFormat = "text"
 ) -> str:
     """
     Implementation of projects retrieval.
@@ -63,21 +72,24 @@ def _get_projects_impl(
         core_client: Core client
         state_filter: Filter on team projects in a specific state
         top: Maximum number of projects to return
+        refresh: If True, discard cached projects and fetch them again
+        output_format: "text" for markdown or "json" for the raw fields
             
     Returns:
         Formatted string containing project information
     """
     try:
-        projects = core_client.get_projects(state_filter=state_filter, top=top)
+        if refresh:
+            _fetch_projects.cache_clear()
+        projects = _fetch_projects(core_client, state_filter, top)
+        
+        if output_format == "json":
+            return models_to_json(projects)
         
         if not projects:
             return "No projects found."
         
-        formatted_projects = []
-        for project in projects:
-            formatted_projects.append(_format_project(project))
-        
-        return "\n\n".join(formatted_projects)
+        return "\n\n".join(map(_format_project, projects))
             
     except Exception as e:
         return f"Error retrieving projects: {str(e)}"
@@ -94,7 +106,9 @@ def register_tools(mcp) -> None:
     @mcp.tool()
     def get_projects(
         state_filter: Optional[str] = None,
-        top: Optional[int] = None
+        top: Optional[int] = None,
+        refresh: bool = False,
+        output_format: OutputFormat = "text"
     ) -> str:
         """
         Retrieves all projects accessible to the authenticated user 
@@ -110,6 +124,11 @@ def register_tools(mcp) -> None:
             state_filter: Filter on team projects in a specific state 
                 (e.g., "WellFormed", "Deleting")
             top: Maximum number of projects to return
+            refresh: Projects are reused for a few minutes; set to true to
+                fetch them again, e.g. right after creating a project
+            output_format: "text" (default) for markdown, or "json" for a
+                JSON array of project objects, which is more compact when
+                aggregating many projects
                 
         Returns:
             Formatted string containing project information including names,
@@ -118,6 +137,7 @@ def register_tools(mcp) -> None:
         """
         try:
             core_client = get_core_client()
-            return _get_projects_impl(core_client, state_filter, top)
+            return _get_projects_impl(core_client, state_filter, top,
+                                      refresh, output_format)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -6,7 +6,11 @@ This module provides shared functionality used by both tools and resources.
 from azure.devops.v7_1.core import CoreClient
 from azure.devops.v7_1.work import WorkClient
 
-from mcp_azure_devops.utils.azure_client import get_connection
+from mcp_azure_devops.utils.azure_client import (
+    configure_client,
+    get_connection,
+    memoize_client,
+)
 
 
 class AzureDevOpsClientError(Exception):
@@ -14,6 +18,7 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
+@memoize_client
 def get_core_client() -> CoreClient:
     """
     Get the core client for Azure DevOps.
@@ -39,9 +44,10 @@ def get_core_client() -> CoreClient:
     if core_client is None:
         raise AzureDevOpsClientError("Failed to get core client.")
     
-    return core_client
+    return configure_client(core_client)
 
 
+@memoize_client
 def get_work_client() -> WorkClient:
     """
     Get the work client for Azure DevOps.
@@ -67,4 +73,4 @@ def get_work_client() -> WorkClient:
     if work_client is None:
         raise AzureDevOpsClientError("Failed to get work client.")
     
-    return work_client
+    return configure_client(work_client)
@@ -14,6 +14,18 @@ from mcp_azure_devops.features.teams.common import (
     get_core_client,
     get_work_client,
 )
+from mcp_azure_devops.utils.cache import ttl_cache
+from mcp_azure_devops.utils.serialization import (
+    OutputFormat,
+    models_to_json,
+)
+
+# Optional team attributes shown when set, with their labels
+_TEAM_DETAIL_LABELS = (
+    ("description", "Description"),
+    ("project_name", "Project"),
+    ("project_id", "Project ID"),
+)
 
 
 def _format_team(team: WebApiTeam) -> str:
@@ -27,20 +39,14 @@ def _format_team(team: WebApiTeam) -> str:
         String with team details
     """
     # Basic information that should always be available
-    formatted_info = [f"# Team: {team.name}"]
-    formatted_info.append(f"ID: {team.id}")
-    
-    # Add description if available
-    if hasattr(team, "description") and team.description:
-        formatted_info.append(f"Description: {team.description}")
-    
-    # Add project information if available
-    if hasattr(team, "project_name") and team.project_name:
-        formatted_info.append(f"Project: {team.project_name}")
-    
-    if hasattr(team, "project_id") and team.project_id:
-        formatted_info.append(f"Project ID: {team.project_id}")
+    formatted_info = [f"# Team: {team.name}", f"ID: {team.id}"]
     
+    # Add description and project information that are set
+    formatted_info.extend(
+        f"{label}: {value}"
+        for attr, label in _TEAM_DETAIL_LABELS
+        if (value := getattr(team, attr, None))
+    )
     
     return "\n".join(formatted_info)
 
@@ -110,11 +116,10 @@ def _format_team_area_path(team_field_values) -> str:
     if hasattr(team_field_values, "values") and team_field_values.values:
         formatted_info.append("\n## All Area Paths:")
         for area_path in team_field_values.values:
-            value_str = f"- {area_path.value}"
-            if (hasattr(area_path, "include_children") and 
-                    area_path.include_children):
-                value_str += " (Including sub-areas)"
-            formatted_info.append(value_str)
+            suffix = (" (Including sub-areas)"
+                      if getattr(area_path, "include_children", False)
+                      else "")
+            formatted_info.append(f"- {area_path.value}{suffix}")
     
     return "\n".join(formatted_info)
 
@@ -158,12 +163,21 @@ def _format_team_iteration(iteration) -> str:
     return "\n".join(formatted_info)
 
 
+@ttl_cache(maxsize=64, ttl=300)
+def _fetch_all_teams(core_client: CoreClient, mine: Optional[bool],
+                     top: Optional[int], skip: Optional[int]):
+    """Get all teams, reusing recent results."""
+    return core_client.get_all_teams(mine=mine, top=top, skip=skip)
+
+
 def _get_all_teams_impl(
     core_client: CoreClient,
     user_is_member_of: Optional[bool] = None,
     top: Optional[int] = None,
     skip: Optional[int] = None,
-    expand_identity: Optional[bool] = None
+    expand_identity: Optional[bool] = None,
+    refresh: bool = False,
+    output_format: OutputFormat = "text"
 ) -> str:
     """
     Implementation of teams retrieval.
@@ -175,27 +189,26 @@ def _get_all_teams_impl(
                           access.
         top: Maximum number of teams to return
         skip: Number of teams to skip
+        refresh: If True, discard cached teams and fetch them again
+        output_format: "text" for markdown or "json" for the raw fields
             
     Returns:
         Formatted string containing team information
     """
     try:
+        if refresh:
+            _fetch_all_teams.cache_clear()
         # Call the SDK function - note we're mapping user_is_member_of to mine
         # param
-        teams = core_client.get_all_teams(
-            mine=user_is_member_of,
-            top=top,
-            skip=skip
-        )
+        teams = _fetch_all_teams(core_client, user_is_member_of, top, skip)
+        
+        if output_format == "json":
+            return models_to_json(teams)
         
         if not teams:
             return "No teams found."
         
-        formatted_teams = []
-        for team in teams:
-            formatted_teams.append(_format_team(team))
-        
-        return "\n\n".join(formatted_teams)
+        return "\n\n".join(map(_format_team, teams))
             
     except Exception as e:
         return f"Error retrieving teams: {str(e)}"
@@ -234,11 +247,7 @@ def _get_team_members_impl(
             return (f"No members found for team {team_id} in "
                     f"project {project_id}.")
         
-        formatted_members = []
-        for member in team_members:
-            formatted_members.append(_format_team_member(member))
-        
-        return "\n\n".join(formatted_members)
+        return "\n\n".join(map(_format_team_member, team_members))
             
     except Exception as e:
         return f"Error retrieving team members: {str(e)}"
@@ -318,11 +327,7 @@ def _get_team_iterations_impl(
             return (f"No iterations found for team {team_name_or_id} "
                     f"in project {project_name_or_id}.")
         
-        formatted_iterations = []
-        for iteration in team_iterations:
-            formatted_iterations.append(_format_team_iteration(iteration))
-        
-        return "\n\n".join(formatted_iterations)
+        return "\n\n".join(map(_format_team_iteration, team_iterations))
             
     except Exception as e:
         return f"Error retrieving team iterations: {str(e)}"
@@ -340,7 +345,9 @@ def register_tools(mcp) -> None:
     def get_all_teams(
         user_is_member_of: Optional[bool] = None,
         top: Optional[int] = None,
-        skip: Optional[int] = None
+        skip: Optional[int] = None,
+        refresh: bool = False,
+        output_format: OutputFormat = "text"
     ) -> str:
         """
         Retrieves all teams in the Azure DevOps organization.
@@ -357,6 +364,11 @@ def register_tools(mcp) -> None:
                 has read access to.
             top: Maximum number of teams to return
             skip: Number of teams to skip
+            refresh: Teams are reused for a few minutes; set to true to
+                fetch them again, e.g. right after creating a team
+            output_format: "text" (default) for markdown, or "json" for a
+                JSON array of team objects, which is more compact when
+                aggregating many teams
                 
         Returns:
             Formatted string containing team information including names,
@@ -369,7 +381,9 @@ def register_tools(mcp) -> None:
                 core_client, 
                 user_is_member_of,
                 top,
-                skip
+                skip,
+                refresh=refresh,
+                output_format=output_format
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -3,9 +3,27 @@ Common utilities for Azure DevOps work item features.
 
 This module provides shared functionality used by both tools and resources.
 """
+import functools
+import itertools
+from typing import List, Sequence
+
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.utils.azure_client import (
+    configure_client,
+    get_connection,
+    memoize_client,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.concurrency import run_concurrently
 
-from mcp_azure_devops.utils.azure_client import get_connection
+# Azure DevOps accepts at most 200 IDs per get_work_items request
+MAX_WORK_ITEMS_PER_REQUEST = 200
+
+# Work items change often, so query results are only reused briefly, and
+# not at all after a write through this server
+query_cache = TTLCache(maxsize=128, ttl=30)
 
 
 class AzureDevOpsClientError(Exception):
@@ -13,6 +31,7 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
+@memoize_client
 def get_work_item_client() -> WorkItemTrackingClient:
     """
     Get the work item tracking client.
@@ -39,4 +58,39 @@ def get_work_item_client() -> WorkItemTrackingClient:
         raise AzureDevOpsClientError(
             "Failed to get work item tracking client.")
     
-    return wit_client
+    return configure_client(wit_client)
+
+
+def clear_query_cache() -> None:
+    """Forget cached query results, so they reflect a write just made."""
+    query_cache.clear()
+
+
+def get_work_items_batched(
+    wit_client: WorkItemTrackingClient,
+    ids: Sequence[int],
+    **kwargs
+) -> List[WorkItem]:
+    """
+    Get work items of any count, splitting the IDs into allowed batches.
+    
+    Batches are fetched concurrently and results keep the order of ids.
+    
+    Args:
+        wit_client: Work item tracking client
+        ids: Work item IDs
+        **kwargs: Further arguments for get_work_items (e.g. fields)
+        
+    Returns:
+        List of work items; with error_policy="omit" missing items are None
+    """
+    batches = [
+        functools.partial(
+            wit_client.get_work_items,
+            ids=list(ids[start:start + MAX_WORK_ITEMS_PER_REQUEST]),
+            **kwargs)
+        for start in range(0, len(ids), MAX_WORK_ITEMS_PER_REQUEST)
+    ]
+    results = run_concurrently(*batches)
+    return list(itertools.chain.from_iterable(
+        result or [] for result in results))
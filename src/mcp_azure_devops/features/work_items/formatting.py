@@ -3,8 +3,20 @@ Formatting utilities for Azure DevOps work items.
 
 This module provides functions to format work items for display.
 """
+from typing import Iterable, Iterator, Sequence
+
 from azure.devops.v7_1.work_item_tracking.models import WorkItem
 
+# Reference names of fields given their own section
+_BOARD_COLUMN = "System.BoardColumn"
+_BOARD_COLUMN_DONE = "System.BoardColumnDone"
+_FOUND_IN = "Microsoft.VSTS.Build.FoundIn"
+_INTEGRATION_BUILD = "Microsoft.VSTS.Build.IntegrationBuild"
+
+# Table separator rows for the column counts the tools use
+_TABLE_SEPARATORS = {
+    columns: "|" + " ---- |" * columns for columns in (3, 4, 5, 6)}
+
 
 def _format_field_value(field_value) -> str:
     """
@@ -51,13 +63,14 @@ def _format_board_info(fields: dict) -> list[str]:
     board_info = []
     
     # Add board column (if available)
-    if "System.BoardColumn" in fields:
-        board_info.append(f"Board Column: {fields['System.BoardColumn']}")
+    board_column = fields.get(_BOARD_COLUMN)
+    if board_column is not None:
+        board_info.append(f"Board Column: {board_column}")
         
         # Add board column done state (if available)
-        if "System.BoardColumnDone" in fields:
-            done_state = ("Done" if fields["System.BoardColumnDone"] 
-                          else "Not Done")
+        column_done = fields.get(_BOARD_COLUMN_DONE)
+        if column_done is not None:
+            done_state = "Done" if column_done else "Not Done"
             board_info.append(f"Column State: {done_state}")
     
     return board_info
@@ -76,15 +89,14 @@ def _format_build_info(fields: dict) -> list[str]:
     build_info = []
     
     # Add found in build (if available)
-    if "Microsoft.VSTS.Build.FoundIn" in fields:
-        build_info.append(
-            f"Found In: {fields['Microsoft.VSTS.Build.FoundIn']}")
+    found_in = fields.get(_FOUND_IN)
+    if found_in is not None:
+        build_info.append(f"Found In: {found_in}")
     
     # Add integration build (if available)
-    if "Microsoft.VSTS.Build.IntegrationBuild" in fields:
-        build_info.append(
-            f"Integration Build: "
-            f"{fields['Microsoft.VSTS.Build.IntegrationBuild']}")
+    integration_build = fields.get(_INTEGRATION_BUILD)
+    if integration_build is not None:
+        build_info.append(f"Integration Build: {integration_build}")
     
     return build_info
 
@@ -103,8 +115,8 @@ def format_work_item(work_item: WorkItem) -> str:
     details = [f"# Work Item {work_item.id}"]
     
     # List all fields alphabetically for consistent output
-    for field_name in sorted(fields.keys()):
-        field_value = fields[field_name]
+    # Keys are unique, so sorting items never compares values
+    for field_name, field_value in sorted(fields.items()):
         formatted_value = _format_field_value(field_value)
         details.append(f"- **{field_name}**: {formatted_value}")
     
@@ -117,3 +129,20 @@ def format_work_item(work_item: WorkItem) -> str:
                 details.append(f"  :: Attributes: {link.attributes}")
     
     return "\n".join(details)
+
+
+def iter_table(headers: Sequence[str], rows: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the lines of a markdown table.
+    
+    Args:
+        headers: Column headers
+        rows: Pre-formatted row strings, consumed lazily
+        
+    Returns:
+        Iterator over the header, separator and row lines
+    """
+    columns = len(headers)
+    yield "| " + " | ".join(headers) + " |"
+    yield _TABLE_SEPARATORS.get(columns) or "|" + " ---- |" * columns
+    yield from rows
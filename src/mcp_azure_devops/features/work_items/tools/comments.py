@@ -10,6 +10,7 @@ from azure.devops.v7_1.work_item_tracking.models import CommentCreate
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    clear_query_cache,
     get_work_item_client,
 )
 
@@ -59,7 +60,9 @@ def _get_project_for_work_item(
         Project name or None if not found
     """
     try:
-        work_item = wit_client.get_work_item(item_id)
+        # Only the project is needed, so skip every other field
+        work_item = wit_client.get_work_item(
+            item_id, fields=["System.TeamProject"])
         if work_item and work_item.fields:
             return work_item.fields.get("System.TeamProject")
     except Exception:
@@ -139,6 +142,8 @@ def _add_work_item_comment_impl(
         project=project, 
         work_item_id=item_id
     )
+    # Query results may include comments
+    clear_query_cache()
     
     return f"Comment added successfully.\n\n{_format_comment(new_comment)}"
 
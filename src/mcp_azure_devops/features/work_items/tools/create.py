@@ -3,6 +3,7 @@ Create operations for Azure DevOps work items.
 
 This module provides MCP tools for creating work items.
 """
+import functools
 import os
 from typing import Any, Dict, Optional
 
@@ -11,10 +12,29 @@ from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    clear_query_cache,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
 
+_FIELDS_PATH_PREFIX = "/fields/"
+
+
+@functools.lru_cache(maxsize=256)
+def _field_path(field_name: str) -> str:
+    """
+    Get the JSON patch path for a field, prefixing /fields/ if needed.
+    
+    Args:
+        field_name: Field reference name, with or without the prefix
+        
+    Returns:
+        JSON patch path for the field
+    """
+    if field_name.startswith(_FIELDS_PATH_PREFIX):
+        return field_name
+    return _FIELDS_PATH_PREFIX + field_name
+
 
 def _build_field_document(fields: Dict[str, Any], 
                           operation: str = "add") -> list:
@@ -28,22 +48,14 @@ def _build_field_document(fields: Dict[str, Any],
     Returns:
         List of JsonPatchOperation objects
     """
-    document = []
-    
-    for field_name, field_value in fields.items():
-        # Ensure field names are prefixed with /fields/
-        path = (field_name if field_name.startswith("/fields/") 
-                else f"/fields/{field_name}")
-        
-        document.append(
-            JsonPatchOperation(
-                op=operation,
-                path=path,
-                value=field_value
-            )
+    return [
+        JsonPatchOperation(
+            op=operation,
+            path=_field_path(field_name),
+            value=field_value
         )
-    
-    return document
+        for field_name, field_value in fields.items()
+    ]
 
 
 def _get_organization_url() -> str:
@@ -108,6 +120,7 @@ def _create_work_item_impl(
         project=project,
         type=work_item_type
     )
+    clear_query_cache()
     
     # If parent_id is provided, establish parent-child relationship
     if parent_id:
@@ -128,6 +141,7 @@ def _create_work_item_impl(
                 id=new_work_item.id,
                 project=project
             )
+            clear_query_cache()
         except Exception as e:
             return (f"Work item created successfully, but failed to establish "
                    f"parent-child relationship: {str(e)}\n\n"
@@ -163,6 +177,7 @@ def _update_work_item_impl(
         id=id,
         project=project
     )
+    clear_query_cache()
     
     return format_work_item(updated_work_item)
 
@@ -199,6 +214,7 @@ def _add_link_to_work_item_impl(
         id=source_id,
         project=project
     )
+    clear_query_cache()
     
     return format_work_item(updated_work_item)
 
@@ -367,8 +383,15 @@ def register_tools(mcp) -> None:
             
             # Start with standard fields
             all_fields = _prepare_standard_fields(
-                title, description, state, assigned_to,
-                iteration_path, area_path, story_points, priority, tags
+                title=title,
+                description=description,
+                state=state,
+                assigned_to=assigned_to,
+                iteration_path=iteration_path,
+                area_path=area_path,
+                story_points=story_points,
+                priority=priority,
+                tags=tags,
             )
             
             # Add custom fields if provided
@@ -448,8 +471,15 @@ def register_tools(mcp) -> None:
             
             # Start with standard fields
             all_fields = _prepare_standard_fields(
-                title, description, state, assigned_to,
-                iteration_path, area_path, story_points, priority, tags
+                title=title,
+                description=description,
+                state=state,
+                assigned_to=assigned_to,
+                iteration_path=iteration_path,
+                area_path=area_path,
+                story_points=story_points,
+                priority=priority,
+                tags=tags,
             )
             
             # Add custom fields if provided
@@ -3,19 +3,31 @@ Process operations for Azure DevOps.
 
 This module provides MCP tools for retrieving process information.
 """
+from azure.devops.v7_1.work_item_tracking_process.models import (
+    ProcessInfo,
+    ProcessWorkItemType,
+)
+
+from mcp_azure_devops.features.work_items.formatting import iter_table
 from mcp_azure_devops.utils.azure_client import (
     get_core_client,
+    get_credentials,
     get_work_item_tracking_process_client,
 )
+from mcp_azure_devops.utils.cache import JsonFileCache
+
+# Processes change rarely, so keep them on disk across server restarts
+_process_cache = JsonFileCache("processes")
+
+
+def _yes_no(value) -> str:
+    """Format a flag for a table cell."""
+    return "Yes" if value else "No"
 
 
-def _format_table(headers, rows):
-    """Format data as a markdown table."""
-    result = []
-    result.append("| " + " | ".join(headers) + " |")
-    result.append("| " + " | ".join(["----"] * len(headers)) + " |")
-    result.extend(rows)
-    return "\n".join(result)
+def _or_na(obj, attr: str):
+    """Get an attribute for display, showing a missing value as N/A."""
+    return getattr(obj, attr, None) or "N/A"
 
 
 def _get_project_process_id_impl(project: str) -> str:
@@ -44,11 +56,31 @@ def _get_project_process_id_impl(project: str) -> str:
                 f"{str(e)}")
 
 
-def _get_process_details_impl(process_id: str) -> str:
-    """Implementation of process details retrieval."""
+def _get_process_details_impl(process_id: str,
+                              process_client=None,
+                              refresh: bool = False) -> str:
+    """
+    Implementation of process details retrieval.
+    
+    Args:
+        process_id: The ID of the process
+        process_client: Optional work item tracking process client; the
+            shared client is used when omitted
+        refresh: If True, bypass cached details and fetch them again
+        
+    Returns:
+        Formatted string containing the process details
+    """
     try:
-        process_client = get_work_item_tracking_process_client()
-        process = process_client.get_process_by_its_id(process_id)
+        if process_client is None:
+            process_client = get_work_item_tracking_process_client()
+        _, organization_url = get_credentials()
+        process = _process_cache.get_or_fetch(
+            organization_url,
+            f"process:{process_id}",
+            lambda: process_client.get_process_by_its_id(process_id),
+            ProcessInfo,
+            refresh)
         
         if not process:
             return f"Process with ID '{process_id}' not found."
@@ -58,9 +90,8 @@ def _get_process_details_impl(process_id: str) -> str:
         if hasattr(process, "description") and process.description:
             result.append(f"\nDescription: {process.description}")
         
-        result.append(
-            f"Reference Name: {getattr(process, 'reference_name', 'N/A')}")
-        result.append(f"Type ID: {getattr(process, 'type_id', 'N/A')}")
+        result.append(f"Reference Name: {_or_na(process, 'reference_name')}")
+        result.append(f"Type ID: {_or_na(process, 'type_id')}")
         
         # Get process properties like isDefault, isEnabled, etc.
         properties = getattr(process, "properties", None)
@@ -73,18 +104,23 @@ def _get_process_details_impl(process_id: str) -> str:
                     result.append(f"{attr_name}: {value}")
         
         # Get work item types for this process
-        wit_types = process_client.get_process_work_item_types(process_id)
+        wit_types = _process_cache.get_or_fetch(
+            organization_url,
+            f"work-item-types:{process_id}",
+            lambda: process_client.get_process_work_item_types(process_id),
+            ProcessWorkItemType,
+            refresh)
         if wit_types:
             result.append("\n## Work Item Types")
             
             headers = ["Name", "Reference Name", "Description"]
-            rows = [
-                f"| {wit.name} | {getattr(wit, 'reference_name', 'N/A')} | " +
-                f"{getattr(wit, 'description', 'N/A')} |"
+            rows = (
+                f"| {wit.name} | {_or_na(wit, 'reference_name')} | "
+                f"{_or_na(wit, 'description')} |"
                 for wit in wit_types
-            ]
+            )
             
-            result.append(_format_table(headers, rows))
+            result.extend(iter_table(headers, rows))
         
         return "\n".join(result)
     except Exception as e:
@@ -92,11 +128,25 @@ def _get_process_details_impl(process_id: str) -> str:
                 f"'{process_id}': {str(e)}")
 
 
-def _list_processes_impl() -> str:
-    """Implementation of processes list retrieval."""
+def _list_processes_impl(refresh: bool = False) -> str:
+    """
+    Implementation of processes list retrieval.
+    
+    Args:
+        refresh: If True, bypass cached processes and fetch them again
+        
+    Returns:
+        Formatted string containing a table of processes
+    """
     try:
         process_client = get_work_item_tracking_process_client()
-        processes = process_client.get_list_of_processes()
+        _, organization_url = get_credentials()
+        processes = _process_cache.get_or_fetch(
+            organization_url,
+            "processes",
+            process_client.get_list_of_processes,
+            ProcessInfo,
+            refresh)
         
         if not processes:
             return "No processes found in the organization."
@@ -104,18 +154,15 @@ def _list_processes_impl() -> str:
         result = ["# Available Processes"]
         
         headers = ["Name", "ID", "Reference Name", "Description", "Is Default"]
-        rows = []
-        for process in processes:
-            is_default = ("Yes" if getattr(process.properties, 
-                                        'is_default', False) 
-                          else "No")
-            row = (f"| {process.name} | {process.type_id} | " +
-                   f"{getattr(process, 'reference_name', 'N/A')} | " +
-                   f"{getattr(process, 'description', 'N/A')} | " +
-                   f"{is_default} |")
-            rows.append(row)
-        
-        result.append(_format_table(headers, rows))
+        rows = (
+            f"| {process.name} | {process.type_id} | "
+            f"{_or_na(process, 'reference_name')} | "
+            f"{_or_na(process, 'description')} | "
+            f"{_yes_no(getattr(process.properties, 'is_default', False))} |"
+            for process in processes
+        )
+        
+        result.extend(iter_table(headers, rows))
         return "\n".join(result)
     except Exception as e:
         return f"Error retrieving processes: {str(e)}"
@@ -151,7 +198,7 @@ def register_tools(mcp) -> None:
             return f"Error: {str(e)}"
     
     @mcp.tool()
-    def get_process_details(process_id: str) -> str:
+    def get_process_details(process_id: str, refresh: bool = False) -> str:
         """
         Gets detailed information about a specific process.
         
@@ -162,18 +209,20 @@ def register_tools(mcp) -> None:
         
         Args:
             process_id: The ID of the process
+            refresh: Process details are kept for a day; set to true to
+                fetch them again, e.g. after editing the process
             
         Returns:
             Detailed information about the process including properties and
             available work item types
         """
         try:
-            return _get_process_details_impl(process_id)
+            return _get_process_details_impl(process_id, refresh=refresh)
         except Exception as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
-    def list_processes() -> str:
+    def list_processes(refresh: bool = False) -> str:
         """
         Lists all available processes in the organization.
         
@@ -182,11 +231,15 @@ def register_tools(mcp) -> None:
         - Find process IDs for project creation or configuration
         - Check which process is set as the default
         
+        Args:
+            refresh: Processes are kept for a day; set to true to fetch
+                them again, e.g. after creating or renaming a process
+        
         Returns:
             A formatted table of all processes with names, IDs, and 
             descriptions
         """
         try:
-            return _list_processes_impl()
+            return _list_processes_impl(refresh)
         except Exception as e:
             return f"Error: {str(e)}"
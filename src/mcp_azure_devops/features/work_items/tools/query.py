@@ -3,6 +3,8 @@ Query operations for Azure DevOps work items.
 
 This module provides MCP tools for querying work items.
 """
+import functools
+import re
 from typing import Optional
 
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
@@ -11,12 +13,99 @@ from azure.devops.v7_1.work_item_tracking.models import Wiql
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
+    get_work_items_batched,
+    query_cache,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.features.work_items.tools.comments import (
+    _format_comment,
+)
+from mcp_azure_devops.utils.azure_client import get_cache_scope
+from mcp_azure_devops.utils.concurrency import run_concurrently
+
+# Fields fetched for query results by default; far smaller than
+# expanding every field and relation of each work item
+_FORMAT_FIELDS = (
+    "System.WorkItemType",
+    "System.Title",
+    "System.State",
+    "System.AssignedTo",
+    "System.AreaPath",
+    "System.IterationPath",
+    "System.Description",
+    "System.Tags",
+)
+
+# Comments are fetched per project, so the project is needed alongside
+# the field list
+_PROJECT_FIELD = "System.TeamProject"
+
+# String literals and [field] references, which must keep their content
+_WIQL_VERBATIM = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\]")
+_WIQL_KEYWORDS = re.compile(
+    r"\b(select|from|where|order by|group by|and|or|not|in|asc|desc|"
+    r"under|ever|contains|asof)\b",
+    re.IGNORECASE,
+)
+_WIQL_OPERATOR = re.compile(r"\s*([=<>!,()])\s*")
+
+
+def _canonicalize_wiql_text(text: str) -> str:
+    """Normalize whitespace, keyword case and operator spacing."""
+    text = re.sub(r"\s+", " ", text)
+    text = _WIQL_KEYWORDS.sub(lambda match: match.group().upper(), text)
+    return _WIQL_OPERATOR.sub(r"\1", text)
+
+
+def _canonicalize_wiql(query: str) -> str:
+    """
+    Reduce a WIQL query to a canonical form for use as a cache key.
+    
+    Queries that differ only in keyword casing, whitespace, trailing
+    semicolons or string literal quoting map to the same text. String
+    literals and field references are otherwise kept verbatim.
+    
+    Args:
+        query: The WIQL query string
+        
+    Returns:
+        Canonical query text
+    """
+    parts = []
+    position = 0
+    for match in _WIQL_VERBATIM.finditer(query):
+        parts.append(_canonicalize_wiql_text(query[position:match.start()]))
+        token = match.group()
+        if token.startswith('"'):
+            # WIQL accepts either quote; store literals single quoted
+            literal = token[1:-1].replace('""', '"').replace("'", "''")
+            token = f"'{literal}'"
+        parts.append(token)
+        position = match.end()
+    parts.append(_canonicalize_wiql_text(query[position:]))
+    
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def _fetch_comments(wit_client: WorkItemTrackingClient, work_item) -> list:
+    """Get the comments of a work item using its already known project."""
+    comments = wit_client.get_comments(
+        project=work_item.fields.get(_PROJECT_FIELD),
+        work_item_id=work_item.id)
+    return comments.comments or []
+
+
+def _format_with_comments(work_item, comments) -> str:
+    """Format a work item followed by its comments."""
+    return "\n\n".join([format_work_item(work_item),
+                         *map(_format_comment, comments)])
 
 
 def _query_work_items_impl(query: str, top: int, 
-                           wit_client: WorkItemTrackingClient) -> str:
+                           wit_client: WorkItemTrackingClient,
+                           include_relations: bool = False,
+                           include_comments: bool = False,
+                           fields: Optional[list[str]] = None) -> str:
     """
     Implementation of query_work_items that operates with a client.
     
@@ -24,10 +113,22 @@ def _query_work_items_impl(query: str, top: int,
         query: The WIQL query string
         top: Maximum number of results to return
         wit_client: Work item tracking client
+        include_relations: Whether to fetch every field and related link
+            instead of a field list
+        include_comments: Whether to fetch the comments of every result,
+            concurrently, and show them after each work item
+        fields: Optional field reference names to fetch instead of the
+            standard field set. Ignored when include_relations is set.
             
     Returns:
         Formatted string containing work item details
     """
+    cache_key = (get_cache_scope(), _canonicalize_wiql(query), top,
+                 include_relations, include_comments,
+                 tuple(fields) if fields else None)
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
     # Create the WIQL query
     wiql = Wiql(query=query)
@@ -40,17 +141,33 @@ def _query_work_items_impl(query: str, top: int,
     
     # Get the work items from the results
     work_item_ids = [int(res.id) for res in wiql_results]
-    work_items = wit_client.get_work_items(ids=work_item_ids,
-                                           expand="all",
-                                           error_policy="omit")
+    if include_relations:
+        # The API rejects a field list combined with expand
+        work_items = get_work_items_batched(wit_client, work_item_ids,
+                                            expand="all",
+                                            error_policy="omit")
+    else:
+        projection = list(fields or _FORMAT_FIELDS)
+        if include_comments and _PROJECT_FIELD not in projection:
+            projection.append(_PROJECT_FIELD)
+        work_items = get_work_items_batched(wit_client, work_item_ids,
+                                            fields=projection,
+                                            error_policy="omit")
+    work_items = [work_item for work_item in work_items if work_item]
     
-    # Use the standard formatting for all work items
-    formatted_results = []
-    for work_item in work_items:
-        if work_item:
-            formatted_results.append(format_work_item(work_item))
+    if include_comments:
+        # One request per work item, overlapped on the shared pool
+        comments = run_concurrently(*(
+            functools.partial(_fetch_comments, wit_client, work_item)
+            for work_item in work_items))
+        result = "\n\n".join(map(_format_with_comments, work_items,
+                                  comments))
+    else:
+        # Use the standard formatting for all work items
+        result = "\n\n".join(map(format_work_item, work_items))
     
-    return "\n\n".join(formatted_results)
+    query_cache.set(cache_key, result)
+    return result
 
 def register_tools(mcp) -> None:
     """
@@ -61,7 +178,13 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
-    def query_work_items(query: str, top: Optional[int] = None) -> str:
+    def query_work_items(
+        query: str,
+        top: Optional[int] = None,
+        include_relations: bool = False,
+        include_comments: bool = False,
+        fields: Optional[list[str]] = None
+    ) -> str:
         """
         Searches for work items using Work Item Query Language (WIQL).
         
@@ -79,13 +202,27 @@ def register_tools(mcp) -> None:
             query: The WIQL query string (e.g., "SELECT * FROM workitems 
                 WHERE [System.State] = 'Active'")
             top: Maximum number of results to return (default: 30)
+            include_relations: Whether to return every field and the
+                related links of each work item instead of the standard
+                fields (type, title, state, assignee, area, iteration,
+                description and tags). Defaults to False, which is much
+                faster.
+            include_comments: Whether to also return the comments of each
+                work item, instead of calling get_work_item_comments for
+                every result. Costs one extra request per work item.
+            fields: Optional list of field reference names to return (e.g.,
+                ["System.Title", "Microsoft.VSTS.Common.Priority"])
+                instead of the standard fields. Ignored when
+                include_relations is true.
                 
         Returns:
             Formatted string containing detailed information for each matching
-            work item, with all fields and values formatted as markdown
+            work item, with its fields and values formatted as markdown
         """
         try:
             wit_client = get_work_item_client()
-            return _query_work_items_impl(query, top or 30, wit_client)
+            return _query_work_items_impl(query, top or 30, wit_client,
+                                          include_relations,
+                                          include_comments, fields)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
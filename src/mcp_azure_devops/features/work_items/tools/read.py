@@ -3,56 +3,120 @@ Read operations for Azure DevOps work items.
 
 This module provides MCP tools for retrieving work item information.
 """
+import functools
+import itertools
+from typing import Optional
+
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import (
+    WorkItemBatchGetRequest,
+)
 
 from mcp_azure_devops.features.work_items.common import (
+    MAX_WORK_ITEMS_PER_REQUEST,
     AzureDevOpsClientError,
     get_work_item_client,
+    get_work_items_batched,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.utils.concurrency import run_concurrently
+
+
+def _format_work_items(work_items) -> str:
+    """
+    Format a list of retrieved work items for display.
+    
+    Args:
+        work_items: Work items; None entries are items that were not found
+        
+    Returns:
+        Formatted string with one section per work item
+    """
+    if not work_items:
+        return "No work items found."
+    
+    # Skip None values (failed retrievals)
+    formatted_results = [format_work_item(work_item)
+                         for work_item in work_items if work_item]
+    
+    if not formatted_results:
+        return "No valid work items found with the provided IDs."
+    
+    return "\n\n".join(formatted_results)
 
 
 def _get_work_item_impl(item_id: int | list[int], 
-                        wit_client: WorkItemTrackingClient) -> str:
+                        wit_client: WorkItemTrackingClient,
+                        fields: Optional[list[str]] = None) -> str:
     """
     Implementation of work item retrieval.
     
     Args:
         item_id: The work item ID or list of IDs
         wit_client: Work item tracking client
+        fields: Optional field reference names to fetch instead of every
+            field and relation
             
     Returns:
         Formatted string containing work item information
     """
+    # The API rejects a field list combined with expand
+    fetch_args = {"fields": fields} if fields else {"expand": "all"}
     try:
         if isinstance(item_id, int):
             # Handle single work item
-            work_item = wit_client.get_work_item(item_id, expand="all")
+            work_item = wit_client.get_work_item(item_id, **fetch_args)
             return format_work_item(work_item)
         else:
-            # Handle list of work items
-            work_items = wit_client.get_work_items(ids=item_id,
-                                                   error_policy="omit",
-                                                   expand="all")
-            
-            if not work_items:
-                return "No work items found."
-                
-            formatted_results = []
-            for work_item in work_items:
-                if work_item:  # Skip None values (failed retrievals)
-                    formatted_results.append(format_work_item(work_item))
+            # Handle list of work items, in concurrent batches of 200
+            work_items = get_work_items_batched(wit_client, item_id,
+                                                error_policy="omit",
+                                                **fetch_args)
             
-            if not formatted_results:
-                return "No valid work items found with the provided IDs."
-                
-            return "\n\n".join(formatted_results)
+            return _format_work_items(work_items)
     except Exception as e:
         if isinstance(item_id, int):
             return f"Error retrieving work item {item_id}: {str(e)}"
         else:
             return f"Error retrieving work items {item_id}: {str(e)}"
 
+
+def _get_work_items_batch_impl(ids: list[int],
+                               wit_client: WorkItemTrackingClient,
+                               fields: Optional[list[str]] = None) -> str:
+    """
+    Implementation of batch work item retrieval.
+    
+    The IDs and field list travel in a POST body, so long lists never hit
+    URL length limits. Batches of 200 are fetched concurrently.
+    
+    Args:
+        ids: Work item IDs
+        wit_client: Work item tracking client
+        fields: Optional field reference names to fetch instead of every
+            field and relation
+            
+    Returns:
+        Formatted string containing work item information
+    """
+    # The API rejects a field list combined with expand
+    expand = None if fields else "all"
+    try:
+        batches = [
+            functools.partial(
+                wit_client.get_work_items_batch,
+                WorkItemBatchGetRequest(
+                    ids=ids[start:start + MAX_WORK_ITEMS_PER_REQUEST],
+                    fields=fields, expand=expand, error_policy="omit"))
+            for start in range(0, len(ids), MAX_WORK_ITEMS_PER_REQUEST)
+        ]
+        work_items = list(itertools.chain.from_iterable(
+            result or [] for result in run_concurrently(*batches)))
+        return _format_work_items(work_items)
+    except Exception as e:
+        return f"Error retrieving work items {ids}: {str(e)}"
+
+
 def register_tools(mcp) -> None:
     """
     Register work item read tools with the MCP server.
@@ -62,7 +126,10 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
-    def get_work_item(id: int | list[int]) -> str:
+    def get_work_item(
+        id: int | list[int],
+        fields: Optional[list[str]] = None
+    ) -> str:
         """
         Retrieves detailed information about one or multiple work items.
         
@@ -74,6 +141,10 @@ def register_tools(mcp) -> None:
         
         Args:
             id: The work item ID or a list of work item IDs
+            fields: Optional list of field reference names to return (e.g.,
+                ["System.Title", "System.State"]). Strongly preferred when
+                reading many work items, since by default every field and
+                relation is fetched.
             
         Returns:
             Formatted string containing comprehensive information for the
@@ -82,6 +153,35 @@ def register_tools(mcp) -> None:
         """
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_impl(id, wit_client)
+            return _get_work_item_impl(id, wit_client, fields)
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+    
+    @mcp.tool()
+    def get_work_items_batch(
+        ids: list[int],
+        fields: Optional[list[str]] = None
+    ) -> str:
+        """
+        Retrieves many work items at once through the batch endpoint.
+        
+        Use this tool when you need to:
+        - Read a long list of work items, such as the results of a query
+        - Fetch the same set of fields for many work items in one request
+        
+        Args:
+            ids: List of work item IDs
+            fields: Optional list of field reference names to return (e.g.,
+                ["System.Title", "System.Description",
+                "Microsoft.VSTS.Common.AcceptanceCriteria"]). By default
+                every field and relation is fetched.
+            
+        Returns:
+            Formatted string containing the requested fields of each work
+            item, formatted as markdown
+        """
+        try:
+            wit_client = get_work_item_client()
+            return _get_work_items_batch_impl(ids, wit_client, fields)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
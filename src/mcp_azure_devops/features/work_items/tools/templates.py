@@ -3,6 +3,8 @@ Work item templates operations for Azure DevOps.
 
 This module provides MCP tools for retrieving work item templates.
 """
+import itertools
+from operator import attrgetter
 from typing import Optional
 
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
@@ -11,25 +13,30 @@ from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
+from mcp_azure_devops.features.work_items.formatting import iter_table
+from mcp_azure_devops.utils.cache import ttl_cache
 
+# Template attributes shown in template details, with their labels
+_TEMPLATE_DETAIL_LABELS = (
+    ("description", "Description"),
+    ("work_item_type_name", "Work item type name"),
+    ("id", "Id"),
+)
 
-def _format_table(headers, rows):
-    """Format data as a markdown table."""
-    result = []
-    result.append("| " + " | ".join(headers) + " |")
-    result.append("| " + " | ".join(["----"] * len(headers)) + " |")
-    result.extend(rows)
-    return "\n".join(result)
+# Attributes read for each template table row, fetched in one call
+_template_row_values = attrgetter(
+    "name", "work_item_type_name", "description")
 
 
 def _format_work_item_template(template):
     """Format work item template data for display."""
     result = [f"# Template: {template.name}"]
     
-    for attr in ["description", "work_item_type_name", "id"]:
-        value = getattr(template, attr, None)
-        if value:
-            result.append(f"{attr.replace('_', ' ').capitalize()}: {value}")
+    result.extend(
+        f"{label}: {value}"
+        for attr, label in _TEMPLATE_DETAIL_LABELS
+        if (value := getattr(template, attr, None))
+    )
     
     fields = getattr(template, "fields", None)
     if fields:
@@ -51,6 +58,19 @@ def _create_team_context(team_context_dict):
     )
 
 
+@ttl_cache(maxsize=256, ttl=300)
+def _fetch_templates(wit_client: WorkItemTrackingClient, project, project_id,
+                     team, team_id, work_item_type: Optional[str]):
+    """Get a team's templates, reusing recent results."""
+    team_ctx = _create_team_context({
+        "project": project,
+        "project_id": project_id,
+        "team": team,
+        "team_id": team_id,
+    })
+    return wit_client.get_templates(team_ctx, work_item_type)
+
+
 def _get_work_item_templates_impl(
     team_context: dict, 
     work_item_type: Optional[str],
@@ -58,8 +78,14 @@ def _get_work_item_templates_impl(
 ) -> str:
     """Implementation of work item templates retrieval."""
     try:
-        team_ctx = _create_team_context(team_context)
-        templates = wit_client.get_templates(team_ctx, work_item_type)
+        templates = _fetch_templates(
+            wit_client,
+            team_context.get('project'),
+            team_context.get('project_id'),
+            team_context.get('team'),
+            team_context.get('team_id'),
+            work_item_type,
+        )
         
         team_display = team_context.get('team') or team_context.get('team_id')
         
@@ -78,15 +104,15 @@ def _get_work_item_templates_impl(
         
         headers = ["Name", "Work Item Type", "Description"]
         
-        # Use list comprehension for table rows
-        rows = [
-            f"| {template.name} | " 
-            f"{getattr(template, 'work_item_type_name', 'N/A')} | " +
-            f"{getattr(template, 'description', 'N/A')} |"
-            for template in templates
-        ]
+        # One f-string per row, consumed lazily by the table join
+        rows = (
+            f"| {name} | {type_name or 'N/A'} | {description or 'N/A'} |"
+            for name, type_name, description
+            in map(_template_row_values, templates)
+        )
         
-        return f"{header}\n\n" + _format_table(headers, rows)
+        return "\n".join(itertools.chain(
+            (header, ""), iter_table(headers, rows)))
     except Exception as e:
         return f"Error retrieving templates: {str(e)}"
 
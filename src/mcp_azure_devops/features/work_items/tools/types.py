@@ -3,25 +3,60 @@ Work item types and fields operations for Azure DevOps.
 
 This module provides MCP tools for retrieving work item types and fields.
 """
+import functools
+import itertools
+from operator import attrgetter
+from typing import Iterator, Sequence
+
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
+from mcp_azure_devops.features.work_items.formatting import iter_table
 from mcp_azure_devops.utils.azure_client import (
+    get_cache_scope,
     get_core_client,
     get_work_item_tracking_process_client,
 )
+from mcp_azure_devops.utils.cache import TTLCache, ttl_cache
+from mcp_azure_devops.utils.concurrency import run_concurrently
+
+# Type attributes shown in type details, with their labels
+_TYPE_DETAIL_LABELS = (
+    ("color", "Color"),
+    ("icon", "Icon"),
+    ("reference_name", "Reference_name"),
+)
 
+# Field types that never carry a picklist of allowed values
+_NO_PICKLIST_TYPES = frozenset({
+    "boolean", "datetime", "guid", "history", "html", "identity",
+    "plaintext", "treepath",
+})
+
+# Process IDs resolved at startup, kept for the life of the server
+_pinned_process_ids = TTLCache(maxsize=256, ttl=float("inf"))
+
+# Attributes read for each table row or state, fetched in one call
+_type_row_values = attrgetter("name", "reference_name", "description")
+_field_row_values = attrgetter(
+    "name", "reference_name", "type", "required", "read_only")
+_state_values = attrgetter("name", "category", "color", "order")
+
+
+@ttl_cache(maxsize=256, ttl=300)
+def _fetch_work_item_types(wit_client: WorkItemTrackingClient, project: str):
+    """Get the work item types of a project, reusing recent results."""
+    return wit_client.get_work_item_types(project)
 
-def _format_table(headers, rows):
-    """Format data as a markdown table."""
-    result = []
-    result.append("| " + " | ".join(headers) + " |")
-    result.append("| " + " | ".join(["----"] * len(headers)) + " |")
-    result.extend(rows)
-    return "\n".join(result)
+
+@ttl_cache(maxsize=256, ttl=300)
+def _fetch_work_item_type(wit_client: WorkItemTrackingClient, project: str,
+                          type_name: str):
+    """Get a work item type, reusing recent results."""
+    return wit_client.get_work_item_type(project, type_name)
 
 
 def _format_work_item_type(wit):
@@ -32,10 +67,11 @@ def _format_work_item_type(wit):
     if description:
         result.append(f"\nDescription: {description}")
     
-    for attr in ["color", "icon", "reference_name"]:
-        value = getattr(wit, attr, None)
-        if value:
-            result.append(f"{attr.capitalize()}: {value}")
+    result.extend(
+        f"{label}: {value}"
+        for attr, label in _TYPE_DETAIL_LABELS
+        if (value := getattr(wit, attr, None))
+    )
     
     is_disabled = getattr(wit, "is_disabled", None)
     if is_disabled is not None:
@@ -44,13 +80,10 @@ def _format_work_item_type(wit):
     states = getattr(wit, "states", None)
     if states:
         result.append("\n## States")
-        for state in states:
-            state_info = f"- {state.name} (Category: {state.category}, " \
-                         f"Color: {state.color})"
-            order = getattr(state, "order", None)
-            if order is not None:
-                state_info += f", Order: {order}"
-            result.append(state_info)
+        for name, category, color, order in map(_state_values, states):
+            order_info = f", Order: {order}" if order is not None else ""
+            result.append(f"- {name} (Category: {category}, "
+                          f"Color: {color}){order_info}")
     
     return "\n".join(result)
 
@@ -60,28 +93,29 @@ def _get_work_item_types_impl(
     wit_client: WorkItemTrackingClient
 ) -> str:
     """Implementation of work item types retrieval."""
-    work_item_types = wit_client.get_work_item_types(project)
+    work_item_types = _fetch_work_item_types(wit_client, project)
     
     if not work_item_types:
         return f"No work item types found in project {project}."
     
     headers = ["Name", "Reference Name", "Description"]
     
-    # Use list comprehension for more concise table building
-    rows = [
-        f"| {wit.name} | {getattr(wit, 'reference_name', 'N/A')} | "
-        f"{getattr(wit, 'description', 'N/A')} |"
-        for wit in work_item_types
-    ]
+    # One f-string per row, consumed lazily by the table join
+    rows = (
+        f"| {name} | {reference_name or 'N/A'} | {description or 'N/A'} |"
+        for name, reference_name, description
+        in map(_type_row_values, work_item_types)
+    )
     
-    return (f"# Work Item Types in Project: {project}\n\n" + 
-            _format_table(headers, rows))
+    return "\n".join(itertools.chain(
+        (f"# Work Item Types in Project: {project}", ""),
+        iter_table(headers, rows)))
 
 
 def _get_work_item_type_impl(project: str, type_name: str, 
                              wit_client: WorkItemTrackingClient) -> str:
     """Implementation of work item type detail retrieval."""
-    work_item_type = wit_client.get_work_item_type(project, type_name)
+    work_item_type = _fetch_work_item_type(wit_client, project, type_name)
     
     if not work_item_type:
         return f"Work item type '{type_name}' not found in project {project}."
@@ -89,50 +123,306 @@ def _get_work_item_type_impl(project: str, type_name: str,
     return _format_work_item_type(work_item_type)
 
 
+def _template_id(project_details):
+    """Read the process template ID from a project's capabilities."""
+    return project_details.capabilities.get(
+        "processTemplate", {}).get("templateTypeId")
+
+
+@ttl_cache(maxsize=64, ttl=600, scope=get_cache_scope)
+def _fetch_process_id(project: str):
+    """Get the process template ID of a project, reusing recent results."""
+    core_client = get_core_client()
+    return _template_id(core_client.get_project(
+        project, include_capabilities=True))
+
+
+def _pin_key(project: str) -> tuple:
+    """Key a pinned process ID by connection and case-folded project."""
+    return get_cache_scope(), project.lower()
+
+
+def _process_id_for(project: str):
+    """
+    Get the process template ID of a project.
+    
+    A project's process almost never changes, so the lookup is reused for
+    a few minutes, or for good if it was pinned at startup.
+    
+    Args:
+        project: Project ID or project name
+        
+    Returns:
+        The process ID, or None if it cannot be determined
+    """
+    pinned = _pinned_process_ids.get(_pin_key(project))
+    if pinned is not None:
+        return pinned
+    return _fetch_process_id(project)
+
+
+def prefetch_process_ids(projects: Sequence[str]) -> None:
+    """
+    Resolve and pin the process IDs of the given projects.
+    
+    Every type and field tool needs the project's process ID, so looking
+    it up ahead of the first tool call saves that call a round trip.
+    Projects that cannot be resolved are skipped and looked up on first
+    use instead. Each process ID is pinned under the project's name and
+    ID, so later lookups by either hit the pin.
+    
+    Args:
+        projects: Project IDs or project names
+    """
+    def pin(project):
+        try:
+            project_details = get_core_client().get_project(
+                project, include_capabilities=True)
+        except Exception:
+            return
+        process_id = _template_id(project_details)
+        if not process_id:
+            return
+        for alias in (project, getattr(project_details, "name", None),
+                      getattr(project_details, "id", None)):
+            if alias:
+                _pinned_process_ids.set(_pin_key(alias), process_id)
+    
+    run_concurrently(*(functools.partial(pin, project)
+                       for project in projects))
+
+
+@ttl_cache(maxsize=256, ttl=300)
+def _type_reference_names(wit_client: WorkItemTrackingClient, project: str):
+    """Map lowercased type names and reference names to reference names."""
+    reference_names = {}
+    for wit in _fetch_work_item_types(wit_client, project) or []:
+        if wit.reference_name:
+            reference_names[wit.name.lower()] = wit.reference_name
+            reference_names[wit.reference_name.lower()] = wit.reference_name
+    return reference_names
+
+
+def _type_reference_name(project: str, type_name: str,
+                         wit_client: WorkItemTrackingClient):
+    """
+    Resolve a work item type name to its reference name.
+    
+    The project's cached type list is used first, so a separate
+    get_work_item_type request is only made for names missing from it.
+    
+    Args:
+        project: Project ID or project name
+        type_name: The name of the work item type
+        wit_client: Work item tracking client
+        
+    Returns:
+        The reference name, or None if the type does not exist
+    """
+    reference_name = _type_reference_names(
+        wit_client, project).get(type_name.lower())
+    if reference_name:
+        return reference_name
+    
+    wit = _fetch_work_item_type(wit_client, project, type_name)
+    return wit.reference_name if wit else None
+
+
+def _get_type_and_process_id(project: str, type_name: str,
+                             wit_client: WorkItemTrackingClient):
+    """
+    Get a work item type's reference name and its project's process ID.
+    
+    Both lookups are cached. They only run concurrently when neither is
+    cached, since a single request gains nothing from the thread pool.
+    
+    Args:
+        project: Project ID or project name
+        type_name: The name of the work item type
+        wit_client: Work item tracking client
+        
+    Returns:
+        Tuple containing (reference_name, process_id); either may be None
+    """
+    type_lookup = functools.partial(
+        _type_reference_name, project, type_name, wit_client)
+    process_lookup = functools.partial(_process_id_for, project)
+    
+    if (_type_reference_names.is_cached(wit_client, project)
+            or _pinned_process_ids.get(_pin_key(project))
+            or _fetch_process_id.is_cached(project)):
+        return type_lookup(), process_lookup()
+    
+    wit_ref_name, process_id = run_concurrently(type_lookup, process_lookup)
+    return wit_ref_name, process_id
+
+
+@ttl_cache(maxsize=256, ttl=300)
+def _fetch_type_fields(process_client, process_id: str, wit_ref_name: str):
+    """Get all fields of a work item type, reusing recent results."""
+    return process_client.get_all_work_item_type_fields(
+        process_id, wit_ref_name)
+
+
+@ttl_cache(maxsize=1024, ttl=300)
+def _fetch_type_field(process_client, process_id: str, wit_ref_name: str,
+                      reference_name: str):
+    """Get one field of a work item type in detail, reusing recent results."""
+    return process_client.get_work_item_type_field(
+        process_id, wit_ref_name, reference_name)
+
+
+@ttl_cache(maxsize=256, ttl=300)
+def _type_fields_index(process_client, process_id: str, wit_ref_name: str):
+    """Map lowercased field display and reference names to fields."""
+    index = {}
+    for field in _fetch_type_fields(
+            process_client, process_id, wit_ref_name) or []:
+        index[field.name.lower()] = field
+        index[field.reference_name.lower()] = field
+    return index
+
+
+def _get_type_field(process_client, process_id: str, wit_ref_name: str,
+                    field_name: str):
+    """
+    Get a field of a work item type by display name or reference name.
+    
+    The field is taken from the type's cached field list. The list may
+    leave out allowed values, so unless an entry lists them or its type
+    cannot have any, the details are fetched on their own, at most once
+    per process, type and field while cached. A field missing from the
+    list is fetched the same way.
+    
+    Args:
+        process_client: Work item tracking process client
+        process_id: The process ID of the project
+        wit_ref_name: Reference name of the work item type
+        field_name: The reference name or display name of the field
+        
+    Returns:
+        The field, or None if the type has no such field
+    """
+    field = _type_fields_index(
+        process_client, process_id, wit_ref_name).get(field_name.lower())
+    if field is None and "." not in field_name:
+        # Display names can only be resolved through the field list
+        return None
+    
+    if (field is None or (getattr(field, "allowed_values", None) is None
+                          and str(getattr(field, "type", "")).lower()
+                          not in _NO_PICKLIST_TYPES)):
+        reference_name = field.reference_name if field else field_name
+        field = _fetch_type_field(
+            process_client, process_id, wit_ref_name, reference_name)
+    return field
+
+
+def _iter_type_fields(type_name: str, fields) -> Iterator[str]:
+    """
+    Yield the lines of the fields table of a work item type.
+    
+    The heading and table header are yielded before the first field is
+    read, and each row as soon as its field is, so callers can consume
+    the output while fields are still being produced.
+    
+    Args:
+        type_name: The name of the work item type
+        fields: Fields returned by the process API, consumed lazily
+        
+    Returns:
+        Iterator over the output lines
+    """
+    headers = ["Name", "Reference Name", "Type", "Required", "Read Only"]
+    
+    # One f-string per row, produced only when requested. Rows keep the
+    # trailing space they have always had.
+    rows = (
+        f"| {name} | {reference_name} | {field_type or 'N/A'} | "
+        f"{'Yes' if required else 'No'} | "
+        f"{'Yes' if read_only else 'No'} | "
+        for name, reference_name, field_type, required, read_only
+        in map(_field_row_values, fields)
+    )
+    
+    yield f"# Fields for Work Item Type: {type_name}"
+    yield ""
+    yield from iter_table(headers, rows)
+
+
+def _format_type_fields(type_name: str, fields) -> str:
+    """
+    Format the fields of a work item type as a markdown table.
+    
+    Args:
+        type_name: The name of the work item type
+        fields: Fields returned by the process API
+        
+    Returns:
+        Formatted string with one row per field
+    """
+    # Join the heading and rows once rather than copying the table
+    return "\n".join(_iter_type_fields(type_name, fields))
+
+
+def _format_type_field(field) -> str:
+    """
+    Format the details of a work item type field for display.
+    
+    Args:
+        field: Field returned by the process API
+        
+    Returns:
+        Formatted string with the field's details
+    """
+    result = [f"# Field: {field.name}",
+              f"Reference Name: {field.reference_name}"]
+    
+    if hasattr(field, "description") and field.description:
+        result.append(f"Description: {field.description}")
+    
+    if hasattr(field, "type"):
+        result.append(f"Type: {field.type}")
+    
+    is_required = "Yes" if getattr(field, 'required', False) else "No"
+    result.append(f"Required: {is_required}")
+    is_read_only = "Yes" if getattr(field, 'read_only', False) else "No"
+    result.append(f"Read Only: {is_read_only}")
+    
+    allowed_values = getattr(field, "allowed_values", None)
+    if allowed_values:
+        result.append("\n## Allowed Values")
+        result.extend(f"- {value}" for value in allowed_values)
+    
+    default_value = getattr(field, "default_value", None)
+    if default_value is not None:
+        result.append(f"\nDefault Value: {default_value}")
+    
+    return "\n".join(result)
+
+
 def _get_work_item_type_fields_impl(project: str, type_name: str, 
                                    wit_client: WorkItemTrackingClient) -> str:
     """Implementation of work item type fields retrieval using process API."""
     try:
-        # Get the work item type to get its reference name
-        wit = wit_client.get_work_item_type(project, type_name)
-        if not wit:
+        wit_ref_name, process_id = _get_type_and_process_id(
+            project, type_name, wit_client)
+        if not wit_ref_name:
             return (f"Work item type '{type_name}' not found in "
                     f"project {project}.")
         
-        wit_ref_name = wit.reference_name
-        
-        # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True)
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}).get("templateTypeId")
-        
         if not process_id:
             return f"Could not determine process ID for project {project}"
         
         # Get process client and fields for this work item type
         process_client = get_work_item_tracking_process_client()
-        fields = process_client.get_all_work_item_type_fields(
-            process_id, wit_ref_name)
+        fields = _fetch_type_fields(process_client, process_id, wit_ref_name)
         
         if not fields:
             return (f"No fields found for work item type '{type_name}' "
                    f"in project {project}.")
         
-        headers = ["Name", "Reference Name", "Type", "Required", "Read Only"]
-        
-        # Simple table formatting
-        rows = [
-            f"| {field.name} | {field.reference_name} | " +
-            f"{getattr(field, 'type', 'N/A')} | " +
-            f"{'Yes' if getattr(field, 'required', False) else 'No'} | " +
-            f"{'Yes' if getattr(field, 'read_only', False) else 'No'} | "
-            for field in fields
-        ]
-        
-        return (f"# Fields for Work Item Type: {type_name}\n\n" + 
-                _format_table(headers, rows))
+        return _format_type_fields(type_name, fields)
     except Exception as e:
         return (f"Error retrieving fields for work item type '{type_name}' "
                 f"in project '{project}': {str(e)}")
@@ -147,72 +437,25 @@ def _get_work_item_type_field_impl(
     """Implementation of work item type field detail retrieval using process
     API."""
     try:
-        # Get the work item type to get its reference name
-        wit = wit_client.get_work_item_type(project, type_name)
-        if not wit:
+        wit_ref_name, process_id = _get_type_and_process_id(
+            project, type_name, wit_client)
+        if not wit_ref_name:
             return (f"Work item type '{type_name}' not found in "
                     f"project {project}.")
         
-        wit_ref_name = wit.reference_name
-        
-        # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True)
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}).get("templateTypeId")
-        
         if not process_id:
             return f"Could not determine process ID for project {project}"
         
         # Get process client and field details
         process_client = get_work_item_tracking_process_client()
-        
-        # Determine if field_name is a display name or reference name
-        if "." not in field_name:
-            # Get all fields to find the reference name
-            all_fields = process_client.get_all_work_item_type_fields(
-                process_id, wit_ref_name)
-            field_ref = next((f.reference_name for f in all_fields 
-                             if f.name.lower() == field_name.lower()), None)
-            if not field_ref:
-                return (f"Field '{field_name}' not found for work item type "
-                        f"'{type_name}' in project '{project}'.")
-            field_name = field_ref
-        
-        field = process_client.get_work_item_type_field(
-            process_id, wit_ref_name, field_name)
+        field = _get_type_field(
+            process_client, process_id, wit_ref_name, field_name)
         
         if not field:
             return (f"Field '{field_name}' not found for work item type "
                     f"'{type_name}' in project '{project}'.")
         
-        # Format field details
-        result = [f"# Field: {field.name}"]
-        result.append(f"Reference Name: {field.reference_name}")
-        
-        if hasattr(field, "description") and field.description:
-            result.append(f"Description: {field.description}")
-        
-        if hasattr(field, "type"):
-            result.append(f"Type: {field.type}")
-        
-        is_required = "Yes" if getattr(field, 'required', False) else "No"
-        result.append(f"Required: {is_required}")
-        is_read_only = "Yes" if getattr(field, 'read_only', False) else "No"
-        result.append(f"Read Only: {is_read_only}")
-        
-        allowed_values = getattr(field, "allowed_values", None)
-        if allowed_values and len(allowed_values) > 0:
-            result.append("\n## Allowed Values")
-            for value in allowed_values:
-                result.append(f"- {value}")
-        
-        default_value = getattr(field, "default_value", None)
-        if default_value is not None:
-            result.append(f"\nDefault Value: {default_value}")
-        
-        return "\n".join(result)
+        return _format_type_field(field)
     except Exception as e:
         return (f"Error retrieving field '{field_name}' for work item type "
                 f"'{type_name}' in project '{project}': {str(e)}")
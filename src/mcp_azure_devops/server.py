@@ -4,11 +4,17 @@ Azure DevOps MCP Server
 A simple MCP server that exposes Azure DevOps capabilities.
 """
 import argparse
+import os
+import threading
 
 from mcp.server.fastmcp import FastMCP
 
 from mcp_azure_devops.features import register_all
+from mcp_azure_devops.features.work_items.tools.types import (
+    prefetch_process_ids,
+)
 from mcp_azure_devops.utils import register_all_prompts
+from mcp_azure_devops.utils.azure_client import get_credentials
 
 # Create a FastMCP server instance with a name
 mcp = FastMCP("Azure DevOps")
@@ -25,6 +31,21 @@ def main():
     
     parser.parse_args()  # Store args if needed later
     
+    # Fail fast instead of returning the same error from every tool call
+    pat, organization_url = get_credentials()
+    if not pat or not organization_url:
+        parser.error("AZURE_DEVOPS_PAT and AZURE_DEVOPS_ORGANIZATION_URL "
+                     "environment variables must be set.")
+    
+    # Resolve the process IDs of the usual projects in the background,
+    # so the first type or field lookup does not wait for them
+    projects = [project.strip() for project
+                in os.environ.get("AZURE_DEVOPS_PROJECTS", "").split(",")
+                if project.strip()]
+    if projects:
+        threading.Thread(target=prefetch_process_ids, args=(projects,),
+                         name="prefetch-process-ids", daemon=True).start()
+    
     # Start the server
     mcp.run(transport="streamable-http")
 
@@ -1,4 +1,4 @@
-from mcp_azure_devops.utils.conventions_promp import register_prompt
+from mcp_azure_devops.utils.conventions_prompt import register_prompt
 
 
 def register_all_prompts(mcp):
@@ -8,6 +8,10 @@ def register_all_prompts(mcp):
     Args:
         mcp: The FastMCP server instance
     """
+    if getattr(mcp, "_azure_devops_prompts_registered", False):
+        return
+    
     # Register prompts here
     register_prompt(mcp)
+    mcp._azure_devops_prompts_registered = True
     
\ No newline at end of file
@@ -3,32 +3,224 @@ Azure DevOps client utilities.
 
 This module provides helper functions for connecting to Azure DevOps.
 """
+from __future__ import annotations
+
+import functools
+import hashlib
 import os
-from typing import Optional, Tuple
+import re
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, TypeVar
+
+from mcp_azure_devops.utils.cache import CachedFunction, ttl_cache
+from mcp_azure_devops.utils.concurrency import MAX_WORKERS
+
+if TYPE_CHECKING:
+    # The SDK and its transport are imported on first use, not at startup
+    from azure.devops.client import Client
+    from azure.devops.connection import Connection
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+    from msrest.universal_http.requests import ClientRetryPolicy
+    from requests.adapters import HTTPAdapter
+
+ClientT = TypeVar("ClientT")
+# Clients created from a connection, which carry an msrest configuration
+SdkClientT = TypeVar("SdkClientT", bound="Client")
+
+# Throttling (429) and transient server errors worth retrying
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# POST endpoints that only read data, so retrying them is safe: WIQL
+# queries and the work item batch endpoint
+_READ_ONLY_POST = re.compile(r"/_apis/wit/(?:wiql|workitemsbatch)/?(?:\?|$)",
+                             re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_retry_policy() -> ClientRetryPolicy:
+    """
+    Get the retry policy shared by every client.
+    
+    Throttled and transient failures are retried with jittered exponential
+    backoff, honouring Retry-After headers.
+    
+    Returns:
+        msrest retry policy
+    """
+    from msrest.universal_http.requests import ClientRetryPolicy
+    from urllib3.util.retry import Retry
+    
+    retry_policy = ClientRetryPolicy()
+    retry_policy.retries = 5
+    retry_policy.backoff_factor = 0.5
+    
+    # Only idempotent requests, and POSTs that only read data, are
+    # retried, so creates and updates are never sent twice. When retries
+    # run out the last response is returned and the SDK raises its usual
+    # error.
+    retry = retry_policy.policy
+    retry.status_forcelist = _RETRY_STATUS_CODES
+    retry.allowed_methods = Retry.DEFAULT_ALLOWED_METHODS
+    retry.backoff_jitter = 0.5
+    retry.respect_retry_after_header = True
+    retry.raise_on_status = False
+    return retry_policy
+
+
+@functools.lru_cache(maxsize=None)
+def _get_http_adapter() -> HTTPAdapter:
+    """
+    Get the HTTP adapter shared by every client and thread.
+    
+    msrest keeps one session per client and thread, but urllib3 pools are
+    thread-safe, so sharing the adapter lets all of them reuse open TLS
+    connections.
+    
+    POSTs to read-only endpoints, such as WIQL queries, are sent through
+    a sibling adapter on the same pool whose retry policy allows POST.
+    
+    Returns:
+        Pooled HTTP adapter
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    class PooledAdapter(HTTPAdapter):
+        def send(self, request, *args, **kwargs):
+            if (request.method == "POST"
+                    and _READ_ONLY_POST.search(request.url or "")):
+                return read_only_post_adapter.send(request, *args, **kwargs)
+            return super().send(request, *args, **kwargs)
+    
+    # urllib3 keeps 10 sockets per host by default. Leave room for every
+    # worker of the shared pool plus tool calls running alongside it, so
+    # concurrent requests never queue behind a busy socket.
+    adapter = PooledAdapter(pool_connections=16, pool_maxsize=4 * MAX_WORKERS,
+                            max_retries=_get_retry_policy().policy)
+    read_only_post_adapter = HTTPAdapter(
+        max_retries=_get_retry_policy().policy.new(
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"}))
+    read_only_post_adapter.poolmanager = adapter.poolmanager
+    return adapter
 
-from azure.devops.connection import Connection
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.work_item_tracking_process import (
-    WorkItemTrackingProcessClient,
-)
-from msrest.authentication import BasicAuthentication
 
+def _use_shared_adapter(session, global_config, local_config, **kwargs):
+    """Session callback routing requests through the shared adapter."""
+    adapter = _get_http_adapter()
+    if session.adapters.get("https://") is not adapter:
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return kwargs
 
+
+@functools.lru_cache(maxsize=1)
 def get_credentials() -> Tuple[Optional[str], Optional[str]]:
     """
     Get Azure DevOps credentials from environment variables.
     
+    The environment is read once, so changing the variables requires a
+    restart or a call to get_credentials.cache_clear().
+    
     Returns:
         Tuple containing (pat, organization_url)
     """
-    pat = os.environ.get("AZURE_DEVOPS_PAT")
-    organization_url = os.environ.get("AZURE_DEVOPS_ORGANIZATION_URL")
-    return pat, organization_url
+    env = os.environ
+    return (env.get("AZURE_DEVOPS_PAT"),
+            env.get("AZURE_DEVOPS_ORGANIZATION_URL"))
+
+
+def get_cache_scope() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Identify the organization and user that cached responses belong to.
+    
+    The PAT is reduced to a short digest so it is never kept in a cache
+    key, while responses for different users still never mix.
+    
+    Returns:
+        Tuple containing (organization_url, pat_digest)
+    """
+    pat, organization_url = get_credentials()
+    pat_digest = (hashlib.sha256(pat.encode("utf-8")).hexdigest()[:16]
+                  if pat else None)
+    return organization_url, pat_digest
+
+
+def configure_client(client: SdkClientT) -> SdkClientT:
+    """
+    Apply the shared transport settings to an Azure DevOps client.
+    
+    Requests go through a pooled adapter that keeps connections alive
+    between tool calls, and throttled or transient failures are retried
+    below the tool boundary.
+    
+    Args:
+        client: Client created from an Azure DevOps connection
+        
+    Returns:
+        The same client instance
+    """
+    client.config.retry_policy = _get_retry_policy()
+    client.config.session_configuration_callback = _use_shared_adapter
+    # Without keep-alive msrest closes the session after every response
+    client.config.keep_alive = True
+    return client
+
+
+def memoize_client(
+    getter: Callable[[], ClientT]
+) -> CachedFunction[[], ClientT]:
+    """
+    Reuse the client returned by a getter until the credentials change.
+    
+    Sharing one client per credentials avoids rebuilding the connection
+    on every tool call and lets its HTTP session keep connections alive.
+    Repeated calls with unchanged credentials return the last client
+    without locking. Other calls are serialized, so threads racing on a
+    cold cache still share a single instance. Failures are not cached.
+    
+    Args:
+        getter: Function creating a client
+        
+    Returns:
+        Memoized getter
+    """
+    cached_getter = ttl_cache(maxsize=4, ttl=float("inf"),
+                              scope=get_credentials)(getter)
+    lock = threading.Lock()
+    # Credentials and client of the last call. A server runs with a
+    # single set of credentials, so this is all most calls need.
+    last = None
+    
+    def memoized_getter() -> ClientT:
+        nonlocal last
+        credentials = get_credentials()
+        hit = last
+        if hit is not None and hit[0] is credentials:
+            return hit[1]
+        with lock:
+            client = cached_getter()
+            last = (credentials, client)
+            return client
+    
+    def cache_clear() -> None:
+        nonlocal last
+        with lock:
+            last = None
+            cached_getter.cache_clear()
+    
+    return CachedFunction(getter, memoized_getter, cache_clear)
 
 
+@memoize_client
 def get_connection() -> Optional[Connection]:
     """
-    Create a connection to Azure DevOps.
+    Get the connection to Azure DevOps for the current credentials.
+    
+    The connection is reused until the credentials change, so clients it
+    creates and resource area lookups are not repeated.
     
     Returns:
         Connection object or None if credentials are missing
@@ -38,10 +230,14 @@ def get_connection() -> Optional[Connection]:
     if not pat or not organization_url:
         return None
     
+    from azure.devops.connection import Connection
+    from msrest.authentication import BasicAuthentication
+    
     credentials = BasicAuthentication('', pat)
     return Connection(base_url=organization_url, creds=credentials)
 
 
+@memoize_client
 def get_core_client() -> CoreClient:
     """
     Get the Core client for Azure DevOps.
@@ -65,9 +261,10 @@ def get_core_client() -> CoreClient:
     if not core_client:
         raise Exception("Failed to get Core client.")
     
-    return core_client
+    return configure_client(core_client)
 
 
+@memoize_client
 def get_work_item_tracking_process_client() -> WorkItemTrackingProcessClient:
     """
     Get the Work Item Tracking Process client for Azure DevOps.
@@ -91,4 +288,4 @@ def get_work_item_tracking_process_client() -> WorkItemTrackingProcessClient:
     if not process_client:
         raise Exception("Failed to get Work Item Tracking Process client.")
     
-    return process_client
+    return configure_client(process_client)
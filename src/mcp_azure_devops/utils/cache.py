@@ -0,0 +1,358 @@
+"""
+Caching utilities for Azure DevOps metadata.
+
+This module provides a persistent JSON cache for metadata that changes
+rarely (such as processes), so it survives MCP server restarts, and a
+small in-memory TTL cache for responses that are reused within a session.
+"""
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
+
+from mcp_azure_devops import __version__
+
+# Process metadata changes on the order of days, so a day is a safe default
+DEFAULT_DISK_TTL = 24 * 60 * 60
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Marks a miss, so that None results can be cached too
+_MISSING = object()
+
+# Every in-memory cache, so they can all be cleared together
+_memory_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+def get_cache_dir() -> str:
+    """
+    Get the directory used for persistent caches.
+
+    Returns:
+        Path under $XDG_CACHE_HOME (or ~/.cache) for this package
+    """
+    base_dir = (os.environ.get("XDG_CACHE_HOME") or
+                os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base_dir, "mcp-azure-devops")
+
+
+class JsonFileCache:
+    """
+    A JSON file cache of SDK models with per-entry expiry.
+
+    Each entry records the package version, organization URL and fetch
+    time alongside the serialized data, so entries written by another
+    version or for another organization are never returned.
+
+    The parsed file is kept in memory and only read again when the file
+    changes on disk. Updates are serialized, so concurrent writers never
+    drop each other's entries.
+    """
+
+    # Shared by every instance, since instances may share a file
+    _lock = threading.Lock()
+
+    def __init__(self, name: str, ttl: float = DEFAULT_DISK_TTL):
+        self.name = name
+        self.ttl = ttl
+        # Path, file signature and entries of the last read or write
+        self._snapshot: Optional[tuple] = None
+
+    @property
+    def path(self) -> str:
+        """Path of the JSON file backing this cache."""
+        return os.path.join(get_cache_dir(), f"{self.name}.json")
+
+    def get(self, org_url: str, key: str) -> Optional[Any]:
+        """
+        Get the data stored for a key if it is still fresh.
+
+        Args:
+            org_url: The Azure DevOps organization URL
+            key: Cache key, unique within the organization
+
+        Returns:
+            The stored data, or None if missing or expired
+        """
+        entry = self._load().get(f"{org_url}|{key}")
+        if not isinstance(entry, dict):
+            return None
+
+        if (entry.get("version") != __version__ or
+                entry.get("org_url") != org_url or
+                time.time() - entry.get("fetched_at", 0) > self.ttl):
+            return None
+
+        return entry.get("data")
+
+    def set(self, org_url: str, key: str, data: Any) -> None:
+        """
+        Store data for a key, rewriting the cache file atomically.
+
+        Args:
+            org_url: The Azure DevOps organization URL
+            key: Cache key, unique within the organization
+            data: JSON serializable data to store
+        """
+        with self._lock:
+            # Copy, so readers of the current snapshot never see it change
+            entries = dict(self._load())
+            entries[f"{org_url}|{key}"] = {
+                "version": __version__,
+                "org_url": org_url,
+                "fetched_at": time.time(),
+                "data": data,
+            }
+            self._write(entries)
+
+    def get_or_fetch(
+        self,
+        org_url: Optional[str],
+        key: str,
+        fetch: Callable[[], Any],
+        model_class: Any,
+        refresh: bool = False
+    ) -> Any:
+        """
+        Get SDK models from the cache, fetching and storing them on a miss.
+
+        Args:
+            org_url: The Azure DevOps organization URL. Caching is skipped
+                when it is not known.
+            key: Cache key, unique within the organization
+            fetch: Callable returning a model, a list of models or None
+            model_class: msrest model class used to rebuild cached data
+            refresh: If True, ignore stored data and replace it with the
+                fetched result
+
+        Returns:
+            The model or list of models
+        """
+        if org_url and not refresh:
+            data = self.get(org_url, key)
+            if isinstance(data, list):
+                return [model_class.deserialize(item) for item in data]
+            if data is not None:
+                return model_class.deserialize(data)
+
+        result = fetch()
+
+        if org_url and result is not None:
+            try:
+                if isinstance(result, list):
+                    data = [item.serialize(keep_readonly=True)
+                            for item in result]
+                else:
+                    data = result.serialize(keep_readonly=True)
+                # Fail on anything that is not plain JSON before writing
+                json.dumps(data)
+            except (AttributeError, TypeError, ValueError):
+                return result
+            self.set(org_url, key, data)
+
+        return result
+
+    @staticmethod
+    def _signature(path: str) -> Optional[tuple]:
+        """Identify the current version of a file, or None if missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> dict:
+        """Load all entries, treating a missing or corrupt file as empty."""
+        path = self.path
+        signature = self._signature(path)
+        snapshot = self._snapshot
+        if (snapshot is not None and snapshot[0] == path
+                and snapshot[1] == signature):
+            return snapshot[2]
+
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            entries = {}
+
+        if not isinstance(entries, dict):
+            entries = {}
+        if signature is not None:
+            self._snapshot = (path, signature, entries)
+        return entries
+
+    def _write(self, entries: dict) -> None:
+        """Write entries via a temporary file and rename."""
+        path = self.path
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            # The cache is an optimization, never fail a tool call over it
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(entries, cache_file)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        signature = self._signature(path)
+        if signature is not None:
+            self._snapshot = (path, signature, entries)
+
+
+class TTLCache:
+    """
+    A thread-safe, size-bounded in-memory cache with per-entry expiry.
+
+    The least recently used entry is evicted once the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        _memory_caches.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the value stored for a key if it has not expired.
+
+        Args:
+            key: Hashable cache key
+            default: Value returned on a miss
+
+        Returns:
+            The stored value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value for a key, evicting the oldest entry when full.
+
+        Args:
+            key: Hashable cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+def clear_memory_caches() -> None:
+    """Clear every in-memory cache, e.g. after credentials change."""
+    for cache in _memory_caches:
+        cache.clear()
+
+
+class CachedFunction(Generic[P, R]):
+    """
+    A function wrapped with a cache that can be cleared.
+
+    Calls are forwarded to the caching wrapper, while the name, docstring
+    and signature of the original function are kept.
+    """
+
+    __name__: str
+
+    def __init__(self, func: Callable[P, R], call: Callable[P, R],
+                 cache_clear: Callable[[], None],
+                 is_cached: Optional[Callable[P, bool]] = None):
+        functools.update_wrapper(self, func)
+        self._call = call
+        self._cache_clear = cache_clear
+        self._is_cached = is_cached
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        return self._call(*args, **kwargs)
+
+    def cache_clear(self) -> None:
+        """Discard every cached result."""
+        self._cache_clear()
+
+    def is_cached(self, *args: P.args, **kwargs: P.kwargs) -> bool:
+        """Check whether a call would be served from the cache."""
+        return bool(self._is_cached and self._is_cached(*args, **kwargs))
+
+
+def ttl_cache(
+    maxsize: int = 128,
+    ttl: float = 300,
+    scope: Optional[Callable[[], Hashable]] = None
+) -> Callable[[Callable[P, R]], CachedFunction[P, R]]:
+    """
+    Cache a function's results in memory, keyed on its arguments.
+
+    Args:
+        maxsize: Maximum number of results kept
+        ttl: Seconds each result is reused for
+        scope: Optional callable whose result is added to every key, e.g.
+            to keep results for different organizations apart
+
+    Returns:
+        Decorator adding the cache. The wrapped function gains
+        cache_clear() and is_cached() methods.
+    """
+    def decorator(func: Callable[P, R]) -> CachedFunction[P, R]:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+        def make_key(args: tuple, kwargs: dict) -> Hashable:
+            return (scope() if scope else None, args,
+                    tuple(sorted(kwargs.items())))
+
+        def cached(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = make_key(args, kwargs)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        def is_cached(*args: P.args, **kwargs: P.kwargs) -> bool:
+            return cache.get(make_key(args, kwargs), _MISSING) is not _MISSING
+
+        return CachedFunction(func, cached, cache.clear, is_cached)
+
+    return decorator
@@ -0,0 +1,36 @@
+"""
+Concurrency utilities for Azure DevOps REST calls.
+
+Tool calls spend nearly all of their time waiting on REST round trips, so
+independent requests are overlapped on a shared thread pool.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+# Requests release the GIL while waiting on the network, so a handful of
+# threads is enough to overlap the calls made by a single tool
+MAX_WORKERS = 8
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                               thread_name_prefix="azure-devops")
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent calls concurrently and wait for all of them.
+
+    Calls must not themselves use run_concurrently, since waiting on the
+    shared pool from inside it can exhaust the workers.
+
+    Args:
+        calls: Callables taking no arguments
+
+    Returns:
+        Results in the same order as the calls. The first exception raised
+        by a call is re-raised.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+
+    futures = [_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
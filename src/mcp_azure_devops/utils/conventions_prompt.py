@@ -0,0 +1,74 @@
+from typing import Callable, Dict, Tuple
+
+from mcp.server.fastmcp import FastMCP
+
+# Returned verbatim on every prompt request, so it is built once
+_CONVENTIONS_TEMPLATE = """Create a concise Azure DevOps conventions file to 
+    serve as a quick reference for our environment. 
+    This should capture all important patterns and structures 
+    while remaining compact enough for an LLM context.
+
+Using the available Azure DevOps tools, please:
+
+1. Call get_conventions_bundle once to gather ALL projects, their teams,
+   each team's area paths and iterations, process details, and the
+   fields of every work item type in a single request
+2. From the bundle, clearly identify mandatory fields and
+   note differences in processes between projects
+3. Only call the individual tools (get_projects, get_all_teams, 
+   get_team_area_paths, get_team_iterations, get_process_details, 
+   get_work_item_type_fields) to fill gaps the bundle reports as errors
+
+Create a concise markdown document with these sections:
+
+1. **Projects and Teams**: 
+    List of all projects and their teams
+2. **Work Item Types by Process**: 
+    Work item types grouped by process template, 
+    including ALL fields for each type with mandatory fields clearly marked
+3. **Classification Structure**: 
+    Area paths and iterations for each team, 
+    with team-specific structures and patterns
+4. **Naming Conventions**: 
+    Observed naming patterns across projects, teams, and items
+
+Focus on identifying and documenting patterns and 
+variations between projects. 
+When listing field names or other details, prioritize the most important ones.
+The goal is to create a reference that captures key conventions 
+while staying concise."""
+
+
+def create_conventions_file() -> str:
+    """
+    Create a starting conventions file for Azure DevOps.
+    
+    Use this prompt when you need to:
+    - Generate a conventions file for Azure DevOps
+    - Get a template for project conventions
+    - Start defining project standards and guidelines
+    
+    Returns:
+        A formatted conventions file template
+    """
+    return _CONVENTIONS_TEMPLATE
+
+
+# Prompts served by the server: name -> (description, prompt function)
+_PROMPTS: Dict[str, Tuple[str, Callable[[], str]]] = {
+    "Create Conventions File": (
+        "Create a starting conventions file Azure DevOps",
+        create_conventions_file,
+    ),
+}
+
+
+def register_prompt(mcp: FastMCP) -> None:
+    """
+    Register the prompts with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    for name, (description, prompt) in _PROMPTS.items():
+        mcp.prompt(name=name, description=description)(prompt)
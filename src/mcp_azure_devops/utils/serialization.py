@@ -0,0 +1,27 @@
+"""
+Serialization utilities for Azure DevOps SDK models.
+
+This module provides helpers for returning SDK objects as JSON instead of
+markdown.
+"""
+import json
+from typing import Iterable, Literal
+
+from msrest.serialization import Model
+
+# Output formats of tools that can return JSON instead of markdown
+OutputFormat = Literal["text", "json"]
+
+
+def models_to_json(models: Iterable[Model]) -> str:
+    """
+    Serialize SDK models to a JSON array.
+    
+    Args:
+        models: SDK model objects, e.g. projects or teams
+        
+    Returns:
+        JSON string with one object per model, using the SDK's attribute
+        names
+    """
+    return json.dumps([model.as_dict() for model in models or []])
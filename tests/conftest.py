@@ -0,0 +1,26 @@
+import pytest
+
+from mcp_azure_devops.utils.azure_client import get_credentials
+from mcp_azure_devops.utils.cache import clear_memory_caches
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep persistent caches out of the user's real cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Start every test without responses cached by an earlier test.
+    
+    Caches that depend only on their arguments, such as the lru_cache on
+    create._field_path, cannot leak state between tests and are kept.
+    """
+    get_credentials.cache_clear()
+    clear_memory_caches()
+    yield
+    get_credentials.cache_clear()
+    clear_memory_caches()
@@ -0,0 +1,177 @@
+import functools
+import threading
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.core.models import TeamProject, WebApiTeam
+from azure.devops.v7_1.work_item_tracking.models import (
+    WorkItemType,
+    WorkItemTypeFieldInstance,
+)
+
+from mcp_azure_devops.features.conventions import tools
+from mcp_azure_devops.features.conventions.tools import (
+    _get_conventions_bundle_impl,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _spec_names(spec):
+    """List the attribute names of an SDK model once per class."""
+    return dir(spec)
+
+
+def _named(spec, name, **attributes):
+    """Create a mock SDK model with a name."""
+    # A list of names skips introspecting the class for every mock
+    model = MagicMock(spec=_spec_names(spec))
+    model.name = name
+    for attribute, value in attributes.items():
+        setattr(model, attribute, value)
+    return model
+
+
+def test_get_conventions_bundle_impl(monkeypatch):
+    """Test the bundle fans out once per team, process and type."""
+    core_client = MagicMock()
+    work_client = MagicMock()
+    wit_client = MagicMock()
+    process_client = MagicMock()
+    
+    core_client.get_projects.return_value = [
+        _named(TeamProject, "Project A", id="proj-a"),
+        _named(TeamProject, "Project B", id="proj-b"),
+    ]
+    core_client.get_teams.side_effect = lambda project_id: [
+        _named(WebApiTeam, f"Team {project_id}")]
+    wit_client.get_work_item_types.return_value = [
+        _named(WorkItemType, "Bug", reference_name="System.Bug",
+               fields=None)]
+    
+    title = MagicMock(reference_name="System.Title", type="string",
+                      required=True, read_only=False)
+    title.name = "Title"
+    process_client.get_all_work_item_type_fields.return_value = [title]
+    
+    # Both projects use the same process
+    threads = set()
+    
+    def process_id_for(project):
+        threads.add(threading.current_thread().name)
+        return "process-1"
+    
+    monkeypatch.setattr(tools, "_process_id_for", process_id_for)
+    details_clients = []
+    
+    def get_process_details(process_id, client):
+        details_clients.append(client)
+        return f"# Process: {process_id}"
+    
+    monkeypatch.setattr(tools, "_get_process_details_impl",
+                        get_process_details)
+    monkeypatch.setattr(tools, "_get_team_area_paths_impl",
+                        lambda client, project, team: f"Areas of {team}")
+    monkeypatch.setattr(tools, "_get_team_iterations_impl",
+                        lambda client, project, team: f"Sprints of {team}")
+    
+    result = _get_conventions_bundle_impl(
+        core_client, work_client, wit_client, process_client)
+    
+    assert "### Project A\nProcess ID: process-1\nTeams: Team proj-a" in result
+    assert "### Project B / Team proj-b\nAreas of Team proj-b" in result
+    assert "Sprints of Team proj-a" in result
+    assert result.count("# Process: process-1") == 1
+    assert details_clients == [process_client]
+    assert "# Fields for Work Item Type: Bug" in result
+    assert "| Title | System.Title | string | Yes | No |" in result
+    process_client.get_all_work_item_type_fields.assert_called_once_with(
+        "process-1", "System.Bug")
+    assert all(name.startswith("azure-devops") for name in threads)
+
+
+def test_get_conventions_bundle_impl_uses_listed_type_fields(monkeypatch):
+    """Test fields listed with the types need no request per type."""
+    core_client = MagicMock()
+    process_client = MagicMock()
+    wit_client = MagicMock()
+    
+    core_client.get_project.return_value = _named(
+        TeamProject, "Project A", id="proj-a")
+    core_client.get_teams.return_value = []
+    wit_client.get_work_item_types.return_value = [
+        _named(WorkItemType, name, reference_name=f"System.{name}",
+               fields=[WorkItemTypeFieldInstance(
+                   name="Title", reference_name="System.Title",
+                   always_required=True)])
+        for name in ("Bug", "Task")
+    ]
+    monkeypatch.setattr(tools, "_process_id_for", lambda project: "p-1")
+    monkeypatch.setattr(tools, "_get_process_details_impl",
+                        lambda process_id, client: "# Process: Agile")
+    
+    result = _get_conventions_bundle_impl(
+        core_client, MagicMock(), wit_client, process_client, "Project A")
+    
+    process_client.get_all_work_item_type_fields.assert_not_called()
+    assert "# Fields for Work Item Type: Task" in result
+    assert "| Title | System.Title | Yes |" in result
+
+
+def test_get_conventions_bundle_impl_reports_failed_sections(monkeypatch):
+    """Test a failing request is reported in its section only."""
+    core_client = MagicMock()
+    wit_client = MagicMock()
+    
+    core_client.get_projects.return_value = [
+        _named(TeamProject, "Project A", id="proj-a"),
+        _named(TeamProject, "Project B", id="proj-b"),
+    ]
+    
+    def get_teams(project_id):
+        if project_id == "proj-a":
+            raise Exception("Access denied")
+        return [_named(WebApiTeam, "Team B")]
+    
+    core_client.get_teams.side_effect = get_teams
+    wit_client.get_work_item_types.return_value = [
+        _named(WorkItemType, "Bug", reference_name="System.Bug",
+               fields=[WorkItemTypeFieldInstance(
+                   name="Title", reference_name="System.Title",
+                   always_required=True)])]
+    monkeypatch.setattr(tools, "_process_id_for", lambda project: "p-1")
+    monkeypatch.setattr(tools, "_get_process_details_impl",
+                        lambda process_id, client: "# Process: Agile")
+    monkeypatch.setattr(tools, "_get_team_area_paths_impl",
+                        lambda client, project, team: f"Areas of {team}")
+    
+    def get_team_iterations(client, project, team):
+        raise Exception("Team not found")
+    
+    monkeypatch.setattr(tools, "_get_team_iterations_impl",
+                        get_team_iterations)
+    
+    result = _get_conventions_bundle_impl(
+        core_client, MagicMock(), wit_client, MagicMock())
+    
+    assert ("### Project A\nProcess ID: p-1\n"
+            "Teams: Error retrieving teams of Project A: Access denied"
+            in result)
+    assert "### Project B\nProcess ID: p-1\nTeams: Team B" in result
+    assert ("### Project B / Team B\nAreas of Team B\n\n"
+            "Error retrieving iterations of Project B / Team B: "
+            "Team not found" in result)
+    assert "# Process: Agile" in result
+    assert "# Fields for Work Item Type: Bug" in result
+    assert not result.startswith("Error retrieving conventions bundle")
+
+
+def test_get_conventions_bundle_impl_single_project():
+    """Test the bundle can be limited to one project."""
+    core_client = MagicMock()
+    core_client.get_project.return_value = None
+    
+    result = _get_conventions_bundle_impl(
+        core_client, MagicMock(), MagicMock(), MagicMock(), "Missing")
+    
+    core_client.get_project.assert_called_once_with("Missing")
+    core_client.get_projects.assert_not_called()
+    assert result == "No projects found."
@@ -1,3 +1,5 @@
+import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 from azure.devops.v7_1.core.models import TeamProjectReference
@@ -10,18 +12,20 @@ def test_get_projects_impl_with_results():
     mock_client = MagicMock()
     
     # Mock project results
-    mock_project1 = MagicMock(spec=TeamProjectReference)
-    mock_project1.name = "Project 1"
-    mock_project1.id = "proj-id-1"
-    mock_project1.description = "This is project 1"
-    mock_project1.state = "wellFormed"
-    mock_project1.visibility = "private"
-    mock_project1.url = "https://dev.azure.com/test/project1"
-    
-    mock_project2 = MagicMock(spec=TeamProjectReference)
-    mock_project2.name = "Project 2"
-    mock_project2.id = "proj-id-2"
-    mock_project2.state = "wellFormed"
+    mock_project1 = SimpleNamespace(
+        name="Project 1",
+        id="proj-id-1",
+        description="This is project 1",
+        state="wellFormed",
+        visibility="private",
+        url="https://dev.azure.com/test/project1",
+    )
+    
+    mock_project2 = SimpleNamespace(
+        name="Project 2",
+        id="proj-id-2",
+        state="wellFormed",
+    )
     
     mock_client.get_projects.return_value = [mock_project1, mock_project2]
     
@@ -62,9 +66,10 @@ def test_get_projects_impl_with_filters():
     mock_client = MagicMock()
     
     # Mock project results
-    mock_project = MagicMock(spec=TeamProjectReference)
-    mock_project.name = "Filtered Project"
-    mock_project.id = "proj-id-filtered"
+    mock_project = SimpleNamespace(
+        name="Filtered Project",
+        id="proj-id-filtered",
+    )
     
     mock_client.get_projects.return_value = [mock_project]
     
@@ -76,3 +81,32 @@ def test_get_projects_impl_with_filters():
     
     # Check result contains the filtered project
     assert "# Project: Filtered Project" in result
+
+
+def test_get_projects_impl_reuses_recent_results():
+    """Test projects are fetched once until a refresh is requested."""
+    mock_client = MagicMock()
+    mock_project = SimpleNamespace(name="Project 1", id="proj-id-1")
+    mock_client.get_projects.return_value = [mock_project]
+    
+    first = _get_projects_impl(mock_client, top=10)
+    assert _get_projects_impl(mock_client, top=10) == first
+    mock_client.get_projects.assert_called_once_with(
+        state_filter=None, top=10)
+    
+    _get_projects_impl(mock_client, top=10, refresh=True)
+    assert mock_client.get_projects.call_count == 2
+
+
+def test_get_projects_impl_json_output():
+    """Test projects can be returned as JSON instead of markdown."""
+    mock_client = MagicMock()
+    mock_client.get_projects.return_value = [
+        TeamProjectReference(id="proj-id-1", name="Project 1",
+                             state="wellFormed")
+    ]
+    
+    result = _get_projects_impl(mock_client, output_format="json")
+    
+    assert json.loads(result) == [
+        {"id": "proj-id-1", "name": "Project 1", "state": "wellFormed"}]
@@ -1,11 +1,8 @@
+import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from azure.devops.v7_1.core.models import IdentityRef, TeamMember, WebApiTeam
-from azure.devops.v7_1.work.models import (
-    TeamFieldValues,
-    TeamIterationAttributes,
-    TeamSettingsIteration,
-)
+from azure.devops.v7_1.core.models import WebApiTeam
 
 from mcp_azure_devops.features.teams.tools import (
     _get_all_teams_impl,
@@ -21,18 +18,20 @@ def test_get_all_teams_impl_with_results():
     mock_client = MagicMock()
     
     # Mock team results
-    mock_team1 = MagicMock(spec=WebApiTeam)
-    mock_team1.name = "Team 1"
-    mock_team1.id = "team-id-1"
-    mock_team1.description = "This is team 1"
-    mock_team1.project_name = "Project 1"
-    mock_team1.project_id = "proj-id-1"
-    
-    mock_team2 = MagicMock(spec=WebApiTeam)
-    mock_team2.name = "Team 2"
-    mock_team2.id = "team-id-2"
-    mock_team2.project_name = "Project 2"
-    mock_team2.project_id = "proj-id-2"
+    mock_team1 = SimpleNamespace(
+        name="Team 1",
+        id="team-id-1",
+        description="This is team 1",
+        project_name="Project 1",
+        project_id="proj-id-1",
+    )
+    
+    mock_team2 = SimpleNamespace(
+        name="Team 2",
+        id="team-id-2",
+        project_name="Project 2",
+        project_id="proj-id-2",
+    )
     
     mock_client.get_all_teams.return_value = [mock_team1, mock_team2]
     
@@ -73,9 +72,7 @@ def test_get_all_teams_impl_with_filters():
     mock_client = MagicMock()
     
     # Mock team results
-    mock_team = MagicMock(spec=WebApiTeam)
-    mock_team.name = "Filtered Team"
-    mock_team.id = "team-id-filtered"
+    mock_team = SimpleNamespace(name="Filtered Team", id="team-id-filtered")
     
     mock_client.get_all_teams.return_value = [mock_team]
     
@@ -90,24 +87,47 @@ def test_get_all_teams_impl_with_filters():
     # Check result contains the filtered team
     assert "# Team: Filtered Team" in result
 
+def test_get_all_teams_impl_reuses_recent_results():
+    """Test teams are fetched once per filter until refreshed."""
+    mock_client = MagicMock()
+    mock_team = SimpleNamespace(name="Team 1", id="team-id-1")
+    mock_client.get_all_teams.return_value = [mock_team]
+    
+    _get_all_teams_impl(mock_client, top=5)
+    _get_all_teams_impl(mock_client, top=5)
+    assert mock_client.get_all_teams.call_count == 1
+    
+    _get_all_teams_impl(mock_client, top=10)
+    _get_all_teams_impl(mock_client, top=5, refresh=True)
+    assert mock_client.get_all_teams.call_count == 3
+
+def test_get_all_teams_impl_json_output():
+    """Test teams can be returned as JSON instead of markdown."""
+    mock_client = MagicMock()
+    mock_client.get_all_teams.return_value = [
+        WebApiTeam(id="team-id-1", name="Team 1", project_name="Project 1")
+    ]
+    
+    result = _get_all_teams_impl(mock_client, output_format="json")
+    
+    assert json.loads(result) == [
+        {"id": "team-id-1", "name": "Team 1", "project_name": "Project 1"}]
+
 # Tests for _get_team_members_impl
 def test_get_team_members_impl_with_results():
     """Test getting team members with results."""
     mock_client = MagicMock()
     
     # Mock team member results
-    mock_member1 = MagicMock(spec=TeamMember)
-    mock_identity1 = MagicMock(spec=IdentityRef)
-    mock_identity1.display_name = "Member 1"
-    mock_identity1.unique_name = "member1@example.com"
-    mock_identity1.id = "member-id-1"
-    mock_member1.identity = mock_identity1
-    
-    mock_member2 = MagicMock(spec=TeamMember)
-    mock_identity2 = MagicMock(spec=IdentityRef)
-    mock_identity2.display_name = "Member 2"
-    mock_identity2.id = "member-id-2"
-    mock_member2.identity = mock_identity2
+    mock_identity1 = SimpleNamespace(
+        display_name="Member 1",
+        unique_name="member1@example.com",
+        id="member-id-1",
+    )
+    mock_member1 = SimpleNamespace(identity=mock_identity1)
+    
+    mock_identity2 = SimpleNamespace(display_name="Member 2", id="member-id-2")
+    mock_member2 = SimpleNamespace(identity=mock_identity2)
     
     mock_client.get_team_members_with_extended_properties.return_value = [
         mock_member1, mock_member2]
@@ -149,21 +169,23 @@ def test_get_team_area_paths_impl_with_results():
     """Test getting team area paths with results."""
     mock_client = MagicMock()
     
-    # Mock area path results
-    mock_area_paths = MagicMock(spec=TeamFieldValues)
-    mock_area_paths.default_value = "Project\\Area"
-    
     # Create TeamFieldValue objects instead of strings
-    mock_area_path1 = MagicMock()
-    mock_area_path1.value = "Project\\Area\\SubArea1"
-    mock_area_path1.include_children = True
+    mock_area_path1 = SimpleNamespace(
+        value="Project\\Area\\SubArea1",
+        include_children=True,
+    )
     
-    mock_area_path2 = MagicMock()
-    mock_area_path2.value = "Project\\Area\\SubArea2"
-    mock_area_path2.include_children = False
+    mock_area_path2 = SimpleNamespace(
+        value="Project\\Area\\SubArea2",
+        include_children=False,
+    )
     
-    mock_area_paths.values = [mock_area_path1, mock_area_path2]
-    mock_area_paths.field = {"referenceName": "System.AreaPath"}
+    # Mock area path results
+    mock_area_paths = SimpleNamespace(
+        default_value="Project\\Area",
+        values=[mock_area_path1, mock_area_path2],
+        field={"referenceName": "System.AreaPath"},
+    )
     
     mock_client.get_team_field_values.return_value = mock_area_paths
     
@@ -201,23 +223,24 @@ def test_get_team_iterations_impl_with_results():
     """Test getting team iterations with results."""
     mock_client = MagicMock()
     
-    # Mock iteration results
-    mock_iteration1 = MagicMock(spec=TeamSettingsIteration)
-    mock_iteration1.name = "Sprint 1"
-    mock_iteration1.id = "iter-id-1"
-    mock_iteration1.path = "Project\\Sprint 1"
-    
-    # Create attributes with proper structure
-    mock_attributes = MagicMock(spec=TeamIterationAttributes)
-    mock_attributes.start_date = "2023-01-01"
-    mock_attributes.finish_date = "2023-01-15"
-    mock_iteration1.attributes = mock_attributes
-    
-    mock_iteration2 = MagicMock(spec=TeamSettingsIteration)
-    mock_iteration2.name = "Sprint 2"
-    mock_iteration2.id = "iter-id-2"
-    mock_iteration2.path = "Project\\Sprint 2"
-    mock_iteration2.attributes = MagicMock(spec=TeamIterationAttributes)
+    # Mock iteration results, with attributes of the proper structure
+    mock_attributes = SimpleNamespace(
+        start_date="2023-01-01",
+        finish_date="2023-01-15",
+    )
+    mock_iteration1 = SimpleNamespace(
+        name="Sprint 1",
+        id="iter-id-1",
+        path="Project\\Sprint 1",
+        attributes=mock_attributes,
+    )
+    
+    mock_iteration2 = SimpleNamespace(
+        name="Sprint 2",
+        id="iter-id-2",
+        path="Project\\Sprint 2",
+        attributes=SimpleNamespace(),
+    )
     
     mock_client.get_team_iterations.return_value = [
         mock_iteration1, mock_iteration2]
@@ -259,8 +282,7 @@ def test_get_team_iterations_impl_with_current_parameter():
     mock_client = MagicMock()
     
     # Mock iteration results
-    mock_iteration = MagicMock(spec=TeamSettingsIteration)
-    mock_iteration.name = "Current Sprint"
+    mock_iteration = SimpleNamespace(name="Current Sprint")
     
     mock_client.get_team_iterations.return_value = [mock_iteration]
     
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+# Fields of a newly created bug; never mutated
+_BUG_FIELDS_NEW = {
+    "System.WorkItemType": "Bug",
+    "System.Title": "Test Bug",
+    "System.State": "New",
+    "System.TeamProject": "Test Project",
+}
+
+
+@pytest.fixture(scope="module")
+def team_context():
+    """Team context shared by the template tests; never mutated."""
+    return {"project": "TestProject", "team": "TestTeam"}
+
+
+@pytest.fixture
+def bug_work_item():
+    """A newly created bug as returned by the work item client."""
+    return SimpleNamespace(id=123, fields=_BUG_FIELDS_NEW)
+
+
+@pytest.fixture(scope="session")
+def make_work_item():
+    """Factory building work items as returned by the work item client."""
+    def make(id, fields, relations=None):
+        return WorkItem(id=id, fields=fields, relations=relations)
+    return make
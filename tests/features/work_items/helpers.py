@@ -0,0 +1,12 @@
+import re
+
+
+def assert_contains_all(text, *needles):
+    """Assert that a text contains every needle, in any order."""
+    # One lookahead per needle, all checked from the start of the text
+    pattern = re.compile(
+        "".join(f"(?=.*?{re.escape(needle)})" for needle in needles),
+        re.DOTALL)
+    if not pattern.match(text):
+        missing = [needle for needle in needles if needle not in text]
+        raise AssertionError(f"Missing: {missing}")
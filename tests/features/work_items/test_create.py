@@ -1,7 +1,9 @@
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from azure.devops.v7_1.work_item_tracking.models import WorkItem
+import pytest
 
+from mcp_azure_devops.features.work_items.tools import create
 from mcp_azure_devops.features.work_items.tools.create import (
     _add_link_to_work_item_impl,
     _build_field_document,
@@ -13,6 +15,23 @@ from mcp_azure_devops.features.work_items.tools.create import (
     _update_work_item_impl,
 )
 
+# The only client methods the create and update tools call
+_WIT_CLIENT_METHODS = ["create_work_item", "update_work_item"]
+
+# Fields of an active bug returned by the client; never mutated
+_BUG_FIELDS_ACTIVE = {
+    "System.WorkItemType": "Bug",
+    "System.Title": "Test Bug",
+    "System.State": "Active",
+    "System.TeamProject": "Test Project",
+}
+_BUG_FIELDS_UPDATED = {**_BUG_FIELDS_ACTIVE, "System.Title": "Updated Bug"}
+
+
+def _op_to_tuple(op):
+    """Reduce a JSON patch operation to a comparable (op, path, value)."""
+    return (op.op, op.path, op.value)
+
 
 def test_build_field_document():
     """Test building JSON patch document from fields dictionary."""
@@ -25,39 +44,49 @@ def test_build_field_document():
     
     document = _build_field_document(fields)
     
-    # Verify document structure
-    assert len(document) == 3
-    
-    # Check first operation
-    assert document[0].op == "add"
-    assert document[0].path == "/fields/System.Title"
-    assert document[0].value == "Test Bug"
+    assert [_op_to_tuple(op) for op in document] == [
+        ("add", "/fields/System.Title", "Test Bug"),
+        ("add", "/fields/System.Description", "This is a test bug"),
+        ("add", "/fields/System.State", "Active"),
+    ]
     
     # Test with replace operation
     document = _build_field_document(fields, "replace")
-    assert document[0].op == "replace"
+    assert _op_to_tuple(document[0]) == (
+        "replace", "/fields/System.Title", "Test Bug")
     
     # Test with field name without /fields/ prefix
     fields = {"Title": "Test Bug"}
     document = _build_field_document(fields)
     assert document[0].path == "/fields/Title"
+    
+    # Test with field name that already has the /fields/ prefix
+    fields = {"/fields/System.Tags": "tag1"}
+    document = _build_field_document(fields)
+    assert document[0].path == "/fields/System.Tags"
 
 
-@patch("mcp_azure_devops.features.work_items.tools.create.os")
-def test_get_organization_url(mock_os):
+def test_get_organization_url(monkeypatch):
     """Test retrieving organization URL from environment."""
     # Test with trailing slash
-    mock_os.environ.get.return_value = "https://dev.azure.com/org/"
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org/")
     url = _get_organization_url()
     assert url == "https://dev.azure.com/org"
     
     # Test without trailing slash
-    mock_os.environ.get.return_value = "https://dev.azure.com/org"
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
     url = _get_organization_url()
     assert url == "https://dev.azure.com/org"
     
     # Test with empty value
-    mock_os.environ.get.return_value = ""
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL", "")
+    url = _get_organization_url()
+    assert url == ""
+    
+    # Test with the variable unset
+    monkeypatch.delenv("AZURE_DEVOPS_ORGANIZATION_URL")
     url = _get_organization_url()
     assert url == ""
 
@@ -70,127 +99,75 @@ def test_build_link_document():
     
     document = _build_link_document(target_id, link_type, org_url)
     
-    # Verify document structure
-    assert len(document) == 1
-    assert document[0].op == "add"
-    assert document[0].path == "/relations/-"
-    assert document[0].value["rel"] == link_type
-    assert document[0].value["url"] == "https://dev.azure.com/org/_apis/wit/workItems/123"
+    assert [_op_to_tuple(op) for op in document] == [
+        ("add", "/relations/-", {
+            "rel": link_type,
+            "url": "https://dev.azure.com/org/_apis/wit/workItems/123",
+        }),
+    ]
 
 
-def test_create_work_item_impl():
-    """Test creating a work item."""
-    # Arrange
-    mock_client = MagicMock()
-    
-    # Create mock for new work item
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.id = 123
-    mock_work_item.fields = {
-        "System.WorkItemType": "Bug",
-        "System.Title": "Test Bug",
-        "System.State": "New",
-        "System.TeamProject": "Test Project",
-    }
-    
-    mock_client.create_work_item.return_value = mock_work_item
-    
-    # Fields to create work item
+def _create_bug(wit_client, **kwargs):
+    """Create a bug with a title and description through the client."""
     fields = {
         "System.Title": "Test Bug",
         "System.Description": "This is a test bug",
     }
+    result = _create_work_item_impl(fields=fields, project="Test Project",
+                                    work_item_type="Bug",
+                                    wit_client=wit_client, **kwargs)
     
-    # Act
-    result = _create_work_item_impl(
-        fields=fields,
-        project="Test Project",
-        work_item_type="Bug",
-        wit_client=mock_client
-    )
-    
-    # Assert
-    mock_client.create_work_item.assert_called_once()
+    calls = wit_client.create_work_item.call_args_list
+    assert len(calls) == 1
     assert "# Work Item 123" in result
-    assert "**System.WorkItemType**: Bug" in result
     assert "**System.Title**: Test Bug" in result
+    return result, calls[0]
+
+
+def test_create_work_item_impl(bug_work_item):
+    """Test creating a work item."""
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
+    mock_client.create_work_item.return_value = bug_work_item
+    
+    result, (args, kwargs) = _create_bug(mock_client)
+    
+    assert "**System.WorkItemType**: Bug" in result
     assert "**System.State**: New" in result
     
     # Verify document passed to create_work_item
-    args, kwargs = mock_client.create_work_item.call_args
     document = kwargs.get("document") or args[0]
     assert len(document) == 2  # Two fields in our test
     assert kwargs.get("project") == "Test Project"
     assert kwargs.get("type") == "Bug"
+    mock_client.update_work_item.assert_not_called()
 
 
-@patch("mcp_azure_devops.features.work_items.tools.create._get_organization_url")
-def test_create_work_item_impl_with_parent(mock_get_org_url):
+def test_create_work_item_impl_with_parent(monkeypatch, bug_work_item):
     """Test creating a work item with parent relationship."""
-    # Arrange
-    mock_client = MagicMock()
-    
-    # Create mock for new work item
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.id = 123
-    mock_work_item.fields = {
-        "System.WorkItemType": "Bug",
-        "System.Title": "Test Bug",
-        "System.State": "New",
-        "System.TeamProject": "Test Project",
-    }
-    
-    # Setup organization URL
-    mock_get_org_url.return_value = "https://dev.azure.com/org"
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
+    mock_client.create_work_item.return_value = bug_work_item
+    mock_client.update_work_item.return_value = bug_work_item
+    monkeypatch.setattr(create, "_get_organization_url",
+                        lambda: "https://dev.azure.com/org")
     
-    # Setup mock returns for create and update
-    mock_client.create_work_item.return_value = mock_work_item
-    mock_client.update_work_item.return_value = mock_work_item
-    
-    # Fields to create work item
-    fields = {
-        "System.Title": "Test Bug",
-        "System.Description": "This is a test bug",
-    }
-    
-    # Act
-    result = _create_work_item_impl(
-        fields=fields,
-        project="Test Project",
-        work_item_type="Bug",
-        wit_client=mock_client,
-        parent_id=456
-    )
-    
-    # Assert
-    mock_client.create_work_item.assert_called_once()
-    mock_client.update_work_item.assert_called_once()
+    _create_bug(mock_client, parent_id=456)
     
     # Verify update_work_item was called with link document
-    args, kwargs = mock_client.update_work_item.call_args
+    calls = mock_client.update_work_item.call_args_list
+    assert len(calls) == 1
+    args, kwargs = calls[0]
     document = kwargs.get("document") or args[0]
     assert document[0].path == "/relations/-"
     assert document[0].value["rel"] == "System.LinkTypes.Hierarchy-Reverse"
-    
-    # Check result formatting
-    assert "# Work Item 123" in result
-    assert "**System.Title**: Test Bug" in result
 
 
 def test_update_work_item_impl():
     """Test updating a work item."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     
     # Create mock for updated work item
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.id = 123
-    mock_work_item.fields = {
-        "System.WorkItemType": "Bug",
-        "System.Title": "Updated Bug",
-        "System.State": "Active",
-        "System.TeamProject": "Test Project",
-    }
+    mock_work_item = SimpleNamespace(id=123, fields=_BUG_FIELDS_UPDATED)
     
     mock_client.update_work_item.return_value = mock_work_item
     
@@ -209,14 +186,15 @@ def test_update_work_item_impl():
     )
     
     # Assert
-    mock_client.update_work_item.assert_called_once()
+    calls = mock_client.update_work_item.call_args_list
+    assert len(calls) == 1
     assert "# Work Item 123" in result
     assert "**System.Title**: Updated Bug" in result
     assert "**System.WorkItemType**: Bug" in result
     assert "**System.State**: Active" in result
     
     # Verify document passed to update_work_item
-    args, kwargs = mock_client.update_work_item.call_args
+    args, kwargs = calls[0]
     document = kwargs.get("document") or args[0]
     assert len(document) == 2  # Two fields in our test
     # All operations should be replace
@@ -225,40 +203,34 @@ def test_update_work_item_impl():
     assert kwargs.get("project") == "Test Project"
 
 
-def test_add_link_to_work_item_impl():
+def test_add_link_to_work_item_impl(monkeypatch):
     """Test adding a link between work items."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     
     # Create mock for updated work item
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.id = 123
-    mock_work_item.fields = {
-        "System.WorkItemType": "Bug",
-        "System.Title": "Test Bug",
-        "System.State": "Active",
-        "System.TeamProject": "Test Project",
-    }
+    mock_work_item = SimpleNamespace(id=123, fields=_BUG_FIELDS_ACTIVE)
     
     mock_client.update_work_item.return_value = mock_work_item
     
-    # Act with patch for organization URL
-    with patch(
-        "mcp_azure_devops.features.work_items.tools.create._get_organization_url",
-        return_value="https://dev.azure.com/org"):
-        result = _add_link_to_work_item_impl(
-            source_id=123,
-            target_id=456,
-            link_type="System.LinkTypes.Hierarchy-Reverse",
-            wit_client=mock_client,
-            project="Test Project"
-        )
+    monkeypatch.setattr(create, "_get_organization_url",
+                        lambda: "https://dev.azure.com/org")
+    
+    # Act
+    result = _add_link_to_work_item_impl(
+        source_id=123,
+        target_id=456,
+        link_type="System.LinkTypes.Hierarchy-Reverse",
+        wit_client=mock_client,
+        project="Test Project"
+    )
     
     # Assert
-    mock_client.update_work_item.assert_called_once()
+    calls = mock_client.update_work_item.call_args_list
+    assert len(calls) == 1
     
     # Verify document passed to update_work_item
-    args, kwargs = mock_client.update_work_item.call_args
+    args, kwargs = calls[0]
     document = kwargs.get("document") or args[0]
     assert document[0].path == "/relations/-"
     assert document[0].value["rel"] == "System.LinkTypes.Hierarchy-Reverse"
@@ -270,61 +242,45 @@ def test_add_link_to_work_item_impl():
     assert "**System.State**: Active" in result
 
 
-def test_prepare_standard_fields():
+@pytest.mark.parametrize("kwargs, expected", [
+    # All fields specified
+    (dict(title="Test Bug", description="This is a test bug",
+          state="Active", assigned_to="user@example.com",
+          iteration_path="Project\\Sprint 1", area_path="Project\\Area",
+          story_points=5.5, priority=1, tags="tag1; tag2"),
+     {"System.Title": "Test Bug",
+      "System.Description": "This is a test bug",
+      "System.State": "Active",
+      "System.AssignedTo": "user@example.com",
+      "System.IterationPath": "Project\\Sprint 1",
+      "System.AreaPath": "Project\\Area",
+      "Microsoft.VSTS.Scheduling.StoryPoints": "5.5",
+      "Microsoft.VSTS.Common.Priority": "1",
+      "System.Tags": "tag1; tag2"}),
+    # Subset of fields
+    (dict(title="Test Bug", state="Active"),
+     {"System.Title": "Test Bug", "System.State": "Active"}),
+], ids=["all_fields", "subset"])
+def test_prepare_standard_fields(kwargs, expected):
     """Test preparing standard fields dictionary."""
-    # Test with all fields specified
-    fields = _prepare_standard_fields(
-        title="Test Bug",
-        description="This is a test bug",
-        state="Active",
-        assigned_to="user@example.com",
-        iteration_path="Project\\Sprint 1",
-        area_path="Project\\Area",
-        story_points=5.5,
-        priority=1,
-        tags="tag1; tag2"
-    )
-    
-    # Verify fields
-    assert fields["System.Title"] == "Test Bug"
-    assert fields["System.Description"] == "This is a test bug"
-    assert fields["System.State"] == "Active"
-    assert fields["System.AssignedTo"] == "user@example.com"
-    assert fields["System.IterationPath"] == "Project\\Sprint 1"
-    assert fields["System.AreaPath"] == "Project\\Area"
-    assert fields["Microsoft.VSTS.Scheduling.StoryPoints"] == "5.5"
-    assert fields["Microsoft.VSTS.Common.Priority"] == "1"
-    assert fields["System.Tags"] == "tag1; tag2"
-    
-    # Test with subset of fields
-    fields = _prepare_standard_fields(
-        title="Test Bug",
-        state="Active"
-    )
-    
-    assert len(fields) == 2
-    assert "System.Title" in fields
-    assert "System.State" in fields
-    assert "System.Description" not in fields
+    assert _prepare_standard_fields(**kwargs) == expected
 
 
-def test_ensure_system_prefix():
+@pytest.mark.parametrize("field_name, expected", [
+    # Already prefixed fields
+    ("System.Title", "System.Title"),
+    ("Microsoft.VSTS.Common.Priority", "Microsoft.VSTS.Common.Priority"),
+    # Common short names
+    ("title", "System.Title"),
+    ("description", "System.Description"),
+    ("assignedTo", "System.AssignedTo"),
+    ("iterationPath", "System.IterationPath"),
+    ("area_path", "System.AreaPath"),
+    ("storyPoints", "Microsoft.VSTS.Scheduling.StoryPoints"),
+    ("priority", "Microsoft.VSTS.Common.Priority"),
+    # Unknown fields are returned as is
+    ("CustomField", "CustomField"),
+])
+def test_ensure_system_prefix(field_name, expected):
     """Test ensuring field names have proper prefix."""
-    # Test with already prefixed fields
-    assert _ensure_system_prefix("System.Title") == "System.Title"
-    assert (_ensure_system_prefix("Microsoft.VSTS.Common.Priority") == 
-            "Microsoft.VSTS.Common.Priority")
-    
-    # Test with common short names
-    assert _ensure_system_prefix("title") == "System.Title"
-    assert _ensure_system_prefix("description") == "System.Description"
-    assert _ensure_system_prefix("assignedTo") == "System.AssignedTo"
-    assert _ensure_system_prefix("iterationPath") == "System.IterationPath"
-    assert _ensure_system_prefix("area_path") == "System.AreaPath"
-    assert (_ensure_system_prefix("storyPoints") == 
-            "Microsoft.VSTS.Scheduling.StoryPoints")
-    assert (_ensure_system_prefix("priority") == 
-            "Microsoft.VSTS.Common.Priority")
-    
-    # Test with unknown field - should return as is
-    assert _ensure_system_prefix("CustomField") == "CustomField"
+    assert _ensure_system_prefix(field_name) == expected
@@ -1,5 +1,10 @@
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import pytest
+from azure.devops.v7_1.work_item_tracking_process.models import ProcessInfo
+
+from mcp_azure_devops.features.work_items.tools import process
 from mcp_azure_devops.features.work_items.tools.process import (
     _get_process_details_impl,
     _get_project_process_id_impl,
@@ -7,15 +12,23 @@ from mcp_azure_devops.features.work_items.tools.process import (
 )
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_core_client")
-def test_get_project_process_id_impl(mock_get_core_client):
+@pytest.fixture(autouse=True)
+def process_clients(monkeypatch):
+    """Stub the core and process clients the process tools fetch."""
+    core_client, process_client = Mock(), Mock()
+    monkeypatch.setattr(process, "get_core_client", lambda: core_client)
+    monkeypatch.setattr(process, "get_work_item_tracking_process_client",
+                        lambda: process_client)
+    return core_client, process_client
+
+
+def test_get_project_process_id_impl(process_clients):
     """Test retrieving project process ID."""
     # Arrange
-    mock_core_client = MagicMock()
-    mock_get_core_client.return_value = mock_core_client
+    mock_core_client, _ = process_clients
     
     # Mock project details
-    mock_project = MagicMock()
+    mock_project = Mock()
     mock_project.name = "Test Project"
     mock_project.capabilities = {
         "processTemplate": {
@@ -30,8 +43,10 @@ def test_get_project_process_id_impl(mock_get_core_client):
     result = _get_project_process_id_impl("Test Project")
     
     # Assert
-    mock_core_client.get_project.assert_called_once_with(
-        "Test Project", include_capabilities=True)
+    get_project = mock_core_client.get_project
+    assert get_project.call_count == 1
+    assert get_project.call_args.args == ("Test Project",)
+    assert get_project.call_args.kwargs == {"include_capabilities": True}
     
     # Check result formatting
     assert "Process for Project: Test Project" in result
@@ -39,15 +54,13 @@ def test_get_project_process_id_impl(mock_get_core_client):
     assert "Process ID: process-id-123" in result
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_core_client")
-def test_get_project_process_id_impl_no_process(mock_get_core_client):
+def test_get_project_process_id_impl_no_process(process_clients):
     """Test retrieving project process ID when no process is found."""
     # Arrange
-    mock_core_client = MagicMock()
-    mock_get_core_client.return_value = mock_core_client
+    mock_core_client, _ = process_clients
     
     # Mock project details with no process
-    mock_project = MagicMock()
+    mock_project = Mock()
     mock_project.name = "Test Project"
     mock_project.capabilities = {
         "processTemplate": {}  # Empty process template
@@ -62,12 +75,10 @@ def test_get_project_process_id_impl_no_process(mock_get_core_client):
     assert "Could not determine process ID for project Test Project" in result
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_core_client")
-def test_get_project_process_id_impl_error(mock_get_core_client):
+def test_get_project_process_id_impl_error(process_clients):
     """Test error handling in get_project_process_id_impl."""
     # Arrange
-    mock_core_client = MagicMock()
-    mock_get_core_client.return_value = mock_core_client
+    mock_core_client, _ = process_clients
     
     # Simulate error
     mock_core_client.get_project.side_effect = Exception("Test error")
@@ -80,75 +91,78 @@ def test_get_project_process_id_impl_error(mock_get_core_client):
             "Test error" in result)
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client")
-def test_get_process_details_impl(mock_get_process_client):
+def test_get_process_details_impl(process_clients):
     """Test retrieving process details."""
     # Arrange
-    mock_process_client = MagicMock()
-    mock_get_process_client.return_value = mock_process_client
-    
-    # Mock process
-    mock_process = MagicMock()
-    mock_process.name = "Agile"
-    mock_process.reference_name = "Agile"
-    mock_process.type_id = "process-id-123"
-    mock_process.description = "Agile process template"
-    
-    # Mock process properties
-    mock_properties = MagicMock()
-    mock_properties.is_default = True
-    mock_properties.is_enabled = True
-    mock_process.properties = mock_properties
-    
-    # Mock work item types
-    mock_wit_type1 = MagicMock()
-    mock_wit_type1.name = "Bug"
-    mock_wit_type1.reference_name = "System.Bug"
-    mock_wit_type1.description = "Represents a bug or defect"
-    
-    mock_wit_type2 = MagicMock()
-    mock_wit_type2.name = "Task"
-    mock_wit_type2.reference_name = "System.Task"
-    mock_wit_type2.description = "Represents a task item"
+    _, mock_process_client = process_clients
+    
+    mock_process = SimpleNamespace(
+        name="Agile", reference_name="Agile", type_id="process-id-123",
+        description="Agile process template",
+        properties=SimpleNamespace(is_default=True, is_enabled=True))
+    wit_types = [
+        SimpleNamespace(name=name, reference_name=reference_name,
+                        description=description)
+        for name, reference_name, description in [
+            ("Bug", "System.Bug", "Represents a bug or defect"),
+            ("Task", "System.Task", "Represents a task item"),
+        ]
+    ]
     
     mock_process_client.get_process_by_its_id.return_value = mock_process
-    mock_process_client.get_process_work_item_types.return_value = [
-        mock_wit_type1, mock_wit_type2]
+    mock_process_client.get_process_work_item_types.return_value = wit_types
     
     # Act
     result = _get_process_details_impl("process-id-123")
     
     # Assert
-    mock_process_client.get_process_by_its_id.assert_called_once_with("process-id-123")
-    mock_process_client.get_process_work_item_types.assert_called_once_with("process-id-123")
-    
-    # Check result formatting
-    assert "Process: Agile" in result
-    assert "Description: Agile process template" in result
-    assert "Reference Name: Agile" in result
-    assert "Type ID: process-id-123" in result
+    for method in (mock_process_client.get_process_by_its_id,
+                   mock_process_client.get_process_work_item_types):
+        assert method.call_count == 1
+        assert method.call_args.args == ("process-id-123",)
+        assert not method.call_args.kwargs
+    
+    # Check result formatting, reporting every missing line at once
+    lines = set(result.splitlines())
+    required = [
+        "# Process: Agile",
+        "Description: Agile process template",
+        "Reference Name: Agile",
+        "Type ID: process-id-123",
+        "## Properties",
+        "Is default: True",
+        "Is enabled: True",
+        "## Work Item Types",
+        "| Bug | System.Bug | Represents a bug or defect |",
+        "| Task | System.Task | Represents a task item |",
+    ]
+    missing = [line for line in required if line not in lines]
+    assert not missing, f"Missing: {missing}"
+
+
+def test_process_tools_show_missing_values_as_na(process_clients):
+    """Test unset attributes render as N/A instead of None."""
+    _, mock_process_client = process_clients
+    bare = SimpleNamespace(name="Custom", type_id="process-id-789",
+                           reference_name=None, description=None,
+                           properties=None)
+    mock_process_client.get_process_by_its_id.return_value = bare
+    mock_process_client.get_process_work_item_types.return_value = [
+        SimpleNamespace(name="Bug", reference_name=None, description=None)]
+    mock_process_client.get_list_of_processes.return_value = [bare]
     
-    # Check properties section
-    assert "Properties" in result
-    assert "Is default: True" in result
-    assert "Is enabled: True" in result
+    details = _get_process_details_impl("process-id-789").splitlines()
+    processes = _list_processes_impl().splitlines()
     
-    # Check work item types section
-    assert "Work Item Types" in result
-    assert "Bug" in result
-    assert "System.Bug" in result
-    assert "Represents a bug or defect" in result
-    assert "Task" in result
-    assert "System.Task" in result
-    assert "Represents a task item" in result
+    assert "Reference Name: N/A" in details
+    assert "| Bug | N/A | N/A |" in details
+    assert "| Custom | process-id-789 | N/A | N/A | No |" in processes
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client")
-def test_get_process_details_impl_not_found(mock_get_process_client):
+def test_get_process_details_impl_not_found(process_clients):
     """Test retrieving process details when process is not found."""
     # Arrange
-    mock_process_client = MagicMock()
-    mock_get_process_client.return_value = mock_process_client
+    _, mock_process_client = process_clients
     
     # Process not found
     mock_process_client.get_process_by_its_id.return_value = None
@@ -160,12 +174,24 @@ def test_get_process_details_impl_not_found(mock_get_process_client):
     assert "Process with ID 'non-existent-id' not found" in result
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client")
-def test_get_process_details_impl_error(mock_get_process_client):
+def test_get_process_details_impl_uses_given_client(process_clients):
+    """Test a client passed by the caller is used instead of the shared one."""
+    _, shared_client = process_clients
+    given_client = Mock()
+    given_client.get_process_by_its_id.return_value = None
+    
+    result = _get_process_details_impl("process-id-123", given_client)
+    
+    assert "Process with ID 'process-id-123' not found" in result
+    given_client.get_process_by_its_id.assert_called_once_with(
+        "process-id-123")
+    shared_client.get_process_by_its_id.assert_not_called()
+
+
+def test_get_process_details_impl_error(process_clients):
     """Test error handling in get_process_details_impl."""
     # Arrange
-    mock_process_client = MagicMock()
-    mock_get_process_client.return_value = mock_process_client
+    _, mock_process_client = process_clients
     
     # Simulate error
     mock_process_client.get_process_by_its_id.side_effect = Exception(
@@ -179,85 +205,63 @@ def test_get_process_details_impl_error(mock_get_process_client):
             " Test error" in result)
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client")
-def test_list_processes_impl(mock_get_process_client):
-    """Test listing all processes."""
-    # Arrange
-    mock_process_client = MagicMock()
-    mock_get_process_client.return_value = mock_process_client
-    
-    # Mock processes
-    mock_process1 = MagicMock()
-    mock_process1.name = "Agile"
-    mock_process1.type_id = "process-id-123"
-    mock_process1.reference_name = "Agile"
-    mock_process1.description = "Agile process template"
-    
-    mock_properties1 = MagicMock()
-    mock_properties1.is_default = True
-    mock_process1.properties = mock_properties1
-    
-    mock_process2 = MagicMock()
-    mock_process2.name = "Scrum"
-    mock_process2.type_id = "process-id-456"
-    mock_process2.reference_name = "Scrum"
-    mock_process2.description = "Scrum process template"
-    
-    mock_properties2 = MagicMock()
-    mock_properties2.is_default = False
-    mock_process2.properties = mock_properties2
-    
-    mock_process_client.get_list_of_processes.return_value = [
-        mock_process1, mock_process2]
-    
-    # Act
-    result = _list_processes_impl()
-    
-    # Assert
-    mock_process_client.get_list_of_processes.assert_called_once()
-    
-    # Check result formatting
-    assert "Available Processes" in result
-    assert "Agile" in result
-    assert "process-id-123" in result
-    assert "Agile process template" in result
-    assert "Yes" in result  # For is_default=True
-    assert "Scrum" in result
-    assert "process-id-456" in result
-    assert "Scrum process template" in result
-    assert "No" in result  # For is_default=False
+def test_process_tools_refresh_bypasses_disk_cache(process_clients,
+                                                  monkeypatch):
+    """Test refresh fetches processes again instead of reading the cache."""
+    _, mock_process_client = process_clients
+    monkeypatch.setattr(process, "get_credentials",
+                        lambda: ("pat", "https://dev.azure.com/org"))
+    mock_process_client.get_list_of_processes.side_effect = [
+        [ProcessInfo(name="Agile", type_id="process-id-123")],
+        [ProcessInfo(name="Agile 2", type_id="process-id-123")],
+    ]
+    mock_process_client.get_process_by_its_id.side_effect = [
+        ProcessInfo(name="Agile"), ProcessInfo(name="Agile 2")]
+    mock_process_client.get_process_work_item_types.return_value = []
+    
+    for refresh in (False, False, True):
+        _list_processes_impl(refresh)
+    assert mock_process_client.get_list_of_processes.call_count == 2
+    
+    assert "# Process: Agile" in _get_process_details_impl("process-id-123")
+    assert "# Process: Agile 2" in _get_process_details_impl(
+        "process-id-123", refresh=True)
+    assert mock_process_client.get_process_by_its_id.call_count == 2
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client")
-def test_list_processes_impl_no_processes(mock_get_process_client):
-    """Test listing processes when none exist."""
-    # Arrange
-    mock_process_client = MagicMock()
-    mock_get_process_client.return_value = mock_process_client
-    
-    # No processes
-    mock_process_client.get_list_of_processes.return_value = []
-    
-    # Act
-    result = _list_processes_impl()
-    
-    # Assert
-    assert "No processes found in the organization" in result
+# Processes returned by the process client; never mutated
+_PROCESSES = [
+    SimpleNamespace(name=name, type_id=type_id, reference_name=name,
+                    description=f"{name} process template",
+                    properties=SimpleNamespace(is_default=is_default))
+    for name, type_id, is_default in [
+        ("Agile", "process-id-123", True),
+        ("Scrum", "process-id-456", False),
+    ]
+]
 
 
-@patch("mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client")
-def test_list_processes_impl_error(mock_get_process_client):
-    """Test error handling in list_processes_impl."""
-    # Arrange
-    mock_process_client = MagicMock()
-    mock_get_process_client.return_value = mock_process_client
-    
-    # Simulate error
-    mock_process_client.get_list_of_processes.side_effect = Exception(
-        "Test error")
+@pytest.mark.parametrize("returned, side_effect, expected", [
+    (_PROCESSES, None, [
+        "# Available Processes",
+        "| Agile | process-id-123 | Agile | Agile process template | Yes |",
+        "| Scrum | process-id-456 | Scrum | Scrum process template | No |",
+    ]),
+    ([], None, ["No processes found in the organization."]),
+    (None, Exception("Test error"),
+     ["Error retrieving processes: Test error"]),
+], ids=["processes", "no_processes", "error"])
+def test_list_processes_impl(process_clients, returned, side_effect,
+                             expected):
+    """Test listing all processes, none, and the error message."""
+    _, mock_process_client = process_clients
+    mock_process_client.get_list_of_processes.return_value = returned
+    mock_process_client.get_list_of_processes.side_effect = side_effect
     
-    # Act
     result = _list_processes_impl()
     
-    # Assert
-    assert "Error retrieving processes: Test error" in result
\ No newline at end of file
+    mock_process_client.get_list_of_processes.assert_called_once()
+    # One table row per process
+    lines = set(result.splitlines())
+    missing = [line for line in expected if line not in lines]
+    assert not missing, f"Missing: {missing}"
@@ -1,46 +1,45 @@
-from unittest.mock import MagicMock
-
-from azure.devops.v7_1.work_item_tracking.models import WorkItemTemplate
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from mcp_azure_devops.features.work_items.tools.templates import (
     _get_work_item_template_impl,
     _get_work_item_templates_impl,
 )
 
+# The only client methods the template tools call
+_WIT_CLIENT_METHODS = ["get_templates", "get_template"]
+
 
-def test_get_work_item_templates_impl_with_templates():
+def test_get_work_item_templates_impl_with_templates(team_context):
     """Test retrieving work item templates."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     
     # Create mock templates
-    mock_template1 = MagicMock(spec=WorkItemTemplate)
-    mock_template1.id = "template1"
-    mock_template1.name = "Bug Template"
-    mock_template1.description = "Template for bugs"
-    mock_template1.work_item_type_name = "Bug"
-    mock_template1.fields = {
-        "System.Title": "New Bug",
-        "System.Description": "Bug description"
-    }
-    
-    mock_template2 = MagicMock(spec=WorkItemTemplate)
-    mock_template2.id = "template2"
-    mock_template2.name = "Task Template"
-    mock_template2.description = "Template for tasks"
-    mock_template2.work_item_type_name = "Task"
-    mock_template2.fields = {
-        "System.Title": "New Task",
-        "System.Description": "Task description"
-    }
+    mock_template1 = SimpleNamespace(
+        id="template1",
+        name="Bug Template",
+        description="Template for bugs",
+        work_item_type_name="Bug",
+        fields={
+            "System.Title": "New Bug",
+            "System.Description": "Bug description"
+        },
+    )
+    
+    mock_template2 = SimpleNamespace(
+        id="template2",
+        name="Task Template",
+        description="Template for tasks",
+        work_item_type_name="Task",
+        fields={
+            "System.Title": "New Task",
+            "System.Description": "Task description"
+        },
+    )
     
     mock_client.get_templates.return_value = [mock_template1, mock_template2]
     
-    team_context = {
-        "project": "TestProject",
-        "team": "TestTeam"
-    }
-    
     # Act
     result = _get_work_item_templates_impl(team_context, "Bug", mock_client)
     
@@ -57,17 +56,12 @@ def test_get_work_item_templates_impl_with_templates():
     assert "Task" in result
 
 
-def test_get_work_item_templates_impl_no_templates():
+def test_get_work_item_templates_impl_no_templates(team_context):
     """Test retrieving work item templates when none exist."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     mock_client.get_templates.return_value = []
     
-    team_context = {
-        "project": "TestProject",
-        "team": "TestTeam"
-    }
-    
     # Act
     result = _get_work_item_templates_impl(team_context, "Bug", mock_client)
     
@@ -77,30 +71,26 @@ def test_get_work_item_templates_impl_no_templates():
     assert "team TestTeam" in result
 
 
-def test_get_work_item_template_impl():
+def test_get_work_item_template_impl(team_context):
     """Test retrieving a specific work item template."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     
     # Create mock template
-    mock_template = MagicMock(spec=WorkItemTemplate)
-    mock_template.id = "template1"
-    mock_template.name = "Bug Template"
-    mock_template.description = "Template for bugs"
-    mock_template.work_item_type_name = "Bug"
-    mock_template.fields = {
-        "System.Title": "New Bug",
-        "System.Description": "Bug description",
-        "Microsoft.VSTS.Common.Priority": 2
-    }
+    mock_template = SimpleNamespace(
+        id="template1",
+        name="Bug Template",
+        description="Template for bugs",
+        work_item_type_name="Bug",
+        fields={
+            "System.Title": "New Bug",
+            "System.Description": "Bug description",
+            "Microsoft.VSTS.Common.Priority": 2
+        },
+    )
     
     mock_client.get_template.return_value = mock_template
     
-    team_context = {
-        "project": "TestProject",
-        "team": "TestTeam"
-    }
-    
     # Act
     result = _get_work_item_template_impl(
         team_context, "template1", mock_client)
@@ -120,17 +110,12 @@ def test_get_work_item_template_impl():
     assert "2" in result
 
 
-def test_get_work_item_template_impl_not_found():
+def test_get_work_item_template_impl_not_found(team_context):
     """Test retrieving a template that doesn't exist."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     mock_client.get_template.return_value = None
     
-    team_context = {
-        "project": "TestProject",
-        "team": "TestTeam"
-    }
-    
     # Act
     result = _get_work_item_template_impl(
         team_context, "non-existent", mock_client)
@@ -140,17 +125,12 @@ def test_get_work_item_template_impl_not_found():
     assert "Template with ID 'non-existent' not found" in result
 
 
-def test_get_work_item_template_impl_error_handling():
+def test_get_work_item_template_impl_error_handling(team_context):
     """Test error handling in get_work_item_template_impl."""
     # Arrange
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=_WIT_CLIENT_METHODS)
     mock_client.get_template.side_effect = Exception("Test error")
     
-    team_context = {
-        "project": "TestProject",
-        "team": "TestTeam"
-    }
-    
     # Act
     result = _get_work_item_template_impl(
         team_context, "template1", mock_client)
@@ -1,59 +1,54 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from azure.devops.v7_1.work_item_tracking.models import (
-    WorkItem,
-    WorkItemReference,
-)
-
 from mcp_azure_devops.features.work_items.tools.comments import (
     _get_work_item_comments_impl,
 )
+from mcp_azure_devops.features.work_items.tools.create import (
+    _update_work_item_impl,
+)
 from mcp_azure_devops.features.work_items.tools.query import (
+    _canonicalize_wiql,
     _query_work_items_impl,
 )
-from mcp_azure_devops.features.work_items.tools.read import _get_work_item_impl
+from mcp_azure_devops.features.work_items.tools.read import (
+    _get_work_item_impl,
+    _get_work_items_batch_impl,
+)
+from tests.features.work_items.helpers import assert_contains_all
 
 
 # Tests for _query_work_items_impl
 def test_query_work_items_impl_no_results():
     """Test query with no results."""
     mock_client = MagicMock()
-    mock_query_result = MagicMock()
-    mock_query_result.work_items = []
+    mock_query_result = SimpleNamespace(work_items=[])
     mock_client.query_by_wiql.return_value = mock_query_result
     
     result = _query_work_items_impl("SELECT * FROM WorkItems", 10, mock_client)
     assert result == "No work items found matching the query."
 
-def test_query_work_items_impl_with_results():
+def test_query_work_items_impl_with_results(make_work_item):
     """Test query with results."""
     mock_client = MagicMock()
     
     # Mock query result
-    mock_query_result = MagicMock()
-    mock_work_item_ref1 = MagicMock(spec=WorkItemReference)
-    mock_work_item_ref1.id = "123"
-    mock_work_item_ref2 = MagicMock(spec=WorkItemReference)
-    mock_work_item_ref2.id = "456"
-    mock_query_result.work_items = [mock_work_item_ref1, mock_work_item_ref2]
+    mock_query_result = SimpleNamespace(
+        work_items=[SimpleNamespace(id="123"), SimpleNamespace(id="456")])
     mock_client.query_by_wiql.return_value = mock_query_result
     
     # Mock work items
-    mock_work_item1 = MagicMock(spec=WorkItem)
-    mock_work_item1.id = 123
-    mock_work_item1.fields = {
+    mock_work_item1 = make_work_item(123, {
         "System.WorkItemType": "Bug",
         "System.Title": "Test Bug",
         "System.State": "Active"
-    }
+    })
     
-    mock_work_item2 = MagicMock(spec=WorkItem)
-    mock_work_item2.id = 456
-    mock_work_item2.fields = {
+    mock_work_item2 = make_work_item(456, {
         "System.WorkItemType": "Task",
         "System.Title": "Test Task",
         "System.State": "Closed"
-    }
+    })
     
     mock_client.get_work_items.return_value = [
         mock_work_item1, mock_work_item2]
@@ -62,49 +57,224 @@ def test_query_work_items_impl_with_results():
     
     # Check that the result contains the expected formatting 
     # per format_work_item
-    assert "# Work Item 123" in result
-    assert "- **System.WorkItemType**: Bug" in result
+    assert_contains_all(
+        result,
+        "# Work Item 123",
+        "- **System.WorkItemType**: Bug",
+        "- **System.Title**: Test Bug",
+        "- **System.State**: Active",
+        "# Work Item 456",
+        "- **System.WorkItemType**: Task",
+        "- **System.Title**: Test Task",
+        "- **System.State**: Closed",
+    )
+    
+    # Only the standard fields are requested by default, spelled out so
+    # a change to the projection is a deliberate one
+    mock_client.get_work_items.assert_called_once_with(
+        ids=[123, 456],
+        fields=[
+            "System.WorkItemType",
+            "System.Title",
+            "System.State",
+            "System.AssignedTo",
+            "System.AreaPath",
+            "System.IterationPath",
+            "System.Description",
+            "System.Tags",
+        ],
+        error_policy="omit")
+
+def test_query_work_items_impl_with_relations(make_work_item):
+    """Test query requesting relations expands instead of projecting."""
+    mock_client = MagicMock()
+    
+    mock_work_item_ref = SimpleNamespace(id="123")
+    mock_query_result = SimpleNamespace(work_items=[mock_work_item_ref])
+    mock_client.query_by_wiql.return_value = mock_query_result
+    
+    mock_work_item = make_work_item(123, {"System.Title": "Test Bug"},
+                                    relations=[])
+    mock_client.get_work_items.return_value = [mock_work_item]
+    
+    result = _query_work_items_impl(
+        "SELECT * FROM WorkItems", 10, mock_client, include_relations=True)
+    
+    mock_client.get_work_items.assert_called_once_with(
+        ids=[123], expand="all", error_policy="omit")
     assert "- **System.Title**: Test Bug" in result
-    assert "- **System.State**: Active" in result
-    assert "# Work Item 456" in result
-    assert "- **System.WorkItemType**: Task" in result
-    assert "- **System.Title**: Test Task" in result
-    assert "- **System.State**: Closed" in result
+
+def test_query_work_items_impl_with_fields(make_work_item):
+    """Test query with a field list projects instead of expanding."""
+    mock_client = MagicMock()
+    
+    mock_work_item_ref = SimpleNamespace(id="123")
+    mock_query_result = SimpleNamespace(work_items=[mock_work_item_ref])
+    mock_client.query_by_wiql.return_value = mock_query_result
+    
+    mock_work_item = make_work_item(123, {"System.Title": "Test Bug"})
+    mock_client.get_work_items.return_value = [mock_work_item]
+    
+    result = _query_work_items_impl(
+        "SELECT * FROM WorkItems", 10, mock_client,
+        fields=["System.Title"])
+    
+    mock_client.get_work_items.assert_called_once_with(
+        ids=[123], fields=["System.Title"], error_policy="omit")
+    assert "- **System.Title**: Test Bug" in result
+
+def test_query_work_items_impl_reuses_equivalent_queries(make_work_item):
+    """Test equivalent WIQL variants are served from the cache."""
+    mock_client = MagicMock()
+    
+    mock_work_item_ref = SimpleNamespace(id="123")
+    mock_query_result = SimpleNamespace(work_items=[mock_work_item_ref])
+    mock_client.query_by_wiql.return_value = mock_query_result
+    
+    mock_work_item = make_work_item(123, {"System.Title": "Test Bug"})
+    mock_client.get_work_items.return_value = [mock_work_item]
+    
+    query = "SELECT [System.Id] FROM WorkItems WHERE [System.State] = 'New'"
+    first = _query_work_items_impl(query, 10, mock_client)
+    second = _query_work_items_impl(
+        "select [System.Id]  from WorkItems\n where [System.State]='New';",
+        10, mock_client)
+    
+    assert first == second
+    mock_client.query_by_wiql.assert_called_once()
+    # The original text is what reaches the server
+    assert mock_client.query_by_wiql.call_args[0][0].query == query
+
+def test_query_work_items_impl_caches_repeats(make_work_item):
+    """Test repeated queries are served from the cache per top value."""
+    mock_client = MagicMock()
+    mock_client.query_by_wiql.return_value = SimpleNamespace(
+        work_items=[SimpleNamespace(id="123")])
+    mock_client.get_work_items.return_value = [
+        make_work_item(123, {"System.Title": "Test Bug"})]
+    query = "SELECT [System.Id] FROM WorkItems"
+    
+    for top in (10, 10, 20, 20):
+        _query_work_items_impl(query, top, mock_client)
+    
+    assert mock_client.query_by_wiql.call_count == 2
+    assert mock_client.get_work_items.call_count == 2
+
+def test_query_work_items_impl_refetches_after_write(make_work_item):
+    """Test a write through the server discards cached query results."""
+    mock_client = MagicMock()
+    mock_client.query_by_wiql.return_value = SimpleNamespace(
+        work_items=[SimpleNamespace(id="123")])
+    mock_client.get_work_items.return_value = [
+        make_work_item(123, {"System.State": "New"})]
+    mock_client.update_work_item.return_value = make_work_item(
+        123, {"System.State": "Active"})
+    query = "SELECT [System.Id] FROM WorkItems"
+    
+    _query_work_items_impl(query, 10, mock_client)
+    _update_work_item_impl(123, {"System.State": "Active"}, mock_client)
+    _query_work_items_impl(query, 10, mock_client)
+    
+    assert mock_client.query_by_wiql.call_count == 2
+
+def test_query_work_items_impl_batches_large_results(make_work_item):
+    """Test more than 200 results are fetched in batches, in order."""
+    mock_client = MagicMock()
+    
+    mock_query_result = SimpleNamespace(
+        work_items=[SimpleNamespace(id=str(i)) for i in range(450)])
+    mock_client.query_by_wiql.return_value = mock_query_result
+    
+    def get_work_items(ids, **kwargs):
+        return [make_work_item(i, {"System.Title": f"Item {i}"})
+                for i in ids]
+    mock_client.get_work_items.side_effect = get_work_items
+    
+    result = _query_work_items_impl("SELECT * FROM WorkItems", 450,
+                                    mock_client)
+    
+    calls = mock_client.get_work_items.call_args_list
+    batch_sizes = sorted(len(call.kwargs["ids"]) for call in calls)
+    assert batch_sizes == [50, 200, 200]
+    # Every batch is projected rather than expanded
+    assert all("expand" not in call.kwargs for call in calls)
+    assert all(call.kwargs["fields"] == calls[0].kwargs["fields"]
+               and "System.Title" in call.kwargs["fields"]
+               for call in calls)
+    assert result.index("Item 199") < result.index("Item 200")
+    assert result.index("Item 399") < result.index("Item 449")
+
+def test_query_work_items_impl_with_comments(make_work_item):
+    """Test comments are fetched once per result, using its project."""
+    mock_client = MagicMock()
+    mock_client.query_by_wiql.return_value = SimpleNamespace(
+        work_items=[SimpleNamespace(id="123"), SimpleNamespace(id="456")])
+    mock_client.get_work_items.return_value = [
+        make_work_item(123, {"System.TeamProject": "Project A"}),
+        make_work_item(456, {"System.TeamProject": "Project B"}),
+    ]
+    mock_client.get_comments.return_value = SimpleNamespace(comments=[
+        SimpleNamespace(text="Looks good", created_date=None,
+                        created_by=SimpleNamespace(display_name="Reviewer")),
+    ])
+    
+    result = _query_work_items_impl("SELECT * FROM WorkItems", 10,
+                                    mock_client, include_comments=True,
+                                    fields=["System.Title"])
+    
+    fields = mock_client.get_work_items.call_args.kwargs["fields"]
+    assert fields == ["System.Title", "System.TeamProject"]
+    assert sorted(call.kwargs["project"] for call
+                  in mock_client.get_comments.call_args_list) == [
+        "Project A", "Project B"]
+    mock_client.get_work_item.assert_not_called()
+    assert result.count("## Comment by Reviewer:\nLooks good") == 2
+    assert result.index("# Work Item 123") < result.index("Looks good") < (
+        result.index("# Work Item 456"))
+
+def test_canonicalize_wiql():
+    """Test WIQL canonicalization only changes insignificant text."""
+    assert (_canonicalize_wiql(
+        ' select [System.Id]\nfrom workitems where [System.Title] = "a  b";')
+        == "SELECT [System.Id] FROM workitems WHERE [System.Title]='a  b'")
+    assert (_canonicalize_wiql("SELECT * FROM WorkItems WHERE "
+                               "[System.Title] = 'select  it'")
+            != _canonicalize_wiql("SELECT * FROM WorkItems WHERE "
+                                  "[System.Title] = 'SELECT it'"))
 
 
 # Tests for _get_work_item_impl
-def test_get_work_item_impl_basic():
+def test_get_work_item_impl_basic(make_work_item):
     """Test retrieving basic work item info."""
     mock_client = MagicMock()
     
     # Mock work item
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.id = 123
-    mock_work_item.fields = {
+    mock_work_item = make_work_item(123, {
         "System.WorkItemType": "Bug",
         "System.Title": "Test Bug",
         "System.State": "Active",
         "System.TeamProject": "Test Project"
-    }
+    })
     mock_client.get_work_item.return_value = mock_work_item
     
     result = _get_work_item_impl(123, mock_client)
     
     # Check that the result contains expected basic info
-    assert "# Work Item 123" in result
-    assert "- **System.WorkItemType**: Bug" in result
-    assert "- **System.Title**: Test Bug" in result
-    assert "- **System.State**: Active" in result
-    assert "- **System.TeamProject**: Test Project" in result
+    assert_contains_all(
+        result,
+        "# Work Item 123",
+        "- **System.WorkItemType**: Bug",
+        "- **System.Title**: Test Bug",
+        "- **System.State**: Active",
+        "- **System.TeamProject**: Test Project",
+    )
 
-def test_get_work_item_impl_detailed():
+def test_get_work_item_impl_detailed(make_work_item):
     """Test retrieving detailed work item info."""
     mock_client = MagicMock()
     
     # Mock work item with more fields for detailed view
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.id = 123
-    mock_work_item.fields = {
+    mock_work_item = make_work_item(123, {
         "System.WorkItemType": "Bug",
         "System.Title": "Test Bug",
         "System.State": "Active",
@@ -119,20 +289,53 @@ def test_get_work_item_impl_detailed():
         "System.IterationPath": "Project\\Sprint 1",
         "System.AreaPath": "Project\\Area",
         "System.Tags": "tag1; tag2",
-    }
+    })
     mock_client.get_work_item.return_value = mock_work_item
     
     result = _get_work_item_impl(123, mock_client)
     
     # Check that the result contains both basic and detailed info
-    assert "# Work Item 123" in result
-    assert "- **System.WorkItemType**: Bug" in result
-    assert "- **System.Description**: This is a description" in result
-    assert "- **System.AssignedTo**: Test User (test@example.com)" in result
-    assert "- **System.CreatedBy**: Creator User" in result
-    assert "- **System.IterationPath**: Project\\Sprint 1" in result
-    assert "- **System.AreaPath**: Project\\Area" in result
-    assert "- **System.Tags**: tag1; tag2" in result
+    assert_contains_all(
+        result,
+        "# Work Item 123",
+        "- **System.WorkItemType**: Bug",
+        "- **System.Description**: This is a description",
+        "- **System.AssignedTo**: Test User (test@example.com)",
+        "- **System.CreatedBy**: Creator User",
+        "- **System.IterationPath**: Project\\Sprint 1",
+        "- **System.AreaPath**: Project\\Area",
+        "- **System.Tags**: tag1; tag2",
+    )
+
+def test_get_work_item_impl_with_fields(make_work_item):
+    """Test that requested fields replace expanding everything."""
+    mock_client = MagicMock()
+    
+    mock_work_item = make_work_item(123, {"System.Title": "Test Bug"})
+    mock_client.get_work_items.return_value = [mock_work_item, None]
+    
+    result = _get_work_item_impl([123, 456], mock_client,
+                                 fields=["System.Title"])
+    
+    mock_client.get_work_items.assert_called_once_with(
+        ids=[123, 456], error_policy="omit", fields=["System.Title"])
+    assert "- **System.Title**: Test Bug" in result
+
+def test_get_work_item_impl_batches_large_lists(make_work_item):
+    """Test that long ID lists are split into batches, keeping order."""
+    mock_client = MagicMock()
+    
+    def get_work_items(ids, **kwargs):
+        return [make_work_item(i, {"System.Title": f"Item {i}"})
+                for i in ids]
+    mock_client.get_work_items.side_effect = get_work_items
+    
+    result = _get_work_item_impl(list(range(250)), mock_client)
+    
+    assert mock_client.get_work_items.call_count == 2
+    assert result.index("# Work Item 199\n") < result.index(
+        "# Work Item 200\n")
+    assert "# Work Item 249\n" in result
 
 def test_get_work_item_impl_error():
     """Test error handling in get_work_item_impl."""
@@ -143,45 +346,90 @@ def test_get_work_item_impl_error():
     
     assert "Error retrieving work item 123: Test error" in result
 
+def test_get_work_items_batch_impl(make_work_item):
+    """Test batch retrieval sends the IDs and fields in one request."""
+    mock_client = MagicMock()
+    mock_client.get_work_items_batch.return_value = [
+        make_work_item(123, {"System.Title": "Test Bug"}),
+        make_work_item(456, {"System.Title": "Test Task"}),
+    ]
+    fields = ["System.Title", "System.Description"]
+    
+    result = _get_work_items_batch_impl([123, 456], mock_client, fields)
+    
+    mock_client.get_work_items_batch.assert_called_once()
+    request = mock_client.get_work_items_batch.call_args.args[0]
+    assert (request.ids, request.fields) == ([123, 456], fields)
+    assert (request.expand, request.error_policy) == (None, "omit")
+    assert "- **System.Title**: Test Bug" in result
+    assert "- **System.Title**: Test Task" in result
+
+def test_get_work_items_batch_impl_splits_large_lists(make_work_item):
+    """Test more than 200 IDs are split into batches, keeping order."""
+    mock_client = MagicMock()
+    mock_client.get_work_items_batch.side_effect = lambda request: [
+        make_work_item(i, {"System.Title": f"Item {i}"})
+        for i in request.ids]
+    
+    result = _get_work_items_batch_impl(list(range(250)), mock_client)
+    
+    requests = [call.args[0] for call
+                in mock_client.get_work_items_batch.call_args_list]
+    assert sorted(len(request.ids) for request in requests) == [50, 200]
+    assert all(request.expand == "all" for request in requests)
+    assert result.index("# Work Item 199\n") < result.index(
+        "# Work Item 200\n")
+
 # Tests for _get_work_item_comments_impl
-def test_get_work_item_comments_impl():
+def test_get_work_item_comments_impl(make_work_item):
     """Test retrieving work item comments."""
     mock_client = MagicMock()
     
     # Mock work item for project lookup
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.fields = {"System.TeamProject": "Test Project"}
+    mock_work_item = make_work_item(
+        123, {"System.TeamProject": "Test Project"})
     mock_client.get_work_item.return_value = mock_work_item
     
     # Mock comments
-    mock_comment1 = MagicMock()
-    mock_comment1.text = "This is comment 1"
-    mock_created_by = MagicMock()
-    mock_created_by.display_name = "Comment User"
-    mock_comment1.created_by = mock_created_by
-    mock_comment1.created_date = "2023-01-02"
-    
-    mock_comments = MagicMock()
-    mock_comments.comments = [mock_comment1]
+    mock_comment1 = SimpleNamespace(
+        text="This is comment 1",
+        created_by=SimpleNamespace(display_name="Comment User"),
+        created_date="2023-01-02",
+    )
+    
+    mock_comments = SimpleNamespace(comments=[mock_comment1])
     mock_client.get_comments.return_value = mock_comments
     
     result = _get_work_item_comments_impl(123, mock_client)
     
     assert "## Comment by Comment User on 2023-01-02" in result
     assert "This is comment 1" in result
+    mock_client.get_work_item.assert_called_once_with(
+        123, fields=["System.TeamProject"])
+
+def test_get_work_item_comments_impl_with_project():
+    """Test a given project skips the work item lookup."""
+    mock_client = MagicMock()
+    mock_client.get_comments.return_value = SimpleNamespace(comments=[])
+    
+    result = _get_work_item_comments_impl(123, mock_client, "Test Project")
+    
+    assert result == "No comments found for this work item."
+    mock_client.get_work_item.assert_not_called()
+    mock_client.get_comments.assert_called_once_with(
+        project="Test Project", work_item_id=123)
 
-def test_get_work_item_comments_impl_no_comments():
+def test_get_work_item_comments_impl_no_comments(make_work_item):
     """Test retrieving work item with no comments."""
     mock_client = MagicMock()
     
     # Mock work item for project lookup
-    mock_work_item = MagicMock(spec=WorkItem)
-    mock_work_item.fields = {"System.TeamProject": "Test Project"}
+    mock_work_item = make_work_item(
+        123, {"System.TeamProject": "Test Project"})
     mock_client.get_work_item.return_value = mock_work_item
     
     # Mock empty comments
-    mock_comments = MagicMock()
-    mock_comments.comments = []
+    mock_comments = SimpleNamespace(comments=[])
     mock_client.get_comments.return_value = mock_comments
     
     result = _get_work_item_comments_impl(123, mock_client)
@@ -1,13 +1,21 @@
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from azure.devops.v7_1.work_item_tracking.models import WorkItemType
+import pytest
 
+from mcp_azure_devops.features.work_items.tools import types
 from mcp_azure_devops.features.work_items.tools.types import (
+    _format_work_item_type,
+    _get_type_and_process_id,
     _get_work_item_type_field_impl,
     _get_work_item_type_fields_impl,
     _get_work_item_type_impl,
     _get_work_item_types_impl,
+    _iter_type_fields,
+    _type_fields_index,
 )
+from tests.features.work_items.helpers import assert_contains_all
 
 
 def test_get_work_item_types_impl():
@@ -16,19 +24,21 @@ def test_get_work_item_types_impl():
     mock_client = MagicMock()
     
     # Create mock work item types
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
-    mock_bug_type.description = "Represents a bug or defect"
-    mock_bug_type.color = "FF0000"
-    mock_bug_type.icon = "bug"
-    
-    mock_task_type = MagicMock(spec=WorkItemType)
-    mock_task_type.name = "Task"
-    mock_task_type.reference_name = "System.Task"
-    mock_task_type.description = "Represents a task item"
-    mock_task_type.color = "00FF00"
-    mock_task_type.icon = "task"
+    mock_bug_type = SimpleNamespace(
+        name="Bug",
+        reference_name="System.Bug",
+        description="Represents a bug or defect",
+        color="FF0000",
+        icon="bug",
+    )
+    
+    mock_task_type = SimpleNamespace(
+        name="Task",
+        reference_name="System.Task",
+        description="Represents a task item",
+        color="00FF00",
+        icon="task",
+    )
     
     mock_client.get_work_item_types.return_value = [
         mock_bug_type, mock_task_type]
@@ -40,13 +50,20 @@ def test_get_work_item_types_impl():
     mock_client.get_work_item_types.assert_called_once_with("TestProject")
     
     # Check result content
-    assert "Work Item Types in Project: TestProject" in result
-    assert "Bug" in result
-    assert "System.Bug" in result
-    assert "Represents a bug or defect" in result
-    assert "Task" in result
-    assert "System.Task" in result
-    assert "Represents a task item" in result
+    assert_contains_all(
+        result,
+        "Work Item Types in Project: TestProject",
+        "Bug",
+        "System.Bug",
+        "Represents a bug or defect",
+        "Task",
+        "System.Task",
+        "Represents a task item",
+    )
+    
+    # Repeated calls are served from the cache
+    assert _get_work_item_types_impl("TestProject", mock_client) == result
+    mock_client.get_work_item_types.assert_called_once()
 
 
 def test_get_work_item_types_impl_no_types():
@@ -69,33 +86,25 @@ def test_get_work_item_type_impl():
     mock_client = MagicMock()
     
     # Create mock work item type with states
-    mock_state1 = MagicMock()
-    mock_state1.name = "New"
-    mock_state1.color = "0000FF"
-    mock_state1.category = "Proposed"
-    
-    mock_state2 = MagicMock()
-    mock_state2.name = "Active"
-    mock_state2.color = "00FF00"
-    mock_state2.category = "InProgress"
-    
-    mock_state3 = MagicMock()
-    mock_state3.name = "Resolved"
-    mock_state3.color = "FFFF00"
-    mock_state3.category = "Resolved"
-    
-    mock_state4 = MagicMock()
-    mock_state4.name = "Closed"
-    mock_state4.color = "008000"
-    mock_state4.category = "Completed"
-    
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
-    mock_bug_type.description = "Represents a bug or defect"
-    mock_bug_type.color = "FF0000"
-    mock_bug_type.icon = "bug"
-    mock_bug_type.states = [mock_state1, mock_state2, mock_state3, mock_state4]
+    states = [
+        SimpleNamespace(name=name, color=color, category=category,
+                        order=order)
+        for order, (name, color, category) in enumerate([
+            ("New", "0000FF", "Proposed"),
+            ("Active", "00FF00", "InProgress"),
+            ("Resolved", "FFFF00", "Resolved"),
+            ("Closed", "008000", "Completed"),
+        ], start=1)
+    ]
+    
+    mock_bug_type = SimpleNamespace(
+        name="Bug",
+        reference_name="System.Bug",
+        description="Represents a bug or defect",
+        color="FF0000",
+        icon="bug",
+        states=states,
+    )
     
     mock_client.get_work_item_type.return_value = mock_bug_type
     
@@ -107,22 +116,23 @@ def test_get_work_item_type_impl():
         "TestProject", "Bug")
     
     # Check result content
-    assert "Work Item Type: Bug" in result or "# Work Item Type: Bug" in result
-    assert "Description: Represents a bug or defect" in result
-    assert "Color: FF0000" in result
-    assert "Icon: bug" in result
-    assert "Reference_name: System.Bug" in result
-    
-    # Check states section
-    assert "States" in result
-    assert "New" in result
-    assert "Active" in result
-    assert "Resolved" in result
-    assert "Closed" in result
-    assert "Category: Proposed" in result
-    assert "Color: 0000FF" in result
-    assert "Category: Completed" in result
-    assert "Color: 008000" in result
+    assert_contains_all(
+        result,
+        "# Work Item Type: Bug",
+        "Description: Represents a bug or defect",
+        "Color: FF0000",
+        "Icon: bug",
+        "Reference_name: System.Bug",
+        "States",
+        "New",
+        "Active",
+        "Resolved",
+        "Closed",
+        "Category: Proposed",
+        "Color: 0000FF",
+        "Category: Completed",
+        "Color: 008000",
+    )
 
 
 def test_get_work_item_type_impl_not_found():
@@ -153,42 +163,39 @@ def test_get_work_item_type_fields_impl(
     mock_process_client = MagicMock()
     
     # Setup mock for get_work_item_type
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
+    mock_bug_type = SimpleNamespace(name="Bug", reference_name="System.Bug")
     mock_wit_client.get_work_item_type.return_value = mock_bug_type
     
     # Setup mock for get_project from core client
-    mock_project = MagicMock()
-    mock_project.capabilities = {
-        "processTemplate": {
-            "templateTypeId": "process-id-123"
-        }
-    }
+    mock_project = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "process-id-123"}})
     mock_core_client.get_project.return_value = mock_project
     mock_get_core_client.return_value = mock_core_client
     
     # Setup mock for get_all_work_item_type_fields
-    mock_title_field = MagicMock()
-    mock_title_field.name = "Title"
-    mock_title_field.reference_name = "System.Title"
-    mock_title_field.type = "string"
-    mock_title_field.required = True
-    mock_title_field.read_only = False
-    
-    mock_desc_field = MagicMock()
-    mock_desc_field.name = "Description"
-    mock_desc_field.reference_name = "System.Description"
-    mock_desc_field.type = "html"
-    mock_desc_field.required = False
-    mock_desc_field.read_only = False
-    
-    mock_priority_field = MagicMock()
-    mock_priority_field.name = "Priority"
-    mock_priority_field.reference_name = "Microsoft.VSTS.Common.Priority"
-    mock_priority_field.type = "integer"
-    mock_priority_field.required = False
-    mock_priority_field.read_only = False
+    mock_title_field = SimpleNamespace(
+        name="Title",
+        reference_name="System.Title",
+        type="string",
+        required=True,
+        read_only=False,
+    )
+    
+    mock_desc_field = SimpleNamespace(
+        name="Description",
+        reference_name="System.Description",
+        type="html",
+        required=False,
+        read_only=False,
+    )
+    
+    mock_priority_field = SimpleNamespace(
+        name="Priority",
+        reference_name="Microsoft.VSTS.Common.Priority",
+        type="integer",
+        required=False,
+        read_only=False,
+    )
     
     mock_process_client.get_all_work_item_type_fields.return_value = [
         mock_title_field, mock_desc_field, mock_priority_field
@@ -208,18 +215,25 @@ def test_get_work_item_type_fields_impl(
         "process-id-123", "System.Bug")
     
     # Check result content
-    assert "Fields for Work Item Type: Bug" in result
-    assert "Title" in result
-    assert "System.Title" in result
-    assert "string" in result
-    assert "Yes" in result  # For required
-    assert "No" in result   # For read-only
-    assert "Description" in result
-    assert "System.Description" in result
-    assert "html" in result
-    assert "Priority" in result
-    assert "Microsoft.VSTS.Common.Priority" in result
-    assert "integer" in result
+    assert_contains_all(
+        result,
+        "Fields for Work Item Type: Bug",
+        "Title",
+        "System.Title",
+        "string",
+        "Yes",
+        "No",
+        "Description",
+        "System.Description",
+        "html",
+        "Priority",
+        "Microsoft.VSTS.Common.Priority",
+        "integer",
+    )
+    
+    # The project's process ID is reused by later calls
+    _get_work_item_type_fields_impl("TestProject", "Bug", mock_wit_client)
+    mock_core_client.get_project.assert_called_once()
 
 
 @patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
@@ -233,18 +247,12 @@ def test_get_work_item_type_fields_impl_no_fields(
     mock_process_client = MagicMock()
     
     # Setup mock for get_work_item_type
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
+    mock_bug_type = SimpleNamespace(name="Bug", reference_name="System.Bug")
     mock_wit_client.get_work_item_type.return_value = mock_bug_type
     
     # Setup mock for get_project from core client
-    mock_project = MagicMock()
-    mock_project.capabilities = {
-        "processTemplate": {
-            "templateTypeId": "process-id-123"
-        }
-    }
+    mock_project = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "process-id-123"}})
     mock_core_client.get_project.return_value = mock_project
     mock_get_core_client.return_value = mock_core_client
     
@@ -272,30 +280,25 @@ def test_get_work_item_type_field_impl(
     mock_process_client = MagicMock()
     
     # Setup mock for get_work_item_type
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
+    mock_bug_type = SimpleNamespace(name="Bug", reference_name="System.Bug")
     mock_wit_client.get_work_item_type.return_value = mock_bug_type
     
     # Setup mock for get_project from core client
-    mock_project = MagicMock()
-    mock_project.capabilities = {
-        "processTemplate": {
-            "templateTypeId": "process-id-123"
-        }
-    }
+    mock_project = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "process-id-123"}})
     mock_core_client.get_project.return_value = mock_project
     mock_get_core_client.return_value = mock_core_client
     
     # Setup mock for get_work_item_type_field
-    mock_priority_field = MagicMock()
-    mock_priority_field.name = "Priority"
-    mock_priority_field.reference_name = "Microsoft.VSTS.Common.Priority"
-    mock_priority_field.type = "integer"
-    mock_priority_field.required = False
-    mock_priority_field.read_only = False
-    mock_priority_field.allowed_values = ["1", "2", "3", "4"]
-    mock_priority_field.default_value = "3"
+    mock_priority_field = SimpleNamespace(
+        name="Priority",
+        reference_name="Microsoft.VSTS.Common.Priority",
+        type="integer",
+        required=False,
+        read_only=False,
+        allowed_values=["1", "2", "3", "4"],
+        default_value="3",
+    )
     
     mock_process_client.get_work_item_type_field.return_value = (
         mock_priority_field)
@@ -317,17 +320,20 @@ def test_get_work_item_type_field_impl(
     assert mock_process_client.get_work_item_type_field.call_count > 0
     
     # Check result content
-    assert "Field: Priority" in result or "# Field: Priority" in result
-    assert "Reference Name: Microsoft.VSTS.Common.Priority" in result
-    assert "Type: integer" in result
-    assert "Required: No" in result
-    assert "Read Only: No" in result
-    assert "Allowed Values" in result
-    assert "1" in result
-    assert "2" in result
-    assert "3" in result
-    assert "4" in result
-    assert "Default Value: 3" in result
+    assert_contains_all(
+        result,
+        "# Field: Priority",
+        "Reference Name: Microsoft.VSTS.Common.Priority",
+        "Type: integer",
+        "Required: No",
+        "Read Only: No",
+        "Allowed Values",
+        "1",
+        "2",
+        "3",
+        "4",
+        "Default Value: 3",
+    )
 
 
 @patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
@@ -340,39 +346,34 @@ def test_get_work_item_type_field_impl_display_name(
     mock_core_client = MagicMock()
     mock_process_client = MagicMock()
     
-    # Setup mock for get_work_item_type
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
-    mock_wit_client.get_work_item_type.return_value = mock_bug_type
+    # The type is resolved from the project's type list
+    mock_bug_type = SimpleNamespace(name="Bug", reference_name="System.Bug")
+    mock_wit_client.get_work_item_types.return_value = [mock_bug_type]
     
     # Setup mock for get_project from core client
-    mock_project = MagicMock()
-    mock_project.capabilities = {
-        "processTemplate": {
-            "templateTypeId": "process-id-123"
-        }
-    }
+    mock_project = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "process-id-123"}})
     mock_core_client.get_project.return_value = mock_project
     mock_get_core_client.return_value = mock_core_client
     
     # Setup mock for get_all_work_item_type_fields 
-    # (used to find reference name)
-    mock_priority_field = MagicMock()
-    mock_priority_field.name = "Priority"
-    mock_priority_field.reference_name = "Microsoft.VSTS.Common.Priority"
+    # (used to find reference name, without the field's details)
+    mock_priority_field = SimpleNamespace(
+        name="Priority", reference_name="Microsoft.VSTS.Common.Priority",
+        allowed_values=None, default_value=None)
     
     mock_process_client.get_all_work_item_type_fields.return_value = [
         mock_priority_field]
     
     # Setup mock for get_work_item_type_field
-    mock_field_detail = MagicMock()
-    mock_field_detail.name = "Priority"
-    mock_field_detail.reference_name = "Microsoft.VSTS.Common.Priority"
-    mock_field_detail.type = "integer"
-    mock_field_detail.required = False
-    mock_field_detail.read_only = False
-    mock_field_detail.allowed_values = ["1", "2", "3", "4"]
+    mock_field_detail = SimpleNamespace(
+        name="Priority",
+        reference_name="Microsoft.VSTS.Common.Priority",
+        type="integer",
+        required=False,
+        read_only=False,
+        allowed_values=["1", "2", "3", "4"],
+    )
     
     mock_process_client.get_work_item_type_field.return_value = (
         mock_field_detail)
@@ -403,6 +404,14 @@ def test_get_work_item_type_field_impl_display_name(
     # Check result content
     assert "Field: Priority" in result
     assert "Reference Name: Microsoft.VSTS.Common.Priority" in result
+    
+    # Later lookups reuse the type, process and field name caches
+    _get_work_item_type_field_impl(
+        "TestProject", "bug", "priority", mock_wit_client)
+    mock_wit_client.get_work_item_type.assert_not_called()
+    mock_wit_client.get_work_item_types.assert_called_once()
+    mock_core_client.get_project.assert_called_once()
+    mock_process_client.get_all_work_item_type_fields.assert_called_once()
 
 
 @patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
@@ -416,18 +425,12 @@ def test_get_work_item_type_field_impl_field_not_found(
     mock_process_client = MagicMock()
     
     # Setup mock for get_work_item_type
-    mock_bug_type = MagicMock(spec=WorkItemType)
-    mock_bug_type.name = "Bug"
-    mock_bug_type.reference_name = "System.Bug"
+    mock_bug_type = SimpleNamespace(name="Bug", reference_name="System.Bug")
     mock_wit_client.get_work_item_type.return_value = mock_bug_type
     
     # Setup mock for get_project from core client
-    mock_project = MagicMock()
-    mock_project.capabilities = {
-        "processTemplate": {
-            "templateTypeId": "process-id-123"
-        }
-    }
+    mock_project = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "process-id-123"}})
     mock_core_client.get_project.return_value = mock_project
     mock_get_core_client.return_value = mock_core_client
     
@@ -445,3 +448,261 @@ def test_get_work_item_type_field_impl_field_not_found(
     # Assert
     assert (f"Field '{field_name}' not found for work item type " 
             f"'Bug' in project 'TestProject'" in result)
+
+
+@patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
+@patch("mcp_azure_devops.features.work_items.tools.types.get_work_item_tracking_process_client")
+def test_get_work_item_type_field_impl_from_field_list(
+        mock_get_process_client, mock_get_core_client):
+    """Test a field with details in the field list is not fetched again."""
+    mock_wit_client = MagicMock()
+    mock_bug_type = SimpleNamespace(name="Bug", reference_name="System.Bug")
+    mock_wit_client.get_work_item_types.return_value = [mock_bug_type]
+    
+    mock_core_client = MagicMock()
+    mock_core_client.get_project.return_value = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "process-id-123"}})
+    mock_get_core_client.return_value = mock_core_client
+    
+    mock_process_client = MagicMock()
+    mock_process_client.get_all_work_item_type_fields.return_value = [
+        SimpleNamespace(
+            name="Priority", reference_name="Microsoft.VSTS.Common.Priority",
+            description=None, type="integer", required=False,
+            read_only=False, allowed_values=["1", "2"], default_value="2"),
+    ]
+    mock_get_process_client.return_value = mock_process_client
+    
+    for field_name in ("Priority", "Microsoft.VSTS.Common.Priority"):
+        result = _get_work_item_type_field_impl(
+            "TestProject", "Bug", field_name, mock_wit_client)
+        
+        assert "# Field: Priority" in result
+        assert "- 2" in result
+        assert "Default Value: 2" in result
+    
+    mock_process_client.get_all_work_item_type_fields.assert_called_once()
+    mock_process_client.get_work_item_type_field.assert_not_called()
+
+
+@patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
+@patch("mcp_azure_devops.features.work_items.tools.types.get_work_item_tracking_process_client")
+def test_get_work_item_type_field_impl_overlaps_lookups(
+        mock_get_process_client, mock_get_core_client):
+    """Test the type and project lookups run at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def get_work_item_types(project):
+        # Only passes if both lookups are waiting at the same time
+        barrier.wait()
+        return [SimpleNamespace(name="Bug", reference_name="System.Bug")]
+    
+    def get_project(project, include_capabilities):
+        barrier.wait()
+        return SimpleNamespace(
+            capabilities={"processTemplate": {"templateTypeId": "p-1"}})
+    
+    mock_wit_client = MagicMock()
+    mock_wit_client.get_work_item_types.side_effect = get_work_item_types
+    mock_get_core_client.return_value.get_project.side_effect = get_project
+    mock_process_client = mock_get_process_client.return_value
+    mock_process_client.get_all_work_item_type_fields.return_value = [
+        SimpleNamespace(name="Priority",
+                        reference_name="Microsoft.VSTS.Common.Priority",
+                        type="integer", allowed_values=["1", "2"],
+                        default_value="2"),
+    ]
+    
+    result = _get_work_item_type_field_impl(
+        "TestProject", "Bug", "Priority", mock_wit_client)
+    
+    assert result.startswith("# Field: Priority")
+
+
+@pytest.mark.parametrize("field_type, fetched", [
+    ("integer", True),
+    ("boolean", False),
+])
+@patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
+@patch("mcp_azure_devops.features.work_items.tools.types.get_work_item_tracking_process_client")
+def test_get_work_item_type_field_impl_default_only_entry(
+        mock_get_process_client, mock_get_core_client, field_type,
+        fetched):
+    """Test a listed default value alone does not hide the picklist."""
+    mock_wit_client = MagicMock()
+    mock_wit_client.get_work_item_types.return_value = [
+        SimpleNamespace(name="Bug", reference_name="System.Bug")]
+    mock_get_core_client.return_value.get_project.return_value = (
+        SimpleNamespace(capabilities={
+            "processTemplate": {"templateTypeId": "process-id-123"}}))
+    # The bulk list omits the allowed values but keeps the default
+    listed = SimpleNamespace(
+        name="Priority", reference_name="Microsoft.VSTS.Common.Priority",
+        type=field_type, required=False, read_only=False,
+        allowed_values=None, default_value="2")
+    mock_process_client = mock_get_process_client.return_value
+    mock_process_client.get_all_work_item_type_fields.return_value = [listed]
+    mock_process_client.get_work_item_type_field.return_value = (
+        SimpleNamespace(**{**vars(listed),
+                           "allowed_values": ["1", "2", "3"]}))
+    
+    result = _get_work_item_type_field_impl(
+        "TestProject", "Bug", "Priority", mock_wit_client)
+    
+    assert mock_process_client.get_work_item_type_field.called == fetched
+    assert ("## Allowed Values\n- 1\n- 2\n- 3" in result) == fetched
+    assert "Default Value: 2" in result
+
+
+@patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
+@patch("mcp_azure_devops.features.work_items.tools.types.get_work_item_tracking_process_client")
+def test_type_lookups_fetch_work_item_type_once(
+        mock_get_process_client, mock_get_core_client):
+    """Test exploring several fields of a type fetches the type once."""
+    mock_wit_client = MagicMock()
+    # The type is missing from the type list, so it is fetched by name
+    mock_wit_client.get_work_item_types.return_value = []
+    mock_wit_client.get_work_item_type.return_value = SimpleNamespace(
+        name="Bug", reference_name="System.Bug")
+    mock_get_core_client.return_value.get_project.return_value = (
+        SimpleNamespace(capabilities={
+            "processTemplate": {"templateTypeId": "process-id-123"}}))
+    fields = [
+        SimpleNamespace(name=name, reference_name=reference_name,
+                        type="string", required=False, read_only=False,
+                        allowed_values=None, default_value="x")
+        for name, reference_name in (("Title", "System.Title"),
+                                     ("State", "System.State"))
+    ]
+    mock_process_client = mock_get_process_client.return_value
+    mock_process_client.get_all_work_item_type_fields.return_value = fields
+    
+    _get_work_item_type_fields_impl("TestProject", "Bug", mock_wit_client)
+    for field_name in ("Title", "State", "System.Title"):
+        result = _get_work_item_type_field_impl(
+            "TestProject", "Bug", field_name, mock_wit_client)
+        assert result.startswith("# Field: ")
+    
+    mock_wit_client.get_work_item_type.assert_called_once_with(
+        "TestProject", "Bug")
+    mock_process_client.get_all_work_item_type_fields.assert_called_once()
+
+
+@patch("mcp_azure_devops.features.work_items.tools.types.get_core_client")
+@patch("mcp_azure_devops.features.work_items.tools.types.get_work_item_tracking_process_client")
+def test_get_work_item_type_field_impl_fetches_details_once(
+        mock_get_process_client, mock_get_core_client):
+    """Test a field's details are fetched once for repeated lookups."""
+    mock_wit_client = MagicMock()
+    mock_wit_client.get_work_item_types.return_value = [
+        SimpleNamespace(name="Bug", reference_name="System.Bug")]
+    mock_get_core_client.return_value.get_project.return_value = (
+        SimpleNamespace(capabilities={
+            "processTemplate": {"templateTypeId": "process-id-123"}}))
+    # The field list carries no allowed or default values
+    mock_process_client = mock_get_process_client.return_value
+    mock_process_client.get_all_work_item_type_fields.return_value = [
+        SimpleNamespace(name="Title", reference_name="System.Title",
+                        allowed_values=None, default_value=None),
+    ]
+    mock_process_client.get_work_item_type_field.return_value = (
+        SimpleNamespace(name="Title", reference_name="System.Title",
+                        type="string", required=True, read_only=False,
+                        allowed_values=None, default_value=None))
+    
+    for field_name in ("Title", "System.Title", "title"):
+        result = _get_work_item_type_field_impl(
+            "TestProject", "Bug", field_name, mock_wit_client)
+        assert result.startswith("# Field: Title")
+    
+    mock_process_client.get_work_item_type_field.assert_called_once_with(
+        "process-id-123", "System.Bug", "System.Title")
+
+
+def test_get_type_and_process_id_skips_pool_when_cached(monkeypatch):
+    """Test warm lookups run inline instead of on the thread pool."""
+    mock_wit_client = MagicMock()
+    mock_wit_client.get_work_item_types.return_value = [
+        SimpleNamespace(name="Bug", reference_name="System.Bug")]
+    mock_core_client = MagicMock()
+    mock_core_client.get_project.return_value = SimpleNamespace(
+        capabilities={"processTemplate": {"templateTypeId": "p-1"}})
+    monkeypatch.setattr(types, "get_core_client", lambda: mock_core_client)
+    fan_outs = []
+    
+    def run_concurrently(*calls):
+        fan_outs.append(len(calls))
+        return [call() for call in calls]
+    
+    monkeypatch.setattr(types, "run_concurrently", run_concurrently)
+    
+    for _ in range(2):
+        assert _get_type_and_process_id(
+            "TestProject", "Bug", mock_wit_client) == ("System.Bug", "p-1")
+    
+    assert fan_outs == [2]
+
+
+def test_type_fields_index_is_built_once_per_type():
+    """Test the field index is cached per process and type."""
+    mock_process_client = MagicMock()
+    mock_priority_field = SimpleNamespace(
+        name="Priority",
+        reference_name="Microsoft.VSTS.Common.Priority",
+    )
+    mock_process_client.get_all_work_item_type_fields.return_value = [
+        mock_priority_field]
+    
+    index = _type_fields_index(
+        mock_process_client, "process-id-123", "System.Bug")
+    
+    assert index == {
+        "priority": mock_priority_field,
+        "microsoft.vsts.common.priority": mock_priority_field,
+    }
+    assert _type_fields_index(
+        mock_process_client, "process-id-123", "System.Bug") is index
+    _type_fields_index(
+        mock_process_client, "process-id-123", "System.Task")
+    assert mock_process_client.get_all_work_item_type_fields.call_count == 2
+
+
+def test_format_work_item_type_many_states():
+    """Test a type with hundreds of states formats one line per state."""
+    states = [SimpleNamespace(name=f"State {i}", category="InProgress",
+                              color="007acc", order=i)
+              for i in range(500)]
+    states[0].order = None
+    wit = SimpleNamespace(name="Bug", description=None, color=None,
+                          icon=None, reference_name="System.Bug",
+                          is_disabled=None, states=states)
+    
+    lines = _format_work_item_type(wit).splitlines()
+    
+    assert lines[:4] == ["# Work Item Type: Bug", "Reference_name: System.Bug",
+                         "", "## States"]
+    assert len(lines) == 4 + 500
+    assert lines[4] == "- State 0 (Category: InProgress, Color: 007acc)"
+    assert lines[-1] == ("- State 499 (Category: InProgress, "
+                         "Color: 007acc), Order: 499")
+
+
+def test_iter_type_fields_yields_before_reading_fields():
+    """Test the table header is produced before any field is read."""
+    read = []
+    
+    def fields():
+        for name in ("Title", "State"):
+            read.append(name)
+            yield SimpleNamespace(name=name, reference_name=f"System.{name}",
+                                  type="string", required=True,
+                                  read_only=False)
+    
+    lines = _iter_type_fields("Bug", fields())
+    
+    header = [next(lines) for _ in range(4)]
+    assert header[0] == "# Fields for Work Item Type: Bug"
+    assert not read
+    assert next(lines) == "| Title | System.Title | string | Yes | No | "
+    assert read == ["Title"]
+    assert list(lines) == ["| State | System.State | string | Yes | No | "]
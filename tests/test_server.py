@@ -1,33 +1,151 @@
 """
 Tests for the Azure DevOps MCP Server.
 """
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
+from mcp.server.fastmcp import FastMCP
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
 )
 
-from mcp_azure_devops.server import mcp
+from mcp_azure_devops.features import register_all
+from mcp_azure_devops.features.work_items.tools import types
+from mcp_azure_devops.server import main, mcp
+from mcp_azure_devops.utils import register_all_prompts
+from mcp_azure_devops.utils.azure_client import get_credentials
+
+
+@pytest.fixture(scope="module")
+async def server_session(anyio_backend):
+    """
+    Connect one initialized client session for the module's server tests.
+    
+    Yields:
+        Tuple containing (client, init_result)
+    """
+    async with client_session(mcp._mcp_server) as client:
+        init_result = await client.initialize()
+        yield client, init_result
 
 
 # Mark all tests with anyio for async testing
 @pytest.mark.anyio
-async def test_server_initialization():
+async def test_server_initialization(server_session):
     """Test that the server initializes correctly and returns capabilities."""
-    async with client_session(mcp._mcp_server) as client:
-        # Initialize the connection
-        init_result = await client.initialize()
-        
-        # Check that initialization was successful
-        assert init_result is not None
-        
-        # Check server name in serverInfo
-        assert init_result.serverInfo.name == "Azure DevOps"
-        
-        # Check that the server has capabilities
-        capabilities = init_result.capabilities
-        assert capabilities is not None
-        
-        # Check for specific capabilities we expect
-        assert capabilities.prompts is not None
-        assert capabilities.resources is not None
-        assert capabilities.tools is not None
\ No newline at end of file
+    _, init_result = server_session
+    
+    # Check that initialization was successful
+    assert init_result is not None
+    
+    # Check server name in serverInfo
+    assert init_result.serverInfo.name == "Azure DevOps"
+    
+    # Check that the server has capabilities
+    capabilities = init_result.capabilities
+    assert capabilities is not None
+    
+    # Check for specific capabilities we expect
+    assert capabilities.prompts is not None
+    assert capabilities.resources is not None
+    assert capabilities.tools is not None
+
+
+@pytest.mark.anyio
+async def test_server_serves_conventions_prompt(server_session):
+    """Test that the registered prompts are listed and rendered."""
+    client, _ = server_session
+    prompts = await client.list_prompts()
+    assert [prompt.name for prompt in prompts.prompts] == [
+        "Create Conventions File"]
+    
+    result = await client.get_prompt("Create Conventions File")
+    assert "get_conventions_bundle" in result.messages[0].content.text
+
+
+@pytest.mark.anyio
+async def test_server_rejects_unknown_output_formats(server_session):
+    """Test output_format only accepts the supported formats."""
+    client, _ = server_session
+    tools = {tool.name: tool for tool in (await client.list_tools()).tools}
+    
+    for name in ("get_projects", "get_all_teams"):
+        output_format = tools[name].inputSchema["properties"]["output_format"]
+        assert output_format["enum"] == ["text", "json"]
+    
+    result = await client.call_tool("get_projects", {"output_format": "jsno"})
+    assert result.isError
+    assert "Input should be 'text' or 'json'" in result.content[0].text
+
+
+def test_registration_is_idempotent():
+    """Test that registering twice does not re-run any tool decorators."""
+    server = MagicMock(spec=FastMCP)
+    
+    register_all(server)
+    register_all_prompts(server)
+    tool_calls = server.tool.call_count
+    prompt_calls = server.prompt.call_count
+    
+    register_all(server)
+    register_all_prompts(server)
+    
+    assert tool_calls > 0
+    assert server.tool.call_count == tool_calls
+    assert server.prompt.call_count == prompt_calls
+
+
+def test_main_requires_credentials(monkeypatch, capsys):
+    """Test the server refuses to start without credentials."""
+    monkeypatch.delenv("AZURE_DEVOPS_PAT", raising=False)
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    monkeypatch.setattr("sys.argv", ["mcp-azure-devops"])
+    run = MagicMock()
+    monkeypatch.setattr(mcp, "run", run)
+    
+    with pytest.raises(SystemExit):
+        main()
+    
+    assert "AZURE_DEVOPS_PAT" in capsys.readouterr().err
+    run.assert_not_called()
+
+
+def test_startup_prefetches_process_ids(monkeypatch):
+    """Test configured projects have their process IDs pinned at startup."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    monkeypatch.setenv("AZURE_DEVOPS_PROJECTS", "Alpha, Beta,")
+    monkeypatch.setattr("sys.argv", ["mcp-azure-devops"])
+    run = MagicMock()
+    monkeypatch.setattr(mcp, "run", run)
+    core_client = MagicMock()
+    core_client.get_project.side_effect = lambda project, **kwargs: (
+        SimpleNamespace(name=project, id=f"{project}-id", capabilities={
+            "processTemplate": {"templateTypeId": f"{project}-process"}}))
+    monkeypatch.setattr(types, "get_core_client", lambda: core_client)
+    
+    main()
+    for thread in threading.enumerate():
+        if thread.name == "prefetch-process-ids":
+            thread.join(timeout=5)
+    
+    assert sorted(call.args[0] for call
+                  in core_client.get_project.call_args_list) == [
+                      "Alpha", "Beta"]
+    run.assert_called_once()
+    
+    # Pinned IDs outlive the regular cache and match any case or the ID
+    types._fetch_process_id.cache_clear()
+    for project in ("Alpha", "alpha", "ALPHA-ID"):
+        assert types._process_id_for(project) == "Alpha-process"
+    assert core_client.get_project.call_count == 2
+    
+    # Pins belong to the connection they were resolved for
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-2")
+    get_credentials.cache_clear()
+    assert types._process_id_for("Alpha") == "Alpha-process"
+    assert core_client.get_project.call_count == 3
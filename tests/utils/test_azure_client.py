@@ -0,0 +1,284 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from azure.devops._models import ApiResourceLocation
+from azure.devops.connection import Connection
+from azure.devops.v7_1.core import CoreClient
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import Wiql
+from requests.adapters import HTTPAdapter
+
+from mcp_azure_devops.features.projects import common as projects_common
+from mcp_azure_devops.features.teams import common as teams_common
+from mcp_azure_devops.utils import azure_client
+from mcp_azure_devops.utils.azure_client import (
+    configure_client,
+    get_connection,
+    get_core_client,
+    get_credentials,
+    memoize_client,
+)
+from mcp_azure_devops.utils.concurrency import MAX_WORKERS
+
+
+def test_configure_client_retries_throttled_reads():
+    """Test that throttled and transient GET failures are retried."""
+    client = configure_client(
+        CoreClient(base_url="https://dev.azure.com/org", creds=None))
+    
+    retry = client.config.retry_policy()
+    
+    assert retry.is_retry("GET", 429, has_retry_after=True)
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("GET", 404)
+    assert retry.respect_retry_after_header
+    assert retry.backoff_jitter > 0
+
+
+def test_configure_client_does_not_retry_writes():
+    """Test that non-idempotent requests are never retried."""
+    client = configure_client(
+        CoreClient(base_url="https://dev.azure.com/org", creds=None))
+    
+    retry = client.config.retry_policy()
+    
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("PATCH", 429, has_retry_after=True)
+
+
+def test_memoize_client_reuses_client_per_credentials(monkeypatch):
+    """Test a client is reused until the credentials change."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    get_client = memoize_client(object)
+    
+    first = get_client()
+    assert get_client() is first
+    
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-2")
+    get_credentials.cache_clear()
+    assert get_client() is not first
+
+
+def test_configure_client_pools_connections():
+    """Test that clients keep sessions alive and share one adapter."""
+    clients = [
+        configure_client(
+            CoreClient(base_url="https://dev.azure.com/org", creds=None))
+        for _ in range(2)
+    ]
+    sessions = [requests.Session(), requests.Session()]
+    
+    for client, session in zip(clients, sessions):
+        assert client.config.keep_alive
+        client.config.session_configuration_callback(
+            session, client.config, {})
+    
+    adapter = sessions[0].get_adapter("https://dev.azure.com/org")
+    assert isinstance(adapter, HTTPAdapter)
+    assert sessions[1].get_adapter("https://dev.azure.com/org") is adapter
+    assert adapter.max_retries is clients[0].config.retry_policy()
+    # Every worker running requests concurrently gets its own socket
+    assert adapter._pool_maxsize >= MAX_WORKERS
+
+
+def test_get_connection_reuses_connection(monkeypatch):
+    """Test that one connection is shared until credentials change."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    
+    connection = get_connection()
+    assert get_connection() is connection
+    
+    monkeypatch.delenv("AZURE_DEVOPS_PAT")
+    get_credentials.cache_clear()
+    assert get_connection() is None
+
+
+def test_memoize_client_shares_instance_across_threads(monkeypatch):
+    """Test threads racing on a cold cache get a single instance."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    created = []
+    
+    def create():
+        time.sleep(0.05)
+        created.append(object())
+        return created[-1]
+    
+    get_client = memoize_client(create)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_client()))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_get_core_client_resolves_client_once(monkeypatch):
+    """Test the client factory is only consulted on the first call."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    connection = MagicMock()
+    connection.clients.get_core_client.return_value = CoreClient(
+        base_url="https://dev.azure.com/org", creds=None)
+    monkeypatch.setattr(azure_client, "get_connection", lambda: connection)
+    
+    client = get_core_client()
+    
+    assert get_core_client() is client
+    assert client.config.keep_alive
+    connection.clients.get_core_client.assert_called_once()
+
+
+def test_configured_client_keeps_pooled_connections_open(monkeypatch):
+    """Test responses go through the shared pool and never close it."""
+    sent, closed = [], []
+    
+    def send(request, **kwargs):
+        sent.append(request.url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        response.request, response.url = request, request.url
+        return response
+    
+    monkeypatch.setattr(azure_client._get_http_adapter(), "send", send)
+    monkeypatch.setattr(azure_client._get_http_adapter(), "close",
+                        lambda: closed.append(True))
+    client = configure_client(
+        CoreClient(base_url="https://dev.azure.com/org", creds=None))
+    
+    for _ in range(2):
+        request = client._client.get("https://dev.azure.com/org/_apis")
+        client._client.send(request, stream=False)
+    
+    assert len(sent) == 2
+    assert not closed
+
+
+def test_get_credentials_reads_environment_once(monkeypatch):
+    """Test credentials are cached until explicitly cleared."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    assert get_credentials() == ("pat-1", "https://dev.azure.com/org")
+    
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-2")
+    assert get_credentials()[0] == "pat-1"
+    
+    get_credentials.cache_clear()
+    assert get_credentials()[0] == "pat-2"
+
+
+def test_feature_client_getters_share_one_client(monkeypatch):
+    """Test every feature is handed the same client per client type."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    # Skip the resource area lookup, which would need the network
+    monkeypatch.setattr(Connection, "_get_url_for_client_instance",
+                        lambda self, client_class: self.base_url)
+    
+    client = get_core_client()
+    
+    assert projects_common.get_core_client() is client
+    assert teams_common.get_core_client() is client
+
+
+def test_memoize_client_cache_clear_discards_client(monkeypatch):
+    """Test clearing the cache builds a new client for the same credentials."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat-1")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL",
+                       "https://dev.azure.com/org")
+    get_client = memoize_client(object)
+    first = get_client()
+    
+    get_client.cache_clear()
+    
+    assert get_client() is not first
+
+
+@pytest.fixture
+def throttling_server():
+    """
+    Serve one 429 response per path, then succeed.
+    
+    Yields:
+        Tuple containing (base_url, hits), hits counting requests per path
+    """
+    hits = {}
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            path = self.path.split("?")[0]
+            hits[path] = hits.get(path, 0) + 1
+            throttled = hits[path] == 1
+            body = json.dumps(
+                {"message": "Too many requests"} if throttled
+                else {"workItems": [{"id": 1, "url": "u"}]}).encode()
+            self.send_response(429 if throttled else 200)
+            if throttled:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_query_by_wiql_retries_throttled_requests(throttling_server,
+                                                  monkeypatch):
+    """Test a throttled WIQL query is retried although it is a POST."""
+    base_url, hits = throttling_server
+    client = configure_client(
+        WorkItemTrackingClient(base_url=base_url, creds=None))
+    # Skip the resource location lookup, which needs a real server
+    location = ApiResourceLocation(
+        id="1a9c53f7-f243-4447-b110-35ef023636e4", area="wit",
+        resource_name="wiql", route_template="_apis/wit/wiql",
+        resource_version=2, min_version=1.0, max_version=7.1,
+        released_version=7.1)
+    monkeypatch.setattr(client, "_get_resource_location",
+                        lambda *args: location)
+    
+    result = client.query_by_wiql(Wiql(query="SELECT [System.Id] "
+                                             "FROM WorkItems"))
+    
+    assert [item.id for item in result.work_items] == [1]
+    assert hits == {"/_apis/wit/wiql": 2}
+
+
+def test_configured_client_does_not_retry_other_posts(throttling_server):
+    """Test a throttled POST that writes data is sent only once."""
+    base_url, hits = throttling_server
+    session = requests.Session()
+    session.mount("http://", azure_client._get_http_adapter())
+    
+    response = session.post(f"{base_url}/_apis/wit/workitems/$Bug", json=[])
+    
+    assert response.status_code == 429
+    assert hits == {"/_apis/wit/workitems/$Bug": 1}
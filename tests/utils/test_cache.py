@@ -0,0 +1,218 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.work_item_tracking_process.models import ProcessInfo
+
+from mcp_azure_devops.utils.cache import (
+    JsonFileCache,
+    TTLCache,
+    clear_memory_caches,
+    ttl_cache,
+)
+
+ORG_URL = "https://dev.azure.com/org"
+
+
+def test_get_or_fetch_stores_and_reuses_models():
+    """Test that fetched models are persisted and rebuilt from disk."""
+    cache = JsonFileCache("processes")
+    fetch = MagicMock(return_value=[
+        ProcessInfo(name="Agile", type_id="process-id-123")])
+    
+    first = cache.get_or_fetch(ORG_URL, "processes", fetch, ProcessInfo)
+    second = JsonFileCache("processes").get_or_fetch(
+        ORG_URL, "processes", fetch, ProcessInfo)
+    
+    fetch.assert_called_once()
+    assert first[0].name == "Agile"
+    assert isinstance(second[0], ProcessInfo)
+    assert second[0].name == "Agile"
+    assert second[0].type_id == "process-id-123"
+
+
+def test_get_or_fetch_refetches_expired_entries():
+    """Test that entries older than the TTL are fetched again."""
+    cache = JsonFileCache("processes", ttl=-1)
+    fetch = MagicMock(return_value=ProcessInfo(name="Agile"))
+    
+    cache.get_or_fetch(ORG_URL, "process:1", fetch, ProcessInfo)
+    cache.get_or_fetch(ORG_URL, "process:1", fetch, ProcessInfo)
+    
+    assert fetch.call_count == 2
+
+
+def test_get_or_fetch_refresh_replaces_stored_entries():
+    """Test that a refresh skips stored data and stores the new result."""
+    cache = JsonFileCache("processes")
+    cache.get_or_fetch(ORG_URL, "process:1",
+                       lambda: ProcessInfo(name="Agile"), ProcessInfo)
+    
+    refreshed = cache.get_or_fetch(
+        ORG_URL, "process:1", lambda: ProcessInfo(name="Agile 2"),
+        ProcessInfo, refresh=True)
+    cached = cache.get_or_fetch(ORG_URL, "process:1", MagicMock(),
+                                ProcessInfo)
+    
+    assert refreshed.name == "Agile 2"
+    assert cached.name == "Agile 2"
+
+
+def test_get_or_fetch_separates_organizations():
+    """Test that entries are not shared between organizations."""
+    cache = JsonFileCache("processes")
+    cache.get_or_fetch(ORG_URL, "process:1",
+                       lambda: ProcessInfo(name="Agile"), ProcessInfo)
+    
+    result = cache.get_or_fetch("https://dev.azure.com/other", "process:1",
+                                lambda: ProcessInfo(name="Scrum"),
+                                ProcessInfo)
+    
+    assert result.name == "Scrum"
+    stored = cache.get(ORG_URL, "process:1")
+    assert stored is not None
+    assert stored["name"] == "Agile"
+
+
+def test_get_or_fetch_without_organization_skips_disk(isolated_cache_dir):
+    """Test that nothing is written when the organization is unknown."""
+    cache = JsonFileCache("processes")
+    
+    result = cache.get_or_fetch(None, "processes",
+                                lambda: [ProcessInfo(name="Agile")],
+                                ProcessInfo)
+    
+    assert result[0].name == "Agile"
+    assert not isolated_cache_dir.exists()
+
+
+def test_get_or_fetch_ignores_unserializable_results():
+    """Test that results which cannot be serialized are returned as-is."""
+    cache = JsonFileCache("processes")
+    mock_process = MagicMock()
+    
+    result = cache.get_or_fetch(ORG_URL, "processes",
+                                lambda: [mock_process], ProcessInfo)
+    
+    assert result == [mock_process]
+    assert cache.get(ORG_URL, "processes") is None
+
+
+def test_corrupt_cache_file_is_treated_as_empty():
+    """Test that a corrupt cache file does not break lookups."""
+    cache = JsonFileCache("processes")
+    cache.set(ORG_URL, "processes", [])
+    with open(cache.path, "w", encoding="utf-8") as cache_file:
+        cache_file.write("{not json")
+    
+    assert cache.get(ORG_URL, "processes") is None
+    
+    cache.set(ORG_URL, "processes", [{"name": "Agile"}])
+    with open(cache.path, encoding="utf-8") as cache_file:
+        assert len(json.load(cache_file)) == 1
+
+
+def test_concurrent_sets_keep_every_entry():
+    """Test that writers racing on one file never drop entries."""
+    caches = [JsonFileCache("processes") for _ in range(2)]
+    threads = [
+        threading.Thread(target=caches[i % 2].set,
+                         args=(ORG_URL, f"process:{i}", {"index": i}))
+        for i in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert all(JsonFileCache("processes").get(ORG_URL, f"process:{i}")
+               == {"index": i} for i in range(20))
+
+
+def test_get_parses_file_only_when_it_changes(monkeypatch):
+    """Test that lookups reuse the parsed file until it is rewritten."""
+    cache = JsonFileCache("processes")
+    cache.set(ORG_URL, "processes", [])
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(
+        json, "load", lambda *args: loads.append(1) or real_load(*args))
+    
+    cache.get(ORG_URL, "processes")
+    cache.get(ORG_URL, "process:1")
+    assert not loads
+    
+    # Another instance rewrites the file, so both read it once
+    JsonFileCache("processes").set(ORG_URL, "process:1", {"name": "Agile"})
+    assert cache.get(ORG_URL, "process:1") == {"name": "Agile"}
+    assert len(loads) == 2
+
+
+def test_ttl_cache_expires_and_evicts():
+    """Test in-memory entries expire and the oldest entry is evicted."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    expired = TTLCache(ttl=-1)
+    expired.set("a", 1)
+    assert expired.get("a", "missing") == "missing"
+
+
+def test_clear_memory_caches():
+    """Test every in-memory cache can be cleared at once."""
+    cache = TTLCache()
+    cache.set("a", 1)
+
+    clear_memory_caches()
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_keys_on_arguments_and_scope():
+    """Test results are reused per arguments and scope, including None."""
+    calls = []
+    scope = ["org-1"]
+
+    @ttl_cache(scope=lambda: scope[0])
+    def lookup(name, upper=False):
+        calls.append(name)
+        return None if name == "missing" else name
+
+    assert lookup("a") == "a"
+    assert lookup("a") == "a"
+    assert lookup("a", upper=True) == "a"
+    assert lookup("missing") is None
+    assert lookup("missing") is None
+    scope[0] = "org-2"
+    assert lookup("a") == "a"
+
+    assert calls == ["a", "a", "missing", "a"]
+
+
+def test_ttl_cache_wrapper_keeps_metadata_and_clears():
+    """Test the cached function keeps its name and exposes its cache."""
+    calls = []
+
+    @ttl_cache()
+    def lookup(name):
+        """Look up a name."""
+        calls.append(name)
+        return name
+
+    lookup("a")
+    assert lookup.is_cached("a")
+    assert not lookup.is_cached("b")
+    lookup.cache_clear()
+    assert not lookup.is_cached("a")
+    lookup("a")
+
+    assert lookup.__name__ == "lookup"
+    assert lookup.__doc__ == "Look up a name."
+    assert calls == ["a", "a"]
@@ -0,0 +1,26 @@
+import threading
+
+import pytest
+
+from mcp_azure_devops.utils.concurrency import run_concurrently
+
+
+def test_run_concurrently_overlaps_calls_and_keeps_order():
+    """Test calls run at the same time and results keep call order."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def call(value):
+        # Only passes if both calls are waiting at the same time
+        barrier.wait()
+        return value
+
+    assert run_concurrently(lambda: call(1), lambda: call(2)) == [1, 2]
+
+
+def test_run_concurrently_reraises_errors():
+    """Test an exception from any call is raised to the caller."""
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_concurrently(lambda: 1, fail)